@@ -0,0 +1,3 @@
+"""
+基准测试包，统计页面对象业务流程和BasePage基础操作的耗时，并与基线或阈值比较
+"""
@@ -0,0 +1,235 @@
+"""
+BasePage基础操作微基准，在本地静态页面上比较BasePage方法与直接调用Playwright的耗时，统计框架额外开销
+用法(在src目录下执行):
+    python -m benchmarks.primitives [--primitives click,fill] [--iterations 20] [--rounds 5]
+任一操作的额外开销超过阈值时返回非0
+"""
+
+import argparse
+import os
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from playwright.sync_api import Page, expect
+
+from config.config import (
+    BENCHMARK_DIR,
+    BENCHMARK_PRIMITIVE_ITERATIONS,
+    BENCHMARK_PRIMITIVE_ROUNDS,
+    BENCHMARK_PRIMITIVE_THRESHOLDS,
+)
+from benchmarks.runner import save_json, summarize_durations
+from pages.base.base_page import BasePage
+from utils.browser_factory import BrowserFactory
+from utils.logger import logger
+
+FIXTURE_PAGE = Path(__file__).resolve().parent / "fixtures" / "primitives.html"
+
+
+@dataclass(frozen=True)
+class Primitive:
+    """基础操作定义：BasePage调用及等价的Playwright直接调用"""
+
+    framework: Callable[[BasePage], Any]
+    raw: Callable[[Page], Any]
+
+
+def _framework_enter_frame(base_page: BasePage):
+    """进入并退出iframe"""
+    base_page.enter_frame("#frame")
+    base_page.exit_frame()
+
+
+def _raw_select_option(page: Page):
+    """填入文本后点击匹配的下拉选项"""
+    page.locator("#combo-inputEl").fill("选项三")
+    page.locator("li >> text='选项三'").first.click()
+
+
+# 操作名称 -> 操作定义
+PRIMITIVES: Dict[str, Primitive] = {
+    "click": Primitive(
+        lambda bp: bp.click("#button"),
+        lambda page: page.locator("#button").click(),
+    ),
+    "fill": Primitive(
+        lambda bp: bp.fill("#name-inputEl", "基准测试"),
+        lambda page: page.locator("#name-inputEl").fill("基准测试"),
+    ),
+    "select_option": Primitive(
+        lambda bp: bp.select_option("#combo-inputEl", "选项三"),
+        _raw_select_option,
+    ),
+    "enter_frame": Primitive(
+        _framework_enter_frame,
+        lambda page: page.wait_for_selector("#frame").content_frame(),
+    ),
+    "is_visible": Primitive(
+        lambda bp: bp.is_visible("#label"),
+        lambda page: expect(page.locator("#label")).to_be_visible(),
+    ),
+    "get_input_value": Primitive(
+        lambda bp: bp.get_input_value("#name-inputEl"),
+        lambda page: page.locator("#name-inputEl").input_value(),
+    ),
+    "wait_for_selector": Primitive(
+        lambda bp: bp.wait_for_selector("#label"),
+        lambda page: page.wait_for_selector("#label"),
+    ),
+}
+
+
+def _time_calls(operation: Callable[[], Any], iterations: int) -> List[float]:
+    """
+    连续执行操作并记录每次的耗时
+    :param operation: 操作
+    :param iterations: 执行次数
+    :return: 耗时列表(毫秒)
+    """
+    durations = []
+    for _ in range(iterations):
+        began = time.perf_counter()
+        operation()
+        durations.append((time.perf_counter() - began) * 1000)
+    return durations
+
+
+def evaluate_overhead(framework: dict, raw: dict, threshold_ms: float) -> dict:
+    """
+    计算框架额外开销并与阈值比较
+    :param framework: BasePage调用的统计结果
+    :param raw: Playwright直接调用的统计结果
+    :param threshold_ms: 允许的中位数额外开销(毫秒)
+    :return: 包含framework、raw、overhead_ms、overhead_ratio、threshold_ms和status的字典
+    """
+    overhead = framework["median"] - raw["median"]
+    return {
+        "framework": framework,
+        "raw": raw,
+        "overhead_ms": overhead,
+        "overhead_ratio": framework["median"] / raw["median"] if raw["median"] else None,
+        "threshold_ms": threshold_ms,
+        "status": "regressed" if overhead > threshold_ms else "ok",
+    }
+
+
+def measure_primitive(
+    base_page: BasePage, name: str, primitive: Primitive, iterations: int, rounds: int
+) -> dict:
+    """
+    交替执行BasePage调用和Playwright直接调用，减少浏览器状态漂移对比较结果的影响
+    :param base_page: 基础页面对象
+    :param name: 操作名称
+    :param primitive: 操作定义
+    :param iterations: 每轮每种调用的执行次数
+    :param rounds: 轮数，第一轮作为预热不计入统计
+    :return: 比较结果
+    """
+    framework: List[float] = []
+    raw: List[float] = []
+    for round_index in range(rounds + 1):
+        framework_durations = _time_calls(lambda: primitive.framework(base_page), iterations)
+        raw_durations = _time_calls(lambda: primitive.raw(base_page.page), iterations)
+        if round_index > 0:
+            framework.extend(framework_durations)
+            raw.extend(raw_durations)
+
+    result = evaluate_overhead(
+        summarize_durations(framework),
+        summarize_durations(raw),
+        BENCHMARK_PRIMITIVE_THRESHOLDS.get(name, BENCHMARK_PRIMITIVE_THRESHOLDS["default"]),
+    )
+    logger.info("基础操作 %s 额外开销 %.2fms", name, result["overhead_ms"])
+    return result
+
+
+def run(names: List[str], iterations: int, rounds: int, headless: bool = True) -> dict:
+    """
+    执行基础操作微基准
+    :param names: 操作名称列表
+    :param iterations: 每轮每种调用的执行次数
+    :param rounds: 计入统计的轮数
+    :param headless: 是否无头模式
+    :return: 测试结果
+    """
+    browser, playwright = BrowserFactory.get_browser(headless=headless, slow_mo=0)
+    # 静态页面不需要网络拦截
+    context = BrowserFactory.get_context(browser, network_profile="none")
+    results = {}
+    try:
+        page = BrowserFactory.get_page(context)
+        page.goto(FIXTURE_PAGE.as_uri())
+        base_page = BasePage(page)
+        for name in names:
+            results[name] = measure_primitive(base_page, name, PRIMITIVES[name], iterations, rounds)
+    finally:
+        context.close()
+        browser.close()
+        playwright.stop()
+
+    return {
+        "meta": {
+            "started_at": datetime.now().isoformat(),
+            "iterations": iterations,
+            "rounds": rounds,
+        },
+        "results": results,
+    }
+
+
+def format_report(results: Dict[str, dict]) -> str:
+    """
+    生成文本格式的结果表格
+    :param results: 操作名称 -> 比较结果
+    :return: 表格文本
+    """
+    lines = [f"{'操作':<20}{'BasePage ms':>12}{'Playwright ms':>14}{'开销ms':>10}{'阈值ms':>10}  状态"]
+    for name, result in results.items():
+        lines.append(
+            f"{name:<20}{result['framework']['median']:>12.2f}{result['raw']['median']:>14.2f}"
+            f"{result['overhead_ms']:>10.2f}{result['threshold_ms']:>10.0f}  {result['status']}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """
+    命令行入口
+    :param argv: 命令行参数
+    """
+    parser = argparse.ArgumentParser(description="BasePage基础操作微基准")
+    parser.add_argument("--primitives", help="操作名称，逗号分隔，默认全部")
+    parser.add_argument(
+        "--iterations", type=int, default=BENCHMARK_PRIMITIVE_ITERATIONS, help="每轮每种调用的执行次数"
+    )
+    parser.add_argument("--rounds", type=int, default=BENCHMARK_PRIMITIVE_ROUNDS, help="计入统计的轮数")
+    parser.add_argument("--headed", action="store_true", help="显示浏览器窗口")
+    parser.add_argument("--output", help="结果文件路径，默认 reports/benchmarks/primitives_<时间>.json")
+    args = parser.parse_args(argv)
+
+    names = [n.strip() for n in args.primitives.split(",")] if args.primitives else list(PRIMITIVES)
+    for name in names:
+        if name not in PRIMITIVES:
+            parser.error(f"不支持的操作: {name}，可选: {', '.join(PRIMITIVES)}")
+
+    result = run(names, args.iterations, args.rounds, headless=not args.headed)
+    output = args.output or os.path.join(
+        BENCHMARK_DIR, f"primitives_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    save_json(result, output)
+    print(format_report(result["results"]))
+    logger.info("基础操作基准结果已保存至: %s", output)
+
+    failed = [name for name, r in result["results"].items() if r["status"] != "ok"]
+    if failed:
+        logger.error("以下操作的框架开销超过阈值: %s", ", ".join(failed))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
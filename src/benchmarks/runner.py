@@ -0,0 +1,330 @@
+"""
+业务流程基准测试，在本地替身服务上统计每个页面对象流程和整个测试类的耗时，并与基线比较
+用法(在src目录下执行):
+    FANPU_STANDIN=1 python -m benchmarks.runner [--workflows add_loan,search_loan] [--classes TestLoan]
+    FANPU_STANDIN=1 python -m benchmarks.runner --save-baseline
+存在性能回退或流程失败时返回非0，可直接用于CI任务
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from config.config import (
+    BASE_URL,
+    STANDIN_ENABLED,
+    BENCHMARK_ITERATIONS,
+    BENCHMARK_WARMUP,
+    BENCHMARK_TOLERANCE,
+    BENCHMARK_MIN_DELTA_MS,
+    BENCHMARK_DIR,
+    BENCHMARK_BASELINE_PATH,
+)
+from benchmarks.workflows import TEST_CLASSES, WORKFLOWS, BenchmarkSession, Workflow
+from standin.server import StandinServer
+from utils.browser_factory import BrowserFactory
+from utils.logger import logger
+from utils.timing import summarize
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 结果中保留的统计指标
+REPORTED_STATS = ("count", "min", "median", "p95", "mean", "max")
+
+
+def summarize_durations(durations: List[float], errors: int = 0) -> dict:
+    """
+    汇总单个流程的耗时
+    :param durations: 成功执行的耗时列表(毫秒)
+    :param errors: 失败次数
+    :return: 包含count、min、median、p95、mean、max和errors的字典
+    """
+    stats = summarize(durations)
+    result = {key: stats[key] for key in REPORTED_STATS if key in stats}
+    result["errors"] = errors
+    return result
+
+
+def time_workflow(
+    session: BenchmarkSession, name: str, workflow: Workflow, iterations: int, warmup: int
+) -> dict:
+    """
+    多次执行流程并计时，准备工作和返回落地页不计入耗时
+    :param session: 基准测试会话
+    :param name: 流程名称
+    :param workflow: 流程定义
+    :param iterations: 计时次数
+    :param warmup: 预热次数，预热的结果不计入统计
+    :return: 统计结果
+    """
+    durations: List[float] = []
+    errors = 0
+    for i in range(warmup + iterations):
+        data = workflow.prepare(session)
+        session.reset()
+        began = time.perf_counter()
+        try:
+            workflow.run(session, data)
+        except Exception as e:
+            logger.warning("基准测试流程 %s 第 %s 次执行失败: %s", name, i + 1, e)
+            if i >= warmup:
+                errors += 1
+            continue
+        elapsed = (time.perf_counter() - began) * 1000
+        if i >= warmup:
+            durations.append(elapsed)
+    result = summarize_durations(durations, errors)
+    logger.info("基准测试流程 %s 完成，中位数 %.0fms", name, result.get("median", 0))
+    return result
+
+
+def time_test_class(name: str, node_id: str, base_url: str, iterations: int, headless: bool) -> dict:
+    """
+    在子进程中多次运行整个测试类并计时，耗时包含pytest启动和浏览器启动
+    :param name: 测试类名称
+    :param node_id: pytest节点ID
+    :param base_url: 被测站点地址
+    :param iterations: 运行次数
+    :param headless: 是否无头模式
+    :return: 统计结果
+    """
+    command = [sys.executable, "-m", "pytest", node_id, "-q", "-p", "no:cacheprovider", "-o", "addopts="]
+    if headless:
+        command.append("--headless-mode")
+    # 测试类在子进程中连接同一个替身服务，不复用其他环境的登录状态
+    env = dict(os.environ, FANPU_BASE_URL=base_url, AUTH_CACHE_ENABLED="0")
+
+    durations: List[float] = []
+    errors = 0
+    for i in range(iterations):
+        began = time.perf_counter()
+        completed = subprocess.run(
+            command, cwd=PROJECT_ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+        )
+        elapsed = (time.perf_counter() - began) * 1000
+        if completed.returncode != 0:
+            errors += 1
+            logger.warning(
+                "测试类 %s 第 %s 次运行失败:\n%s",
+                name,
+                i + 1,
+                completed.stdout.decode("utf-8", "replace")[-2000:],
+            )
+            continue
+        durations.append(elapsed)
+    result = summarize_durations(durations, errors)
+    logger.info("测试类 %s 完成，中位数 %.0fms", name, result.get("median", 0))
+    return result
+
+
+def compare(
+    current: Dict[str, dict],
+    baseline: Dict[str, dict],
+    tolerance: float = BENCHMARK_TOLERANCE,
+    min_delta_ms: float = BENCHMARK_MIN_DELTA_MS,
+) -> Dict[str, dict]:
+    """
+    将本次结果与基线比较，中位数超过基线(1+tolerance)倍且差值超过噪声阈值时判定为回退
+    :param current: 本次结果：名称 -> 统计结果
+    :param baseline: 基线结果：名称 -> 统计结果
+    :param tolerance: 允许的增长比例
+    :param min_delta_ms: 噪声阈值(毫秒)
+    :return: 名称 -> {status, baseline, current, ratio}，status为ok、regressed、failed或new
+    """
+    comparison = {}
+    for name, stats in current.items():
+        median = stats.get("median")
+        base = baseline.get(name, {}).get("median")
+        entry = {"baseline": base, "current": median, "ratio": None}
+        if stats.get("errors") or median is None:
+            entry["status"] = "failed"
+        elif not base:
+            entry["status"] = "new"
+        else:
+            entry["ratio"] = median / base
+            regressed = median > base * (1 + tolerance) and median - base > min_delta_ms
+            entry["status"] = "regressed" if regressed else "ok"
+        comparison[name] = entry
+    return comparison
+
+
+def load_baseline(path: str = BENCHMARK_BASELINE_PATH) -> Dict[str, dict]:
+    """
+    读取基线结果
+    :param path: 基线文件路径
+    :return: 名称 -> 统计结果，文件不存在时返回空字典
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)["results"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def save_json(data: dict, path: str):
+    """
+    保存JSON文件
+    :param data: 数据
+    :param path: 文件路径
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def run(
+    workflows: List[str],
+    classes: List[str],
+    iterations: int = BENCHMARK_ITERATIONS,
+    warmup: int = BENCHMARK_WARMUP,
+    class_iterations: int = 3,
+    headless: bool = True,
+) -> dict:
+    """
+    执行基准测试
+    :param workflows: 流程名称列表
+    :param classes: 测试类名称列表
+    :param iterations: 每个流程的计时次数
+    :param warmup: 每个流程的预热次数
+    :param class_iterations: 每个测试类的运行次数
+    :param headless: 是否无头模式
+    :return: 测试结果
+    """
+    server: Optional[StandinServer] = None
+    if STANDIN_ENABLED:
+        server = StandinServer()
+        server.start()
+    else:
+        logger.warning("未启用替身服务(FANPU_STANDIN=1)，基准测试将访问 %s，结果受网络影响较大", BASE_URL)
+
+    results: Dict[str, dict] = {}
+    try:
+        if workflows:
+            # 不使用操作延迟，只统计框架和页面本身的耗时
+            browser, playwright = BrowserFactory.get_browser(headless=headless, slow_mo=0)
+            context = BrowserFactory.get_context(browser)
+            session = BenchmarkSession(BrowserFactory.get_page(context))
+            try:
+                session.login()
+                for name in workflows:
+                    results[name] = time_workflow(session, name, WORKFLOWS[name], iterations, warmup)
+            finally:
+                session.close()
+                context.close()
+                browser.close()
+                playwright.stop()
+
+        for name in classes:
+            results[name] = time_test_class(name, TEST_CLASSES[name], BASE_URL, class_iterations, headless)
+    finally:
+        if server:
+            server.stop()
+
+    return {
+        "meta": {
+            "started_at": datetime.now().isoformat(),
+            "base_url": BASE_URL,
+            "standin": STANDIN_ENABLED,
+            "iterations": iterations,
+            "warmup": warmup,
+            "class_iterations": class_iterations,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def format_report(results: Dict[str, dict], comparison: Dict[str, dict]) -> str:
+    """
+    生成文本格式的结果表格
+    :param results: 名称 -> 统计结果
+    :param comparison: 与基线的比较结果
+    :return: 表格文本
+    """
+    lines = [f"{'流程':<18}{'最小ms':>10}{'中位数ms':>10}{'p95 ms':>10}{'错误':>6}{'基线ms':>10}{'变化':>8}  状态"]
+    for name, stats in results.items():
+        entry = comparison.get(name, {})
+        baseline = "-" if entry.get("baseline") is None else f"{entry['baseline']:.0f}"
+        change = "-" if entry.get("ratio") is None else f"{entry['ratio'] - 1:+.0%}"
+        lines.append(
+            f"{name:<18}{stats.get('min', 0):>10.0f}{stats.get('median', 0):>10.0f}"
+            f"{stats.get('p95', 0):>10.0f}{stats['errors']:>6}{baseline:>10}{change:>8}"
+            f"  {entry.get('status', '')}"
+        )
+    return "\n".join(lines)
+
+
+def _parse_names(text: Optional[str], available: Dict[str, object], kind: str) -> List[str]:
+    """
+    解析逗号分隔的名称列表
+    :param text: 命令行参数，为None时返回全部
+    :param available: 可选的名称
+    :param kind: 名称类型，用于错误提示
+    :return: 名称列表
+    """
+    if text is None:
+        return list(available)
+    names = [name.strip() for name in text.split(",") if name.strip()]
+    for name in names:
+        if name not in available:
+            raise ValueError(f"不支持的{kind}: {name}，可选: {', '.join(available)}")
+    return names
+
+
+def main(argv=None):
+    """
+    命令行入口
+    :param argv: 命令行参数
+    """
+    parser = argparse.ArgumentParser(description="页面对象业务流程基准测试")
+    parser.add_argument("--workflows", help="流程名称，逗号分隔，默认全部，传空字符串跳过")
+    parser.add_argument("--classes", help="测试类名称，逗号分隔，默认全部，传空字符串跳过")
+    parser.add_argument("--iterations", type=int, default=BENCHMARK_ITERATIONS, help="每个流程的计时次数")
+    parser.add_argument("--warmup", type=int, default=BENCHMARK_WARMUP, help="每个流程的预热次数")
+    parser.add_argument("--class-iterations", type=int, default=3, help="每个测试类的运行次数")
+    parser.add_argument("--tolerance", type=float, default=BENCHMARK_TOLERANCE, help="允许的中位数增长比例")
+    parser.add_argument("--baseline", default=BENCHMARK_BASELINE_PATH, help="基线文件路径")
+    parser.add_argument("--save-baseline", action="store_true", help="将本次结果保存为基线")
+    parser.add_argument("--headed", action="store_true", help="显示浏览器窗口")
+    parser.add_argument("--output", help="结果文件路径，默认 reports/benchmarks/<时间>.json")
+    args = parser.parse_args(argv)
+
+    result = run(
+        _parse_names(args.workflows, WORKFLOWS, "流程"),
+        _parse_names(args.classes, TEST_CLASSES, "测试类"),
+        iterations=args.iterations,
+        warmup=args.warmup,
+        class_iterations=args.class_iterations,
+        headless=not args.headed,
+    )
+    comparison = compare(result["results"], load_baseline(args.baseline), args.tolerance)
+    result["comparison"] = comparison
+
+    output = args.output or os.path.join(
+        BENCHMARK_DIR, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    save_json(result, output)
+    print(format_report(result["results"], comparison))
+    logger.info("基准测试结果已保存至: %s", output)
+
+    if args.save_baseline:
+        save_json({"meta": result["meta"], "results": result["results"]}, args.baseline)
+        logger.info("基线已更新: %s", args.baseline)
+        return 0
+
+    failed = [name for name, entry in comparison.items() if entry["status"] in ("regressed", "failed")]
+    if failed:
+        logger.error("基准测试未通过: %s", ", ".join(failed))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
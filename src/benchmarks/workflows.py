@@ -0,0 +1,209 @@
+"""
+基准测试业务流程，每个流程复用同步页面对象完成一次完整的业务操作
+前置数据在计时之外优先通过后台造数创建，计时只覆盖页面对象的操作
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from playwright.sync_api import Page
+
+from config.config import BASE_URL
+from models.customer import Customer
+from models.loan import Loan
+from pages.customer_page import CustomerPage
+from pages.loan_page import LoanPage
+from pages.login_page import LoginPage
+from utils.data_seeder import DataSeeder
+from utils.test_data import test_data_generator
+
+
+class BenchmarkSession:
+    """基准测试会话，持有一个已登录的页面及其页面对象"""
+
+    def __init__(self, page: Page, base_url: str = BASE_URL):
+        """
+        初始化基准测试会话
+        :param page: playwright页面对象
+        :param base_url: 被测站点地址
+        """
+        self.page = page
+        self.login_page = LoginPage(page)
+        self.customer_page = CustomerPage(page)
+        self.loan_page = LoanPage(page)
+        self.seeder = DataSeeder(base_url=base_url)
+        self.landing_url: Optional[str] = None
+
+    def login(self):
+        """登录并让造数工具复用页面的Cookie，不读写登录状态缓存，避免与其他环境的缓存混用"""
+        self.login_page.login()
+        self.landing_url = self.page.url
+        self.seeder.load_cookies(self.page.context.cookies(), self.landing_url)
+
+    def reset(self):
+        """返回落地页，清除上一个流程留下的iframe状态"""
+        for page_object in (self.login_page, self.customer_page, self.loan_page):
+            page_object.exit_frame()
+        self.login_page.navigate(self.landing_url)
+
+    def open_customer_list(self):
+        """打开客户信息列表"""
+        self.customer_page.open_customer_list()
+
+    def open_loan_list(self):
+        """打开借款申请列表"""
+        self.loan_page.open_loan_list()
+
+    def seed_customer(self) -> Customer:
+        """
+        通过后台造数创建客户，确认未创建时改走界面流程(界面选择后缓存选择窗口回填值，之后可以后台创建)
+        :return: 客户数据对象
+        """
+        customer = test_data_generator.generate_customer_data()
+        created = self.seeder.seed_customer(customer)
+        if created is None:
+            raise RuntimeError(f"无法确认前置客户是否已创建: {customer.name}")
+        if not created:
+            self.open_customer_list()
+            self.customer_page.add_customer(customer)
+        return customer
+
+    def seed_loan(self) -> Loan:
+        """
+        通过后台造数创建借款申请，确认未创建时改走界面流程
+        :return: 借款数据对象
+        """
+        loan = test_data_generator.generate_loan_data()
+        created = self.seeder.seed_loan(loan)
+        if created is None:
+            raise RuntimeError(f"无法确认前置借款申请是否已创建: {loan.project_name}")
+        if not created:
+            self.open_loan_list()
+            self.loan_page.add_loan(loan)
+        return loan
+
+    def close(self):
+        """关闭造数工具的连接"""
+        self.seeder.close()
+
+
+@dataclass(frozen=True)
+class Workflow:
+    """基准测试流程定义"""
+
+    run: Callable[[BenchmarkSession, Any], None]  # 计时的页面对象操作
+    prepare: Callable[[BenchmarkSession], Any]  # 不计时的准备工作，返回值传给run
+
+
+def _updated_customer() -> Customer:
+    """
+    生成修改后的客户字段
+    :return: 只包含修改字段的客户数据对象
+    """
+    generated = test_data_generator.generate_customer_data()
+    return Customer(phone=generated.phone, qq=generated.qq, source=generated.source)
+
+
+def _updated_loan() -> Loan:
+    """
+    生成修改后的借款字段
+    :return: 只包含修改字段的借款数据对象
+    """
+    generated = test_data_generator.generate_loan_data()
+    return Loan(
+        loan_amount=generated.loan_amount,
+        loan_purpose=generated.loan_purpose,
+        payment_method=generated.payment_method,
+        repayment_method=generated.repayment_method,
+    )
+
+
+def add_customer(session: BenchmarkSession, customer: Customer):
+    """新增客户"""
+    session.open_customer_list()
+    session.customer_page.add_customer(customer)
+
+
+def search_customer(session: BenchmarkSession, customer: Customer):
+    """搜索客户"""
+    session.open_customer_list()
+    session.customer_page.search_customer(customer)
+
+
+def view_customer(session: BenchmarkSession, customer: Customer):
+    """查看客户详情"""
+    session.open_customer_list()
+    session.customer_page.view_customer(customer)
+
+
+def edit_customer(session: BenchmarkSession, customer: Customer):
+    """修改客户"""
+    session.open_customer_list()
+    session.customer_page.edit_customer(customer, _updated_customer())
+
+
+def delete_customer(session: BenchmarkSession, customer: Customer):
+    """删除客户"""
+    session.open_customer_list()
+    session.customer_page.delete_customer(customer)
+
+
+def add_loan(session: BenchmarkSession, loan: Loan):
+    """新增借款申请"""
+    session.open_loan_list()
+    session.loan_page.add_loan(loan)
+
+
+def search_loan(session: BenchmarkSession, loan: Loan):
+    """搜索借款申请"""
+    session.open_loan_list()
+    session.loan_page.search_loan(loan)
+
+
+def view_loan(session: BenchmarkSession, loan: Loan):
+    """查看借款申请详情"""
+    session.open_loan_list()
+    session.loan_page.view_loan(loan)
+
+
+def edit_loan(session: BenchmarkSession, loan: Loan):
+    """修改借款申请"""
+    session.open_loan_list()
+    session.loan_page.edit_loan(loan, _updated_loan())
+
+
+def delete_loan(session: BenchmarkSession, loan: Loan):
+    """删除借款申请"""
+    session.open_loan_list()
+    session.loan_page.delete_loan(loan)
+
+
+def _new_customer(session: BenchmarkSession) -> Customer:
+    """生成新增用的客户数据"""
+    return test_data_generator.generate_customer_data()
+
+
+def _new_loan(session: BenchmarkSession) -> Loan:
+    """生成新增用的借款数据"""
+    return test_data_generator.generate_loan_data()
+
+
+# 流程名称 -> 流程定义
+WORKFLOWS: Dict[str, Workflow] = {
+    "add_customer": Workflow(add_customer, _new_customer),
+    "search_customer": Workflow(search_customer, BenchmarkSession.seed_customer),
+    "view_customer": Workflow(view_customer, BenchmarkSession.seed_customer),
+    "edit_customer": Workflow(edit_customer, BenchmarkSession.seed_customer),
+    "delete_customer": Workflow(delete_customer, BenchmarkSession.seed_customer),
+    "add_loan": Workflow(add_loan, _new_loan),
+    "search_loan": Workflow(search_loan, BenchmarkSession.seed_loan),
+    "view_loan": Workflow(view_loan, BenchmarkSession.seed_loan),
+    "edit_loan": Workflow(edit_loan, BenchmarkSession.seed_loan),
+    "delete_loan": Workflow(delete_loan, BenchmarkSession.seed_loan),
+}
+
+# 整个测试类的基准：名称 -> pytest节点ID(相对于项目根目录)
+TEST_CLASSES: Dict[str, str] = {
+    "TestCustomer": "src/tests/test_customer.py::TestCustomer",
+    "TestLoan": "src/tests/test_loan.py::TestLoan",
+}
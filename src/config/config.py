@@ -2,25 +2,111 @@
 配置文件，包含项目所需的全局配置参数
 """
 import os
+import tempfile
 
-# 目标网站URL
-BASE_URL = "https://demo.fanpusoft.com"  # 替换为实际测试网站URL
+# 本地替身服务设置，启用后测试指向本机的FineUI替身服务，不依赖远程演示环境
+STANDIN_ENABLED = os.getenv("FANPU_STANDIN", "0") == "1"
+STANDIN_HOST = "127.0.0.1"
+# 每个xdist进程使用独立端口(基础端口+进程序号)，各自维护内存数据
+STANDIN_PORT = int(os.getenv("FANPU_STANDIN_PORT", "8765")) + int(
+    os.getenv("PYTEST_XDIST_WORKER", "gw0").lstrip("gw") or 0
+)
+STANDIN_LATENCY_MS = int(os.getenv("FANPU_STANDIN_LATENCY_MS", "0"))  # 每个动态请求注入的延迟(毫秒)
+STANDIN_JITTER_MS = int(os.getenv("FANPU_STANDIN_JITTER_MS", "0"))  # 延迟的随机抖动范围(毫秒)
+
+# 目标网站URL，可通过环境变量FANPU_BASE_URL覆盖
+BASE_URL = os.getenv("FANPU_BASE_URL") or (
+    f"http://{STANDIN_HOST}:{STANDIN_PORT}"
+    if STANDIN_ENABLED
+    else "https://demo.fanpusoft.com"  # 替换为实际测试网站URL
+)
 
 # 浏览器配置
 BROWSER_TYPE = "chromium"  # 可选: chromium, firefox, webkit
 HEADLESS = False  # 设置为True可以无头模式运行
 SLOW_MO = 50  # 浏览器操作之间的延迟(毫秒)
 
+# 浏览器服务设置，启用后同一台机器上的xdist进程和多次运行共用一个浏览器服务
+BROWSER_SERVER_ENABLED = os.getenv("BROWSER_SERVER", "0") == "1"
+BROWSER_SERVER_DIR = os.path.join(tempfile.gettempdir(), "fanpu_browser_server")  # 服务状态和日志目录
+BROWSER_SERVER_START_TIMEOUT = 30  # 等待浏览器服务启动的最长时间(秒)
+
+# 网络路由设置
+NETWORK_PROFILE = os.getenv("NETWORK_PROFILE", "default")  # 可选: none, default, strict
+NETWORK_ALLOWED_HOSTS = []  # 不拦截的第三方域名
+NETWORK_SIZES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "reports", "network_sizes.json")  # 不拦截运行中实测的各类资源大小
+
+# HAR静态资源缓存设置
+HAR_MODE = os.getenv("HAR_MODE", "off")  # 可选: off, record, replay
+HAR_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "reports", "har", "static_assets.zip")
+HAR_MAX_AGE_HOURS = 24  # HAR缓存的最长有效时间(小时)，超过后重新录制
+
+# 浏览器上下文池设置
+CONTEXT_POOL_SIZE = int(os.getenv("CONTEXT_POOL_SIZE", "2"))  # 每个进程预热的上下文数量，0表示不使用上下文池
+CONTEXT_POOL_MAX_USES = 20  # 单个上下文最多复用的次数，超过后关闭并重新创建
+CONTEXT_POOL_RESET_URL = "about:blank"  # 上下文归还时返回的页面
+
 # 超时设置(毫秒)
 DEFAULT_TIMEOUT = 30000
 NAVIGATION_TIMEOUT = 60000
 
 # 截图设置
 SCREENSHOT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "reports", "screenshots")
+SCREENSHOT_FORMAT = "png"  # 截图保存格式，可选: png, jpeg, webp
+SCREENSHOT_QUALITY = 80  # jpeg/webp格式的图片质量(1-100)
+SCREENSHOT_SCALE = 1.0  # 截图缩放比例，小于1时按比例缩小后保存
+SCREENSHOT_FULL_PAGE = False  # 是否截取整个页面
+SCREENSHOT_TIMEOUT = 5000  # 截图超时时间(毫秒)，避免异常处理中的截图拖慢失败用例
+SCREENSHOT_WORKERS = 2  # 截图编码和写盘的后台线程数
+
+# 日志设置
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")  # 日志级别
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")  # 日志文件格式，可选: text, jsonl
+LOG_MAX_BYTES = 10 * 1024 * 1024  # 单个日志文件最大字节数，超过后轮转
+LOG_BACKUP_COUNT = 5  # 保留的轮转日志文件数量
+LOG_COMPRESS = True  # 轮转后的日志文件是否使用gzip压缩
 
 # 登录凭据
 LOGIN_USERNAME = "zx"  # 替换为实际用户名
 LOGIN_PASSWORD = "123"  # 替换为实际密码
 
+# 登录状态缓存设置
+AUTH_CACHE_ENABLED = os.getenv("AUTH_CACHE_ENABLED", "1") != "0"  # 是否复用已保存的登录状态
+AUTH_CACHE_SCOPE = "worker"  # 可选: worker(每个xdist进程各自登录一次), account(同一账号的所有进程共享)
+AUTH_STATE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "reports", "auth")
+AUTH_STATE_TTL = 20 * 60  # 登录状态的最长复用时间(秒)，与服务端会话超时保持一致
+
+# 选择窗口缓存设置
+PICKER_CACHE_ENABLED = os.getenv("PICKER_CACHE_ENABLED", "1") != "0"  # 是否缓存选择窗口的回填值，命中时不再打开选择窗口
+PICKER_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "reports", "picker_cache.json")
+PICKER_CACHE_TTL = 24 * 60 * 60  # 回填值的最长复用时间(秒)
+PICKER_CACHE_MAX_ENTRIES = 500  # 最多缓存的条目数，超过后淘汰最久未使用的条目
+
+# 后台造数设置
+SEED_POOL_SIZE = 10  # HTTP连接池大小
+SEED_TIMEOUT = 30  # 单次请求超时时间(秒)
+SEED_RETRIES = 2  # GET请求失败时的重试次数
+SEED_JOURNAL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "reports", "seed")  # 批量造数进度日志目录
+
+# 负载测试设置
+LOAD_REPORT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "reports", "load")  # 负载测试结果目录
+
+# 基准测试设置
+BENCHMARK_ITERATIONS = 10  # 每个流程计时的次数
+BENCHMARK_WARMUP = 2  # 每个流程正式计时前的预热次数
+BENCHMARK_TOLERANCE = 0.2  # 中位数超过基线的比例上限，超过视为性能回退
+BENCHMARK_MIN_DELTA_MS = 50  # 中位数与基线的差值低于该值(毫秒)时视为噪声，不判定回退
+BENCHMARK_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "reports", "benchmarks")
+BENCHMARK_BASELINE_PATH = os.getenv("BENCHMARK_BASELINE") or os.path.join(BENCHMARK_DIR, "baseline.json")
+BENCHMARK_PRIMITIVE_ITERATIONS = 20  # 基础操作微基准每轮每种调用的执行次数
+BENCHMARK_PRIMITIVE_ROUNDS = 5  # 基础操作微基准计入统计的轮数
+# 基础操作相对Playwright直接调用允许的中位数额外开销(毫秒)，click/fill/select_option包含页面稳定检测的静默期
+BENCHMARK_PRIMITIVE_THRESHOLDS = {
+    "default": 10,
+    "click": 150,
+    "fill": 150,
+    "select_option": 200,
+}
+
 # 测试数据路径
 TEST_DATA_PATH = "./utils/test_data.json"
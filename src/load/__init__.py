@@ -0,0 +1,3 @@
+"""
+负载测试包，基于异步页面对象以虚拟用户方式并发执行业务流程
+"""
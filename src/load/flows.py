@@ -0,0 +1,179 @@
+"""
+负载测试业务流程，每个流程复用异步页面对象完成一次完整的业务操作
+"""
+
+import random
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from playwright.async_api import Page
+
+from models.customer import Customer
+from models.loan import Loan
+from pages.async_customer_page import AsyncCustomerPage
+from pages.async_loan_page import AsyncLoanPage
+from pages.async_login_page import AsyncLoginPage
+from utils.test_data import test_data_generator
+
+
+class VirtualUser:
+    """虚拟用户，持有一个页面及其页面对象，并记录自己创建且尚未删除的数据"""
+
+    def __init__(self, user_id: int, page: Page):
+        """
+        初始化虚拟用户
+        :param user_id: 用户序号
+        :param page: playwright异步页面对象
+        """
+        self.user_id = user_id
+        self.page = page
+        self.login_page = AsyncLoginPage(page)
+        self.customer_page = AsyncCustomerPage(page)
+        self.loan_page = AsyncLoanPage(page)
+        self.landing_url: Optional[str] = None
+        self.customers: List[Customer] = []
+        self.loans: List[Loan] = []
+
+    async def login(self):
+        """登录并记录落地页地址，每次执行流程前返回该页面"""
+        await self.login_page.ensure_logged_in()
+        self.landing_url = self.page.url
+
+    async def reset(self):
+        """返回落地页，清除上一个流程留下的iframe状态"""
+        for page_object in (self.login_page, self.customer_page, self.loan_page):
+            page_object.exit_frame()
+        await self.login_page.navigate(self.landing_url)
+
+
+async def _open_customer_list(user: VirtualUser):
+    """打开客户信息列表"""
+    await user.customer_page.open_customer_list()
+
+
+async def _open_loan_list(user: VirtualUser):
+    """打开借款申请列表"""
+    await user.loan_page.open_loan_list()
+
+
+async def add_customer(user: VirtualUser):
+    """新增客户"""
+    customer = test_data_generator.generate_customer_data()
+    await _open_customer_list(user)
+    await user.customer_page.add_customer(customer)
+    user.customers.append(customer)
+
+
+async def search_customer(user: VirtualUser):
+    """搜索客户"""
+    await _open_customer_list(user)
+    await user.customer_page.search_customer(random.choice(user.customers))
+
+
+async def edit_customer(user: VirtualUser):
+    """修改客户"""
+    customer = random.choice(user.customers)
+    generated = test_data_generator.generate_customer_data()
+    updated = Customer(phone=generated.phone, qq=generated.qq, source=generated.source)
+    await _open_customer_list(user)
+    await user.customer_page.edit_customer(customer, updated)
+    for field, value in updated.to_dict().items():
+        setattr(customer, field, value)
+
+
+async def delete_customer(user: VirtualUser):
+    """删除客户"""
+    customer = user.customers.pop(random.randrange(len(user.customers)))
+    await _open_customer_list(user)
+    await user.customer_page.delete_customer(customer)
+
+
+async def add_loan(user: VirtualUser):
+    """新增借款申请"""
+    loan = test_data_generator.generate_loan_data()
+    await _open_loan_list(user)
+    await user.loan_page.add_loan(loan)
+    user.loans.append(loan)
+
+
+async def search_loan(user: VirtualUser):
+    """搜索借款申请"""
+    await _open_loan_list(user)
+    await user.loan_page.search_loan(random.choice(user.loans))
+
+
+async def edit_loan(user: VirtualUser):
+    """修改借款申请"""
+    loan = random.choice(user.loans)
+    generated = test_data_generator.generate_loan_data()
+    updated = Loan(
+        loan_amount=generated.loan_amount,
+        loan_purpose=generated.loan_purpose,
+        payment_method=generated.payment_method,
+        repayment_method=generated.repayment_method,
+    )
+    await _open_loan_list(user)
+    await user.loan_page.edit_loan(loan, updated)
+    for field, value in updated.to_dict().items():
+        setattr(loan, field, value)
+
+
+async def delete_loan(user: VirtualUser):
+    """删除借款申请"""
+    loan = user.loans.pop(random.randrange(len(user.loans)))
+    await _open_loan_list(user)
+    await user.loan_page.delete_loan(loan)
+
+
+Flow = Callable[[VirtualUser], Awaitable[None]]
+
+# 流程名称 -> (流程函数, 依赖的数据类型)，依赖的数据不存在时先执行对应的新增流程
+FLOWS: Dict[str, Tuple[Flow, Optional[str]]] = {
+    "add_customer": (add_customer, None),
+    "search_customer": (search_customer, "customers"),
+    "edit_customer": (edit_customer, "customers"),
+    "delete_customer": (delete_customer, "customers"),
+    "add_loan": (add_loan, None),
+    "search_loan": (search_loan, "loans"),
+    "edit_loan": (edit_loan, "loans"),
+    "delete_loan": (delete_loan, "loans"),
+}
+
+# 依赖的数据类型对应的新增流程
+CREATE_FLOWS = {"customers": "add_customer", "loans": "add_loan"}
+
+# 默认的流程权重，查询多于写入
+DEFAULT_MIX = {
+    "search_loan": 4,
+    "add_loan": 3,
+    "edit_loan": 2,
+    "delete_loan": 1,
+}
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """
+    解析流程权重
+    :param text: 形如 add_loan=3,search_loan=4 的字符串
+    :return: 流程名称与权重的字典
+    """
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.strip().partition("=")
+        if name not in FLOWS:
+            raise ValueError(f"不支持的流程: {name}，可选: {', '.join(FLOWS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def choose_flow(user: VirtualUser, mix: Dict[str, float]) -> str:
+    """
+    按权重选择下一个流程，依赖的数据不存在时改为执行对应的新增流程
+    :param user: 虚拟用户
+    :param mix: 流程权重
+    :return: 流程名称
+    """
+    name = random.choices(list(mix), weights=list(mix.values()))[0]
+    requires = FLOWS[name][1]
+    if requires and not getattr(user, requires):
+        return CREATE_FLOWS[requires]
+    return name
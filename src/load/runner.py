@@ -0,0 +1,263 @@
+"""
+负载测试执行器，在多个进程中以虚拟用户方式按权重执行业务流程
+用法(在src目录下执行):
+    python -m load.runner --processes 4 --users 10 --ramp-up 60 --duration 300 \
+        --mix search_loan=4,add_loan=3,edit_loan=2,delete_loan=1
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from config.config import LOAD_REPORT_DIR, LOGIN_USERNAME
+from load.flows import DEFAULT_MIX, FLOWS, VirtualUser, choose_flow, parse_mix
+from utils.async_browser_factory import AsyncBrowserFactory
+from utils.auth_cache import auth_cache
+from utils.logger import logger
+from utils.timing import summarize
+
+# 单次流程执行记录：(流程名称, 开始时间, 耗时(秒), 是否成功)
+Sample = Tuple[str, float, float, bool]
+
+
+@dataclass
+class LoadConfig:
+    """负载测试配置"""
+
+    processes: int = 1  # 进程数
+    users: int = 5  # 每个进程的虚拟用户数
+    ramp_up: float = 30.0  # 爬坡时间(秒)，虚拟用户在此期间均匀启动
+    duration: float = 120.0  # 稳定阶段时长(秒)
+    think_time: float = 1.0  # 两次流程之间的平均思考时间(秒)
+    mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    headless: bool = True
+    use_server: bool = False  # 是否连接共享的浏览器服务
+
+    @property
+    def total_users(self) -> int:
+        """虚拟用户总数"""
+        return self.processes * self.users
+
+
+async def _run_user(
+    browser, config: LoadConfig, user_index: int, start_at: float, samples: List[Sample]
+):
+    """
+    执行单个虚拟用户：到达启动时间后登录，然后循环执行流程直到稳定阶段结束
+    :param browser: 异步浏览器实例
+    :param config: 负载测试配置
+    :param user_index: 虚拟用户在所有进程中的序号
+    :param start_at: 负载测试开始时间
+    :param samples: 执行记录列表
+    """
+    # 爬坡阶段内按序号均匀启动
+    user_start = start_at + config.ramp_up * user_index / max(config.total_users, 1)
+    end_at = start_at + config.ramp_up + config.duration
+    await asyncio.sleep(max(0.0, user_start - time.time()))
+
+    context = await AsyncBrowserFactory.get_context(
+        browser, storage_state=auth_cache.storage_state(LOGIN_USERNAME)
+    )
+    try:
+        page = await AsyncBrowserFactory.get_page(context)
+        user = VirtualUser(user_index, page)
+        await user.login()
+
+        while time.time() < end_at:
+            name = choose_flow(user, config.mix)
+            began = time.time()
+            try:
+                await FLOWS[name][0](user)
+                success = True
+            except Exception as e:
+                logger.warning("虚拟用户 %s 执行流程 %s 失败: %s", user_index, name, e)
+                success = False
+            samples.append((name, began, time.time() - began, success))
+
+            await asyncio.sleep(random.uniform(0.5, 1.5) * config.think_time)
+            await user.reset()
+    except Exception as e:
+        logger.error("虚拟用户 %s 异常退出: %s", user_index, e)
+    finally:
+        await context.close()
+
+
+async def _run_process(
+    config: LoadConfig, process_index: int, start_at: float
+) -> List[Sample]:
+    """
+    在当前进程中启动浏览器并并发执行该进程的所有虚拟用户
+    :param config: 负载测试配置
+    :param process_index: 进程序号
+    :param start_at: 负载测试开始时间
+    :return: 执行记录列表
+    """
+    browser, playwright = await AsyncBrowserFactory.get_browser(
+        headless=config.headless, use_server=config.use_server
+    )
+    samples: List[Sample] = []
+    try:
+        await asyncio.gather(
+            *(
+                _run_user(browser, config, process_index * config.users + i, start_at, samples)
+                for i in range(config.users)
+            )
+        )
+    finally:
+        await browser.close()
+        await playwright.stop()
+    return samples
+
+
+def _process_entry(config: LoadConfig, process_index: int, start_at: float) -> List[Sample]:
+    """
+    子进程入口
+    :param config: 负载测试配置
+    :param process_index: 进程序号
+    :param start_at: 负载测试开始时间
+    :return: 执行记录列表
+    """
+    return asyncio.run(_run_process(config, process_index, start_at))
+
+
+def aggregate(samples: List[Sample], config: LoadConfig, start_at: float) -> Dict[str, dict]:
+    """
+    按阶段和流程汇总执行记录
+    :param samples: 执行记录列表
+    :param config: 负载测试配置
+    :param start_at: 负载测试开始时间
+    :return: 阶段 -> 流程 -> 统计结果，耗时单位为毫秒，吞吐量单位为次/秒
+    """
+    steady_at = start_at + config.ramp_up
+    phases = {
+        "ramp_up": (start_at, steady_at),
+        "steady": (steady_at, steady_at + config.duration),
+    }
+    report = {}
+    for phase, (begin, end) in phases.items():
+        window = max(end - begin, 1e-9)
+        flows: Dict[str, dict] = {}
+        for name in sorted({s[0] for s in samples}):
+            in_phase = [s for s in samples if s[0] == name and begin <= s[1] < end]
+            if not in_phase:
+                continue
+            latencies = [s[2] * 1000 for s in in_phase if s[3]]
+            errors = sum(1 for s in in_phase if not s[3])
+            flows[name] = {
+                "throughput": len(latencies) / window,
+                "errors": errors,
+                "error_rate": errors / len(in_phase),
+                "latency_ms": summarize(latencies),
+            }
+        report[phase] = flows
+    return report
+
+
+def run(config: LoadConfig) -> dict:
+    """
+    执行负载测试
+    :param config: 负载测试配置
+    :return: 测试结果
+    """
+    # 留出浏览器启动时间，保证所有进程在同一时刻开始爬坡
+    start_at = time.time() + 10
+    logger.info(
+        "开始负载测试: %s 个进程 x %s 个虚拟用户，爬坡 %ss，稳定 %ss",
+        config.processes,
+        config.users,
+        config.ramp_up,
+        config.duration,
+    )
+
+    samples: List[Sample] = []
+    if config.processes == 1:
+        samples = _process_entry(config, 0, start_at)
+    else:
+        with ProcessPoolExecutor(max_workers=config.processes) as executor:
+            futures = [
+                executor.submit(_process_entry, config, i, start_at)
+                for i in range(config.processes)
+            ]
+            for future in futures:
+                samples.extend(future.result())
+
+    return {
+        "config": asdict(config),
+        "started_at": datetime.fromtimestamp(start_at).isoformat(),
+        "total_samples": len(samples),
+        "phases": aggregate(samples, config, start_at),
+    }
+
+
+def format_report(result: dict) -> str:
+    """
+    生成文本格式的结果表格
+    :param result: 测试结果
+    :return: 表格文本
+    """
+    lines = []
+    header = f"{'流程':<18}{'吞吐量/s':>10}{'错误':>6}{'中位数ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    for phase, flows in result["phases"].items():
+        lines.append(f"[{phase}]")
+        lines.append(header)
+        for name, stats in flows.items():
+            latency = stats["latency_ms"]
+            lines.append(
+                f"{name:<18}{stats['throughput']:>10.2f}{stats['errors']:>6}"
+                f"{latency.get('median', 0):>10.0f}{latency.get('p95', 0):>10.0f}"
+                f"{latency.get('p99', 0):>10.0f}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """
+    命令行入口
+    :param argv: 命令行参数
+    """
+    parser = argparse.ArgumentParser(description="基于页面对象的负载测试")
+    parser.add_argument("--processes", type=int, default=1, help="进程数")
+    parser.add_argument("--users", type=int, default=5, help="每个进程的虚拟用户数")
+    parser.add_argument("--ramp-up", type=float, default=30, help="爬坡时间(秒)")
+    parser.add_argument("--duration", type=float, default=120, help="稳定阶段时长(秒)")
+    parser.add_argument("--think-time", type=float, default=1.0, help="平均思考时间(秒)")
+    parser.add_argument("--mix", help="流程权重，如 search_loan=4,add_loan=3")
+    parser.add_argument("--headed", action="store_true", help="显示浏览器窗口")
+    parser.add_argument("--browser-server", action="store_true", help="连接共享的浏览器服务")
+    parser.add_argument("--output", help="结果文件路径，默认 <项目根目录>/reports/load/<时间>.json")
+    args = parser.parse_args(argv)
+
+    config = LoadConfig(
+        processes=args.processes,
+        users=args.users,
+        ramp_up=args.ramp_up,
+        duration=args.duration,
+        think_time=args.think_time,
+        mix=parse_mix(args.mix) if args.mix else dict(DEFAULT_MIX),
+        headless=not args.headed,
+        use_server=args.browser_server,
+    )
+    result = run(config)
+
+    output = args.output or os.path.join(
+        LOAD_REPORT_DIR, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    print(format_report(result))
+    logger.info("负载测试结果已保存至: %s", output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
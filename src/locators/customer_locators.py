@@ -12,8 +12,11 @@ class CustomerLocators:
     ADD_CUSTOMER_PAGE = 'a[href*="LoadForms.aspx"][href*="formid=646"][href*="ModuleID=30012928"]'  # 客户信息
     CUSTOMER_LIST_PAGE = 'a[href*="Loadlists.aspx"][href*="listid=391"][href*="ModuleID=30012822"]'  # 客户信息列表
 
+    # 页面地址（相对于登录后的主页面，后台造数使用）
+    ADD_CUSTOMER_FORM_URL = "LoadForms.aspx?formid=646&ModuleID=30012928"  # 新增客户
+    CUSTOMER_LIST_URL = "Loadlists.aspx?listid=391&ModuleID=30012822"  # 客户信息列表
+
     # iframe 相关
-    SELECT_GRID_IFRAME = 'iframe[src*="SelectGrid.aspx"]'  # 选择搜索iframe
     CUSTOMER_LIST_IFRAME = 'iframe[src*="Loadlists.aspx"][src*="listid=391"][src*="ModuleID=30012822"]'  # 客户信息列表
     ADD_CUSTOMER_FORM_IFRAME = 'iframe[src*="LoadForms.aspx"][src*="formid=646"][src*="ModuleID=30012928"]'  # 新增客户
     EDIT_CUSTOMER_FORM_IFRAME = 'iframe[src*="LoadForms.aspx"][src*="formid=646"][src*="ModuleID=30012822"]'  # 修改客户
@@ -26,6 +29,8 @@ class CustomerLocators:
     SEARCH_CUSTOMER_LEVEL_INPUT = "#Panel1_panelTop_k1400-inputEl"  # 客户等级
     SEARCH_CUSTOMER_BUTTON = "#Panel1_panelTop_BtnSearch"  # 搜索按钮
     SEARCH_CUSTOMER_LIST = 'tr.f-grid-row[data-rowid="frow0"]'  # 客户列表
+    SEARCH_CUSTOMER_ROWS = "tr.f-grid-row"  # 客户列表数据行
+    SEARCH_CUSTOMER_EMPTY = "div.f-grid-emptytext"  # 客户列表无数据提示
     SEARCH_CUSTOMER_RESULT = 'a >> text="{customer.name}"'  # 客户结果
     SEARCH_CUSTOMER_RESULT_CHECK = 'td[data-columnid="fineui_14"]'  # 客户结果检查
 
@@ -44,19 +49,12 @@ class CustomerLocators:
     CUSTOMER_LEVEL = "#Panel2_ContentPanel1_mainTabs_Tab1_TabCpl1_dengji-inputEl"  # 客户等级
 
     # 负责人选择相关
+    RESPONSIBLE_PERSON = "#Panel2_ContentPanel1_mainTabs_Tab1_TabCpl1_fzr-inputEl"  # 负责人
     RESPONSIBLE_PERSON_SEARCH = "#Panel2_ContentPanel1_mainTabs_Tab1_TabCpl1_fzr i.f-triggerbox-trigger1.f-triggericon-search"  # 负责人搜索
-    RESPONSIBLE_PERSON_INPUT = "#PanMain_Toolbar1_TextBox1-inputEl"  # 负责人输入
-    RESPONSIBLE_PERSON_SEARCH_BTN = "#PanMain_Toolbar1_Button3"  # 负责人搜索按钮
-    RESPONSIBLE_PERSON_SELECT_BTN = "#PanMain_Toolbar1_Button1"  # 负责人选择按钮
-    RESPONSIBLE_PERSON_RESULT = 'div.f-grid-cell-inner >> text="{customer.responsible_person}"'  # 负责人结果
 
     # 共享人选择相关
     SHARED_PERSON = "#Panel2_ContentPanel1_mainTabs_Tab1_TabCpl1_gxr-inputEl"  # 共享人
     SHARED_PERSON_SEARCH = "#Panel2_ContentPanel1_mainTabs_Tab1_TabCpl1_gxr i.f-triggerbox-trigger1.f-triggericon-search"  # 共享人搜索
-    SHARED_PERSON_SEARCH_INPUT = "#PanMain_Toolbar1_TextBox1-inputEl"  # 共享人搜索输入
-    SHARED_PERSON_SEARCH_BTN = "#PanMain_Toolbar1_Button3"  # 共享人搜索按钮
-    SHARED_PERSON_SELECT_BTN = "#PanMain_Toolbar1_Button1"  # 共享人选择按钮
-    SHARED_PERSON_RESULT = 'div.f-grid-cell-inner >> text="{customer.shared_persons[0]}"'  # 共享人结果
 
     # 列表按钮（客户信息列表）
     EDIT_CUSTOMER_BUTTON = "#Panel1_Toolbar1_Button3"  # 修改
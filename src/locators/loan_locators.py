@@ -11,8 +11,11 @@ class LoanLocators:
     # 页面链接
     LOAN_LIST_PAGE = 'a[href*="Loadlists.aspx"][href*="listid=10643"][href*="ModuleID=30013823"]'  # 借款申请列表
 
+    # 页面地址（相对于登录后的主页面，后台造数使用）
+    ADD_LOAN_FORM_URL = "LoadForms.aspx?formid=2879&ModuleID=30013823"  # 新增借款申请
+    LOAN_LIST_URL = "Loadlists.aspx?listid=10643&ModuleID=30013823"  # 借款申请列表
+
     # iframe 相关
-    SELECT_GRID_IFRAME = 'iframe[src*="SelectGrid.aspx"]'  # 选择搜索iframe
     LOAN_LIST_IFRAME = 'iframe[src*="Loadlists.aspx"][src*="listid=10643"][src*="ModuleID=30013823"]'  # 借款申请列表
     ADD_LOAN_FORM_IFRAME = 'iframe[src*="LoadForms.aspx"][src*="formid=2879"][src*="ModuleID=30013823"]'  # 新增借款申请
     EDIT_LOAN_FORM_IFRAME = 'iframe[src*="LoadForms.aspx"][src*="formid=2879"][src*="ModuleID=30013823"]'  # 修改借款申请
@@ -25,6 +28,8 @@ class LoanLocators:
     SEARCH_LOAN_PERIOD_END = "#Panel1_panelTop_k12580_end-inputEl"  # 借款日期结束
     SEARCH_LOAN_BUTTON = "#Panel1_panelTop_BtnSearch"  # 搜索
     SEARCH_LOAN_LIST = 'tr.f-grid-row[data-rowid="frow0"]'  # 借款申请列表
+    SEARCH_LOAN_ROWS = "tr.f-grid-row"  # 借款申请列表数据行
+    SEARCH_LOAN_EMPTY = "div.f-grid-emptytext"  # 借款申请列表无数据提示
     SEARCH_LOAN_RESULT = 'a >> text="{loan.borrower}"'  # 借款申请结果
     SEARCH_LOAN_RESULT_CHECK = 'td[data-columnid="fineui_14"]'  # 借款申请结果项目名称
 
@@ -46,24 +51,12 @@ class LoanLocators:
 
     # 项目名称相关
     PROJECT_SEARCH = "#Panel2_ContentPanel1_xmmc i.f-triggerbox-trigger1.f-triggericon-search"  # 项目名称搜索
-    PROJECT_SEARCH_INPUT = "#PanMain_Toolbar1_TextBox1-inputEl"  # 项目名称搜索输入
-    PROJECT_SEARCH_BTN = "#PanMain_Toolbar1_Button3"  # 项目名称搜索按钮
-    PROJECT_SELECT_BTN = "#PanMain_Toolbar1_Button1"  # 项目名称选择按钮
-    PROJECT_RESULT = 'div.f-grid-cell-inner >> text={loan.project_name}'  # 项目名称结果
 
     # 借款人相关
     BORROWER_SEARCH = "#Panel2_ContentPanel1_jkr i.f-triggerbox-trigger1.f-triggericon-search"  # 借款人搜索
-    BORROWER_SEARCH_INPUT = "#PanMain_Toolbar1_TextBox1-inputEl"  # 借款人搜索输入
-    BORROWER_SEARCH_BTN = "#PanMain_Toolbar1_Button3"  # 借款人搜索按钮
-    BORROWER_SELECT_BTN = "#PanMain_Toolbar1_Button1"  # 借款人选择按钮
-    BORROWER_RESULT = 'div.f-grid-cell-inner >> text={loan.borrower}'  # 借款人结果
 
     # 经办人相关
     HANDLER_SEARCH = "#Panel2_ContentPanel1_jbr i.f-triggerbox-trigger1.f-triggericon-search"  # 经办人搜索
-    HANDLER_SEARCH_INPUT = "#PanMain_Toolbar1_TextBox1-inputEl"  # 经办人搜索输入
-    HANDLER_SEARCH_BTN = "#PanMain_Toolbar1_Button3"  # 经办人搜索按钮
-    HANDLER_SELECT_BTN = "#PanMain_Toolbar1_Button1"  # 经办人选择按钮
-    HANDLER_RESULT = 'div.f-grid-cell-inner >> text={loan.handler}'  # 经办人结果
 
     # 列表按钮（借款申请列表）
     ADD_LOAN_BUTTON = "#Panel1_Toolbar1_Button2"  # 新增
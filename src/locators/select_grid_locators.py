@@ -0,0 +1,21 @@
+"""
+选择窗口(SelectGrid.aspx)元素定位器
+"""
+
+
+class SelectGridLocators:
+    # iframe 相关
+    IFRAME = 'iframe[src*="SelectGrid.aspx"]'  # 选择窗口iframe
+
+    # 工具栏
+    SEARCH_INPUT = "#PanMain_Toolbar1_TextBox1-inputEl"  # 搜索输入
+    SEARCH_BUTTON = "#PanMain_Toolbar1_Button3"  # 搜索按钮
+    CONFIRM_BUTTON = "#PanMain_Toolbar1_Button1"  # 确定按钮
+
+    # 表格
+    ROWS = "#PanMain_Grid1 tr.f-grid-row"  # 数据行
+    EMPTY = "#PanMain_Grid1 div.f-grid-emptytext"  # 无数据提示
+    CELL = "#PanMain_Grid1 tr.f-grid-row div.f-grid-cell-inner >> text={text} >> nth=0"  # 单元格，text为带引号的完整文本
+    # 行首复选框，text为带引号的完整文本；多选时点击行只会替换选中行，需点击复选框增加选中行
+    CHECKER = "#PanMain_Grid1 tr.f-grid-row:has(div.f-grid-cell-inner:text-is({text})) .f-grid-checkbox >> nth=0"
+    SELECTED_CELL = "#PanMain_Grid1 tr.f-grid-row-selected div.f-grid-cell-inner >> text={text} >> nth=0"  # 已选中行的单元格
@@ -0,0 +1,328 @@
+"""
+异步客户管理页面对象，实现客户管理相关操作
+"""
+
+from playwright.async_api import Page
+from pages.base.async_base_page import AsyncBasePage
+from pages.base.base_config import ResponsePattern
+from pages.base.async_navigator import AsyncNavigator
+from pages.base.async_select_grid_picker import AsyncSelectGridPicker
+from locators.customer_locators import CustomerLocators
+from models.customer import Customer
+from utils.logger import logger
+
+
+class AsyncCustomerPage(AsyncBasePage):
+    """异步客户管理页面对象类"""
+
+    def __init__(self, page: Page):
+        """
+        初始化客户管理页面
+        :param page: playwright异步页面对象
+        """
+        super().__init__(page)
+        self.locators = CustomerLocators()
+        self.picker = AsyncSelectGridPicker(self)
+        self.navigator = AsyncNavigator(self)
+
+    async def navigate_to_customer_page(self):
+        """导航到客户管理页面"""
+        logger.info("导航到客户管理页面")
+        await self.click(self.locators.CUSTOMER_PAGE)
+        await self.wait_for_selector(self.locators.CUSTOMER_MENU)
+
+    async def click_customer_menu(self):
+        """点击客户管理菜单"""
+        logger.info("点击客户管理菜单")
+        await self.click(self.locators.CUSTOMER_MENU)
+        await self.wait_for_selector(self.locators.CUSTOMER_LIST_PAGE)
+
+    async def open_customer_list(self):
+        """直接打开客户信息列表，找不到菜单链接时逐级点击菜单"""
+        await self.navigator.open(self.locators.CUSTOMER_LIST_URL, self._open_customer_list_by_menu)
+
+    async def _open_customer_list_by_menu(self):
+        """逐级点击客户模块、客户信息菜单和客户信息列表"""
+        await self.navigate_to_customer_page()
+        await self.click_customer_menu()
+        await self.click(self.locators.CUSTOMER_LIST_PAGE)
+
+    async def _open_add_customer_form_by_menu(self):
+        """逐级点击客户模块、客户信息菜单和新增客户"""
+        await self.navigate_to_customer_page()
+        await self.click_customer_menu()
+        await self.click(self.locators.ADD_CUSTOMER_PAGE)
+
+    async def select_responsible_person(self, customer: Customer):
+        """
+        选择负责人
+        :param customer: 客户数据对象
+        """
+        logger.info("选择负责人: %s", customer.responsible_person)
+        await self.picker.select(
+            self.locators.RESPONSIBLE_PERSON_SEARCH, customer.responsible_person
+        )
+
+    async def select_shared_persons(self, customer: Customer):
+        """
+        选择共享人，全部共享人在同一个选择窗口中多选
+        :param customer: 客户数据对象
+        """
+        if not customer.shared_persons:
+            logger.info("没有需要选择的共享人")
+            return
+
+        logger.info("选择共享人: %s", customer.shared_persons)
+        await self.picker.select_many(self.locators.SHARED_PERSON_SEARCH, customer.shared_persons)
+
+    async def fill_customer_form(self, customer: Customer):
+        """
+        填写客户表单
+        :param customer: 客户数据对象
+        """
+        try:
+            field_mapping = {
+                "name": (self.locators.CUSTOMER_NAME, False),
+                "type": (self.locators.CUSTOMER_TYPE, True),
+                "code": (self.locators.CUSTOMER_CODE, False),
+                "industry": (self.locators.INDUSTRY, True),
+                "phone": (self.locators.PHONE, False),
+                "region": (self.locators.REGION, True),
+                "mobile": (self.locators.MOBILE, False),
+                "scale": (self.locators.SCALE, True),
+                "qq": (self.locators.QQ, False),
+                "source": (self.locators.CUSTOMER_SOURCE, True),
+                "department": (self.locators.DEPARTMENT, True),
+                "level": (self.locators.CUSTOMER_LEVEL, True),
+            }
+
+            # 下拉框先按选项目录校验并设置，存在无效选项时不填写任何字段
+            await self.select_options(
+                {
+                    selector: getattr(customer, field, None)
+                    for field, (selector, is_select) in field_mapping.items()
+                    if is_select
+                }
+            )
+
+            # 普通输入框批量填写
+            await self.fill_many(
+                {
+                    selector: getattr(customer, field, None)
+                    for field, (selector, is_select) in field_mapping.items()
+                    if not is_select
+                }
+            )
+
+            if customer.responsible_person:
+                await self.select_responsible_person(customer)
+
+            if customer.shared_persons:
+                await self.select_shared_persons(customer)
+
+        except Exception as e:
+            logger.error("填写表单时发生错误: %s", e)
+            await self.take_screenshot("form_fill_error")
+            raise
+
+    async def add_customer(self, customer: Customer):
+        """
+        添加客户
+        :param customer: 客户数据对象
+        """
+        logger.info("添加客户: %s", customer.name)
+
+        try:
+            await self.navigator.open(
+                self.locators.ADD_CUSTOMER_FORM_URL, self._open_add_customer_form_by_menu
+            )
+
+            async with self.frame_context(self.locators.ADD_CUSTOMER_FORM_IFRAME):
+                await self.stabilize_page()
+                await self.fill_customer_form(customer)
+                await self.click_and_wait_for_response(
+                    self.locators.SAVE_AND_NEW_BUTTON, ResponsePattern.FORM
+                )
+                await self.wait_for_selector(self.locators.SUCCESS_ADD_CUSTOMER_MESSAGE)
+                logger.info("客户添加成功")
+
+        except Exception as e:
+            logger.error("添加客户时发生错误: %s", e)
+            await self.take_screenshot("add_customer_error")
+            raise
+
+    async def search_customer(self, customer: Customer) -> int:
+        """
+        搜索客户，搜索结果渲染完成后立即返回
+        :param customer: 客户数据对象
+        :return: 搜索结果行数
+        """
+        try:
+            await self.open_customer_list()
+            await self.enter_frame(self.locators.CUSTOMER_LIST_IFRAME)
+            await self.stabilize_page()
+
+            # 填写搜索条件
+            await self.fill(self.locators.SEARCH_CUSTOMER_NAME_INPUT, customer.name)
+            if customer.type:
+                await self.fill(self.locators.SEARCH_CUSTOMER_TYPE_INPUT, customer.type)
+            if customer.region:
+                await self.fill(self.locators.SEARCH_CUSTOMER_REGION_INPUT, customer.region)
+            if customer.level:
+                await self.fill(self.locators.SEARCH_CUSTOMER_LEVEL_INPUT, customer.level)
+
+            await self.click_and_wait_for_response(
+                self.locators.SEARCH_CUSTOMER_BUTTON, ResponsePattern.LIST
+            )
+            rows = await self.wait_for_grid_rows(
+                self.locators.SEARCH_CUSTOMER_ROWS, self.locators.SEARCH_CUSTOMER_EMPTY
+            )
+            logger.info("搜索到 %s 条客户记录", rows)
+            return rows
+
+        except Exception as e:
+            logger.error("搜索客户时发生错误: %s", e)
+            await self.take_screenshot("search_customer_error")
+            self.exit_frame()
+            raise
+
+    async def is_customer_exists(self, customer: Customer) -> bool:
+        """
+        检查客户是否存在
+        :param customer: 客户数据对象
+        :return: 客户是否存在
+        """
+        try:
+            # 无数据时表格直接显示无数据提示，不需要等待结果行超时
+            if await self.search_customer(customer) and await self.get_element_count(
+                self.locators.SEARCH_CUSTOMER_RESULT.format(customer=customer)
+            ):
+                return True
+            logger.info("客户不存在")
+            self.exit_frame()
+            return False
+        except Exception as e:
+            logger.error("检查客户是否存在时发生错误: %s", e)
+            self.exit_frame()
+            await self.take_screenshot("check_customer_exists_error")
+            raise
+
+    async def edit_customer(self, customer: Customer, updated_customer: Customer):
+        """
+        编辑客户信息
+        :param customer: 原客户数据对象
+        :param updated_customer: 更新的客户数据对象
+        """
+        try:
+            await self.search_customer(customer)
+
+            async with self.frame_context(self.locators.CUSTOMER_LIST_IFRAME):
+                await self.click(self.locators.SEARCH_CUSTOMER_RESULT_CHECK)
+                await self.click(self.locators.EDIT_CUSTOMER_BUTTON)
+
+            async with self.frame_context(self.locators.EDIT_CUSTOMER_FORM_IFRAME):
+                await self.stabilize_page()
+                await self.fill_customer_form(updated_customer)
+                await self.click_and_wait_for_response(
+                    self.locators.SAVE_BUTTON, ResponsePattern.FORM
+                )
+                logger.info("客户 %s 更新成功", customer.name)
+
+        except Exception as e:
+            logger.error("编辑客户时发生错误: %s", e)
+            self.exit_frame()
+            await self.take_screenshot("edit_customer_error")
+            raise
+
+    async def delete_customer(self, customer: Customer):
+        """
+        删除客户
+        :param customer: 客户数据对象
+        """
+        try:
+            await self.search_customer(customer)
+
+            async with self.frame_context(self.locators.CUSTOMER_LIST_IFRAME):
+                await self.click(self.locators.SEARCH_CUSTOMER_RESULT_CHECK)
+                await self.click(self.locators.DELETE_CUSTOMER_BUTTON)
+
+                await self.wait_for_selector(self.locators.CONFIRM_DELETE_DIALOG)
+                await self.click_and_wait_for_response(
+                    self.locators.CONFIRM_DELETE_YES, ResponsePattern.LIST
+                )
+                logger.info("客户 %s 删除成功", customer.name)
+
+        except Exception as e:
+            if "Timeout 10000ms exceeded." in str(e):
+                logger.info("客户不存在")
+                return False
+            logger.error("删除客户时发生错误: %s", e)
+            self.exit_frame()
+            await self.take_screenshot("delete_customer_error")
+            raise
+
+    async def view_customer(self, customer_data: Customer):
+        """
+        查看客户详情
+        :param customer_data: 客户数据对象
+        """
+        logger.info("查看客户详情: %s", customer_data.name)
+
+        try:
+            await self.search_customer(customer_data)
+            await self.click_and_wait_for_response(
+                self.locators.SEARCH_CUSTOMER_RESULT.format(customer=customer_data),
+                ResponsePattern.DETAIL,
+            )
+
+            async with self.frame_context(self.locators.CUSTOMER_DETAIL_IFRAME):
+                await self.stabilize_page()
+                await self.wait_for_selector(self.locators.CUSTOMER_DETAIL_CONTENT)
+
+        except Exception as e:
+            logger.error("查看客户详情时发生错误: %s", e)
+            self.exit_frame()
+            await self.take_screenshot("view_customer_error")
+            raise
+
+    async def is_customer_edited(
+        self, original_customer: Customer, updated_customer: Customer
+    ) -> bool:
+        """
+        检查客户是否被正确编辑
+        :param original_customer: 原客户数据对象
+        :param updated_customer: 更新后的客户数据对象
+        :return: 客户信息是否被正确更新
+        """
+        try:
+            await self.search_customer(original_customer)
+
+            async with self.frame_context(self.locators.CUSTOMER_LIST_IFRAME):
+                await self.click(self.locators.SEARCH_CUSTOMER_RESULT_CHECK)
+                await self.click(self.locators.EDIT_CUSTOMER_BUTTON)
+
+            async with self.frame_context(self.locators.EDIT_CUSTOMER_FORM_IFRAME):
+                await self.stabilize_page()
+
+                # 验证更新的字段
+                field_mapping = {
+                    "phone": self.locators.PHONE,
+                    "qq": self.locators.QQ,
+                    "source": self.locators.CUSTOMER_SOURCE,
+                }
+
+                for field, selector in field_mapping.items():
+                    value = getattr(updated_customer, field, None)
+                    if value is not None:
+                        actual_value = await self.get_input_value(selector)
+                        if actual_value != value:
+                            logger.error("字段 %s 的值不匹配: 期望 %s, 实际 %s", field, value, actual_value)
+                            return False
+
+                return True
+
+        except Exception as e:
+            logger.error("验证客户编辑时发生错误: %s", e)
+            self.exit_frame()
+            await self.take_screenshot("verify_customer_edit_error")
+            raise
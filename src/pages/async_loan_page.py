@@ -0,0 +1,307 @@
+"""
+异步借款管理页面对象，实现借款管理相关操作
+"""
+
+from playwright.async_api import Page
+from pages.base.async_base_page import AsyncBasePage
+from pages.base.base_config import ResponsePattern
+from pages.base.async_navigator import AsyncNavigator
+from pages.base.async_select_grid_picker import AsyncSelectGridPicker
+from locators.loan_locators import LoanLocators
+from models.loan import Loan
+from utils.logger import logger
+
+
+class AsyncLoanPage(AsyncBasePage):
+    """异步借款管理页面对象类"""
+
+    def __init__(self, page: Page):
+        """
+        初始化借款管理页面
+        :param page: playwright异步页面对象
+        """
+        super().__init__(page)
+        self.locators = LoanLocators()
+        self.picker = AsyncSelectGridPicker(self)
+        self.navigator = AsyncNavigator(self)
+
+    async def navigate_to_loan_page(self):
+        """导航到借款管理页面"""
+        logger.info("导航到借款管理页面")
+        await self.click(self.locators.LOAN_PAGE)
+        await self.wait_for_selector(self.locators.LOAN_MENU)
+
+    async def click_loan_menu(self):
+        """点击借款管理菜单"""
+        logger.info("点击借款管理菜单")
+        await self.click(self.locators.LOAN_MENU)
+        await self.wait_for_selector(self.locators.LOAN_LIST_PAGE)
+
+    async def click_loan_list(self):
+        """点击借款申请列表"""
+        logger.info("点击借款申请列表")
+        await self.click(self.locators.LOAN_LIST_PAGE)
+        await self.wait_for_selector(self.locators.LOAN_LIST_IFRAME)
+
+    async def open_loan_list(self):
+        """直接打开借款申请列表，找不到菜单链接时逐级点击菜单"""
+        await self.navigator.open(self.locators.LOAN_LIST_URL, self._open_loan_list_by_menu)
+
+    async def _open_loan_list_by_menu(self):
+        """逐级点击财务模块、借支管理菜单和借款申请列表"""
+        await self.navigate_to_loan_page()
+        await self.click_loan_menu()
+        await self.click_loan_list()
+
+    async def select_project(self, loan: Loan):
+        """选择项目"""
+        await self.picker.select(self.locators.PROJECT_SEARCH, loan.project_name, search=False)
+
+    async def select_borrower(self, loan: Loan):
+        """选择借款人"""
+        await self.picker.select(self.locators.BORROWER_SEARCH, loan.borrower)
+
+    async def select_handler(self, loan: Loan):
+        """选择经办人"""
+        await self.picker.select(self.locators.HANDLER_SEARCH, loan.handler)
+
+    async def fill_loan_form(self, loan: Loan):
+        """
+        填写借款表单
+        :param loan: 借款数据对象
+        """
+        try:
+            field_mapping = {
+                "project_name": self.locators.PROJECT_NAME,
+                "loan_amount": self.locators.LOAN_AMOUNT,
+                "loan_purpose": self.locators.LOAN_PURPOSE,
+                "payment_method": self.locators.PAYMENT_METHOD,
+                "repayment_method": self.locators.REPAYMENT_METHOD,
+                "loan_period": self.locators.LOAN_PERIOD,
+                "borrower_bank": self.locators.BORROWER_BANK,
+                "bank_account": self.locators.BANK_ACCOUNT,
+                "bank_branch": self.locators.BANK_BRANCH,
+                "application_date": self.locators.APPLICATION_DATE,
+                "account_name": self.locators.ACCOUNT_NAME,
+                "bank_account_number": self.locators.BANK_ACCOUNT_NUMBER,
+            }
+
+            await self.fill_many(
+                {
+                    selector: getattr(loan, field, None)
+                    for field, selector in field_mapping.items()
+                }
+            )
+
+            if loan.project_name:
+                await self.select_project(loan)
+
+            if loan.borrower:
+                await self.select_borrower(loan)
+
+            if loan.handler:
+                await self.select_handler(loan)
+
+        except Exception as e:
+            logger.error("填写借款表单时发生错误: %s", e)
+            await self.take_screenshot("loan_form_fill_error")
+            raise
+
+    async def add_loan(self, loan: Loan):
+        """
+        添加借款
+        :param loan: 借款数据对象
+        """
+        logger.info("添加借款申请: %s", loan.project_name)
+
+        try:
+            await self.open_loan_list()
+            async with self.frame_context(self.locators.LOAN_LIST_IFRAME):
+                await self.stabilize_page()
+                await self.click(self.locators.ADD_LOAN_BUTTON)
+
+            async with self.frame_context(self.locators.ADD_LOAN_FORM_IFRAME):
+                await self.stabilize_page()
+                await self.fill_loan_form(loan)
+                await self.click_and_wait_for_response(
+                    self.locators.SAVE_BUTTON, ResponsePattern.FORM
+                )
+                await self.wait_for_selector(self.locators.SUCCESS_ADD_LOAN_MESSAGE)
+                logger.info("借款申请添加成功")
+
+        except Exception as e:
+            logger.error("添加借款时发生错误: %s", e)
+            await self.take_screenshot("add_loan_error")
+            raise
+
+    async def search_loan(self, loan: Loan) -> int:
+        """
+        搜索借款，搜索结果渲染完成后立即返回
+        :param loan: 借款数据对象
+        :return: 搜索结果行数
+        """
+        try:
+            await self.open_loan_list()
+            await self.enter_frame(self.locators.LOAN_LIST_IFRAME)
+            await self.stabilize_page()
+
+            # 填写搜索条件
+            await self.fill(self.locators.SEARCH_LOAN_PROJECT_NAME, loan.project_name)
+            await self.fill(self.locators.SEARCH_LOAN_BORROWER, loan.borrower)
+            await self.fill(self.locators.SEARCH_LOAN_PERIOD_START, loan.loan_period)
+            await self.fill(self.locators.SEARCH_LOAN_PERIOD_END, loan.loan_period)
+
+            await self.click_and_wait_for_response(
+                self.locators.SEARCH_LOAN_BUTTON, ResponsePattern.LIST
+            )
+            rows = await self.wait_for_grid_rows(
+                self.locators.SEARCH_LOAN_ROWS, self.locators.SEARCH_LOAN_EMPTY
+            )
+            logger.info("搜索到 %s 条借款记录", rows)
+            return rows
+
+        except Exception as e:
+            logger.error("搜索借款时发生错误: %s", e)
+            await self.take_screenshot("search_loan_error")
+            self.exit_frame()
+            raise
+
+    async def is_loan_exists(self, loan: Loan) -> bool:
+        """
+        检查借款是否存在
+        :param loan: 借款数据对象
+        :return: 借款是否存在
+        """
+        try:
+            # 无数据时表格直接显示无数据提示，不需要等待结果行超时
+            if await self.search_loan(loan) and await self.get_element_count(
+                self.locators.SEARCH_LOAN_RESULT.format(loan=loan)
+            ):
+                return True
+            logger.info("借款不存在")
+            self.exit_frame()
+            return False
+        except Exception as e:
+            logger.error("检查借款是否存在时发生错误: %s", e)
+            await self.take_screenshot("check_loan_exists_error")
+            raise
+
+    async def edit_loan(self, loan: Loan, updated_loan: Loan):
+        """
+        编辑借款信息
+        :param loan: 原借款数据对象
+        :param updated_loan: 更新的借款数据对象
+        """
+        try:
+            await self.search_loan(loan)
+
+            async with self.frame_context(self.locators.LOAN_LIST_IFRAME):
+                await self.click(self.locators.SEARCH_LOAN_RESULT_CHECK)
+                await self.click(self.locators.EDIT_LOAN_BUTTON)
+
+            async with self.frame_context(self.locators.EDIT_LOAN_FORM_IFRAME):
+                await self.stabilize_page()
+                await self.fill_loan_form(updated_loan)
+                await self.click_and_wait_for_response(
+                    self.locators.SAVE_BUTTON, ResponsePattern.FORM
+                )
+                await self.wait_for_selector(self.locators.SUCCESS_EDIT_LOAN_MESSAGE)
+                logger.info("借款 %s 更新成功", loan.project_name)
+
+        except Exception as e:
+            logger.error("编辑借款时发生错误: %s", e)
+            await self.take_screenshot("edit_loan_error")
+            raise
+
+    async def delete_loan(self, loan: Loan):
+        """
+        删除借款
+        :param loan: 借款数据对象
+        """
+        try:
+            await self.search_loan(loan)
+
+            async with self.frame_context(self.locators.LOAN_LIST_IFRAME):
+                await self.click(self.locators.SEARCH_LOAN_RESULT_CHECK)
+                await self.click(self.locators.DELETE_LOAN_BUTTON)
+
+                await self.wait_for_selector(self.locators.CONFIRM_DELETE_DIALOG)
+                await self.click_and_wait_for_response(
+                    self.locators.CONFIRM_DELETE_YES, ResponsePattern.LIST
+                )
+                logger.info("借款 %s 删除成功", loan.project_name)
+
+        except Exception as e:
+            logger.error("删除借款时发生错误: %s", e)
+            await self.take_screenshot("delete_loan_error")
+            raise
+
+    async def view_loan(self, loan: Loan):
+        """
+        查看借款详情
+        :param loan: 借款数据对象
+        """
+        logger.info("查看借款详情: %s", loan.project_name)
+
+        try:
+            await self.search_loan(loan)
+
+            await self.click_and_wait_for_response(
+                self.locators.SEARCH_LOAN_RESULT.format(loan=loan),
+                ResponsePattern.DETAIL,
+            )
+
+            async with self.frame_context(self.locators.LOAN_DETAIL_IFRAME):
+                await self.stabilize_page()
+                await self.wait_for_selector(self.locators.LOAN_DETAIL_CONTENT)
+
+        except Exception as e:
+            logger.error("查看借款详情时发生错误: %s", e)
+            self.exit_frame()
+            await self.take_screenshot("view_loan_error")
+            raise
+
+    async def is_loan_edited(self, original_loan: Loan, updated_loan: Loan) -> bool:
+        """
+        检查借款是否被正确编辑
+        :param original_loan: 原借款数据对象
+        :param updated_loan: 更新后的借款数据对象
+        :return: 借款信息是否被正确更新
+        """
+        try:
+            await self.search_loan(original_loan)
+
+            async with self.frame_context(self.locators.LOAN_LIST_IFRAME):
+                await self.click(self.locators.SEARCH_LOAN_RESULT_CHECK)
+                await self.click(self.locators.EDIT_LOAN_BUTTON)
+
+            async with self.frame_context(self.locators.EDIT_LOAN_FORM_IFRAME):
+                await self.stabilize_page()
+
+                # 验证更新的字段
+                field_mapping = {
+                    "loan_amount": self.locators.LOAN_AMOUNT,
+                    "loan_purpose": self.locators.LOAN_PURPOSE,
+                    "payment_method": self.locators.PAYMENT_METHOD,
+                    "repayment_method": self.locators.REPAYMENT_METHOD,
+                }
+
+                for field, selector in field_mapping.items():
+                    value = getattr(updated_loan, field, None)
+                    if value is not None:
+                        actual_value = await self.get_input_value(selector)
+                        if str(actual_value) != str(value):
+                            logger.error(
+                                "字段 %s 的值不匹配: 期望 %s, 实际 %s",
+                                field,
+                                value,
+                                actual_value,
+                            )
+                            return False
+
+                return True
+
+        except Exception as e:
+            logger.error("验证借款编辑时发生错误: %s", e)
+            await self.take_screenshot("verify_loan_edit_error")
+            raise
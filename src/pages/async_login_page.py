@@ -0,0 +1,85 @@
+"""
+异步登录页面对象，实现用户登录相关操作
+"""
+
+from pages.base.async_base_page import AsyncBasePage
+from utils.logger import logger
+from utils.auth_cache import auth_cache
+from config.config import LOGIN_USERNAME, LOGIN_PASSWORD
+from playwright.async_api import Page
+from locators.login_locators import LoginLocators
+
+
+class AsyncLoginPage(AsyncBasePage):
+    """异步登录页面对象类"""
+
+    def __init__(self, page: Page):
+        """
+        初始化登录页面
+        :param page: playwright异步页面对象
+        """
+        super().__init__(page)
+        # 登录页面URL，使用相对路径
+        self.login_url = "/login.aspx"
+        self.selectors = LoginLocators()
+
+    async def navigate_to_login(self):
+        """
+        导航到登录页面
+        """
+        logger.info("导航到登录页面")
+        await self.navigate(f"{self.base_url}{self.login_url}")
+
+    async def login(self, username=LOGIN_USERNAME, password=LOGIN_PASSWORD):
+        """
+        执行登录操作
+        :param username: 用户名
+        :param password: 密码
+        """
+        logger.info("使用用户名 %s 登录", username)
+        await self.navigate_to_login()
+        await self.fill(self.selectors.USERNAME_INPUT, username)
+        await self.fill(self.selectors.PASSWORD_INPUT, password)
+        await self.click(self.selectors.LOGIN_BUTTON)
+        await self.wait_for_navigation()
+
+    def is_on_login_page(self) -> bool:
+        """
+        判断当前是否位于登录页面，会话过期时访问任意页面都会被重定向到登录页
+        :return: 是否位于登录页面
+        """
+        return self.login_url.lower() in self.page.url.lower()
+
+    async def ensure_logged_in(self, username=LOGIN_USERNAME, password=LOGIN_PASSWORD):
+        """
+        确保已登录，优先复用已保存的登录状态，会话过期时重新登录并更新缓存
+        浏览器上下文需使用auth_cache.storage_state()创建才能复用登录状态
+        :param username: 用户名
+        :param password: 密码
+        """
+        cached = auth_cache.load(username)
+        if cached:
+            await self.navigate(cached["landing_url"])
+            if not self.is_on_login_page():
+                logger.info("复用已保存的登录状态: %s", username)
+                return
+            logger.info("登录状态已失效，重新登录: %s", username)
+            auth_cache.invalidate(username)
+        await self.login(username, password)
+        await auth_cache.save_async(self.page.context, username, self.page.url)
+
+    async def is_login_successful(self):
+        """
+        判断登录是否成功
+        :return: 登录是否成功
+        """
+        return await self.is_visible(self.selectors.WELCOME_MESSAGE)
+
+    async def get_error_message(self):
+        """
+        获取登录失败时的错误信息
+        :return: 错误信息文本
+        """
+        if await self.is_visible(self.selectors.ERROR_MESSAGE):
+            return await self.get_text(self.selectors.ERROR_MESSAGE)
+        return None
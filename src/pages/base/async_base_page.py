@@ -0,0 +1,527 @@
+"""
+异步页面对象基类，基于playwright.async_api实现与BasePage一致的页面操作方法，
+用于在同一事件循环中并发驱动多个页面
+"""
+
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Pattern, Union
+
+from playwright.async_api import expect, Page, Frame, Locator, Response
+from utils.logger import logger
+from utils.screenshot_service import screenshot_service
+from config.config import SCREENSHOT_PATH, BASE_URL
+from pages.base.base_config import WaitConfig, ElementState, LoadState
+from pages.base.base_page import BasePage
+from pages.base.page_stability import AsyncPageStability
+from pages.base.locator_cache import LocatorCache
+from pages.base.frame_cache import FrameCache
+from pages.base.option_catalog import Option, option_catalog, match_option
+from pages.base.scripts import (
+    FILL_MANY_SCRIPT,
+    READ_VALUES_SCRIPT,
+    GRID_RESULT_SCRIPT,
+    READ_OPTIONS_SCRIPT,
+    APPLY_OPTIONS_SCRIPT,
+)
+
+
+class AsyncBasePage:
+    """异步页面对象基类，实现通用的页面操作方法"""
+
+    def __init__(self, page: Page):
+        """
+        初始化异步基础页面
+        :param page: playwright异步页面对象
+        """
+        self.page = page
+        self.base_url = BASE_URL
+        self.stability = AsyncPageStability()
+        self.locator_cache = LocatorCache.for_page(page)
+        self.frame_cache = FrameCache.for_page(page)
+        self._frame_stack: List[Frame] = []
+        self._ensure_screenshot_dir()
+
+    def _ensure_screenshot_dir(self):
+        """确保截图目录存在"""
+        if not os.path.exists(SCREENSHOT_PATH):
+            os.makedirs(SCREENSHOT_PATH, exist_ok=True)
+
+    @property
+    def current_frame(self) -> Optional[Frame]:
+        """当前所在的iframe，位于主文档时为None"""
+        return self._frame_stack[-1] if self._frame_stack else None
+
+    @asynccontextmanager
+    async def frame_context(
+        self,
+        frame_selector: str,
+        timeout: int = WaitConfig.DEFAULT_TIMEOUT,
+        nested: bool = False,
+    ):
+        """
+        iframe上下文管理器
+        :param frame_selector: iframe选择器
+        :param timeout: 超时时间(毫秒)
+        :param nested: 是否在当前iframe内进入嵌套iframe，为True时退出后返回上一层，否则返回主文档
+        """
+        saved_stack = list(self._frame_stack)
+        try:
+            yield await self.enter_frame(frame_selector, timeout, nested=nested)
+        finally:
+            if nested:
+                self._frame_stack[:] = saved_stack
+            else:
+                self.exit_frame()
+
+    def get_context(self) -> Union[Page, Frame]:
+        """
+        获取当前操作的上下文（iframe或主文档）
+        :return: 当前操作的上下文
+        """
+        return self.current_frame if self.current_frame else self.page
+
+    def _get_element(self, selector: str) -> Locator:
+        """
+        获取元素定位器，元素等待由后续操作自动完成
+        :param selector: 元素选择器
+        :return: 元素定位器
+        """
+        return self.locator_cache.get(self.get_context(), selector)
+
+    # 页面导航相关方法
+    async def navigate(self, url: Optional[str] = None):
+        """
+        导航到指定页面
+        :param url: 目标URL，默认为None，使用base_url
+        """
+        target_url = url if url else self.base_url
+        logger.info("导航到: %s", target_url)
+        await self.page.goto(target_url)
+
+    async def reload_page(self):
+        """刷新页面"""
+        logger.info("刷新页面")
+        await self.page.reload()
+
+    async def go_back(self):
+        """返回上一页"""
+        logger.info("返回上一页")
+        await self.page.go_back()
+
+    async def go_forward(self):
+        """前进到下一页"""
+        logger.info("前进到下一页")
+        await self.page.go_forward()
+
+    # 页面状态相关方法
+    async def stabilize_page(self, timeout: int = WaitConfig.STABILIZE_TIMEOUT) -> bool:
+        """
+        稳定页面，防止画面偏移，等待DOM变更静默、ajax请求结束且布局不再变化
+        :param timeout: 最长等待时间(毫秒)，页面稳定后立即返回
+        :return: 页面是否在最长等待时间内稳定
+        """
+        logger.info("稳定页面位置")
+        return await self.stability.wait_until_stable(self.get_context(), timeout)
+
+    async def wait_for_navigation(self, timeout: int = WaitConfig.NAVIGATION_TIMEOUT):
+        """
+        等待页面导航完成
+        :param timeout: 超时时间(毫秒)
+        """
+        logger.info("等待页面导航完成")
+        await self.page.wait_for_load_state(LoadState.NETWORKIDLE, timeout=timeout)
+
+    async def wait_for_iframe_ready(self):
+        """等待iframe加载完成"""
+        await self.page.wait_for_function("""
+            () => {
+                const iframe = document.querySelector('iframe');
+                return iframe && iframe.contentDocument.readyState === 'complete';
+            }
+        """)
+
+    # iframe 相关方法
+    async def enter_frame(
+        self,
+        frame_selector: str,
+        timeout: int = WaitConfig.DEFAULT_TIMEOUT,
+        nested: bool = False,
+    ) -> Frame:
+        """
+        进入iframe
+        :param frame_selector: iframe的选择器
+        :param timeout: 超时时间(毫秒)
+        :param nested: 是否在当前iframe内进入嵌套iframe，默认从主文档进入
+        :return: iframe对象
+        """
+        logger.info("进入iframe: %s", frame_selector)
+        if not nested:
+            self._frame_stack.clear()
+
+        frame = await self._resolve_frame(frame_selector, timeout)
+        self._frame_stack.append(frame)
+        return frame
+
+    async def _resolve_frame(self, frame_selector: str, timeout: int) -> Frame:
+        """
+        在当前上下文中解析iframe，已解析且仍有效的iframe直接复用
+        :param frame_selector: iframe的选择器
+        :param timeout: 超时时间(毫秒)
+        :return: iframe对象
+        """
+        parent = self.current_frame or self.page.main_frame
+        frame = self.frame_cache.get(parent, frame_selector)
+        if frame:
+            return frame
+
+        element = await parent.wait_for_selector(frame_selector, timeout=timeout)
+        frame = await element.content_frame() if element else None
+        if not frame:
+            raise Exception(f"无法获取 iframe: {frame_selector}")
+
+        self.frame_cache.put(parent, frame_selector, frame)
+        return frame
+
+    def exit_frame(self):
+        """退出iframe，返回主文档"""
+        logger.info("退出iframe，返回主文档")
+        self._frame_stack.clear()
+        return self.page
+
+    def pop_frame(self) -> Union[Page, Frame]:
+        """
+        退出当前iframe，返回上一层iframe或主文档
+        :return: 返回后的上下文
+        """
+        logger.info("退出当前iframe，返回上一层")
+        if self._frame_stack:
+            self._frame_stack.pop()
+        return self.get_context()
+
+    # 元素操作方法
+    async def click(self, selector: str, timeout: int = WaitConfig.DEFAULT_TIMEOUT):
+        """
+        点击元素
+        :param selector: 元素选择器
+        :param timeout: 超时时间(毫秒)
+        """
+        logger.info("点击元素: %s", selector)
+        await self.stabilize_page()
+        await self._get_element(selector).click(timeout=timeout)
+
+    async def fill(
+        self, selector: str, text: str, timeout: int = WaitConfig.DEFAULT_TIMEOUT
+    ):
+        """
+        在输入框中填入文本
+        :param selector: 元素选择器
+        :param text: 要填入的文本
+        :param timeout: 超时时间(毫秒)
+        """
+        logger.info("在 %s 中填入: %s", selector, text)
+        await self.stabilize_page()
+        await self._get_element(selector).fill(text, timeout=timeout)
+
+    async def fill_many(
+        self, mapping: Dict[str, str], timeout: int = WaitConfig.DEFAULT_TIMEOUT
+    ):
+        """
+        批量填写输入框，一次调用写入全部字段后一次性回读校验，
+        无法批量写入或校验不一致的字段退回逐个填写
+        :param mapping: 元素选择器到文本的映射，值为None的字段会被忽略
+        :param timeout: 超时时间(毫秒)
+        """
+        fields = {
+            selector: str(text) for selector, text in mapping.items() if text is not None
+        }
+        if not fields:
+            return
+
+        logger.info("批量填写 %s 个字段", len(fields))
+        batch = {s: t for s, t in fields.items() if BasePage._is_css_selector(s)}
+        fallback = [s for s in fields if s not in batch]
+
+        if batch:
+            context = self.get_context()
+            await self._get_element(next(iter(batch))).wait_for(
+                state=ElementState.ATTACHED, timeout=timeout
+            )
+            skipped = await context.evaluate(FILL_MANY_SCRIPT, list(batch.items()))
+            selectors = [s for s in batch if s not in skipped]
+            actual_values = await context.evaluate(READ_VALUES_SCRIPT, selectors)
+            mismatched = [
+                s for s, actual in zip(selectors, actual_values) if actual != batch[s]
+            ]
+            if skipped or mismatched:
+                logger.warning(
+                    "以下字段批量填写失败，改为逐个填写: %s", skipped + mismatched
+                )
+            fallback.extend(skipped + mismatched)
+
+        for selector in fallback:
+            await self.fill(selector, fields[selector], timeout)
+
+    async def select_option(
+        self,
+        selector: str,
+        value: Optional[str] = None,
+        timeout: int = WaitConfig.DEFAULT_TIMEOUT,
+    ):
+        """
+        选择下拉选项（支持非标准下拉框）
+        :param selector: 元素选择器
+        :param value: 选项的显示文本或value值
+        :param timeout: 超时时间(毫秒)
+        """
+        await self.select_options({selector: value}, timeout)
+
+    async def select_options(
+        self, mapping: Dict[str, Optional[str]], timeout: int = WaitConfig.DEFAULT_TIMEOUT
+    ):
+        """
+        批量选择下拉选项，一次调用读取全部下拉框的选项并缓存到表单的选项目录，
+        随后按选项值直接设置；无法读取选项或设置失败的下拉框退回展开下拉列表逐个选择
+        :param mapping: 元素选择器到选项显示文本或value值的映射，值为None的下拉框会被忽略
+        :param timeout: 超时时间(毫秒)
+        :raises ValueError: 存在不是有效选项的值时，在选择任何选项之前抛出
+        """
+        fields = {
+            selector: str(text) for selector, text in mapping.items() if text is not None
+        }
+        if not fields:
+            return
+
+        batch = {s: t for s, t in fields.items() if BasePage._is_css_selector(s)}
+        choices: Dict[str, Option] = {}
+        failed: List[str] = []
+        if batch:
+            context = self.get_context()
+            form_key = option_catalog.form_key(context.url)
+            # 等待首个下拉框出现，确保表单已渲染
+            await self._get_element(next(iter(batch))).wait_for(
+                state=ElementState.ATTACHED, timeout=timeout
+            )
+            missing = option_catalog.missing(form_key, list(batch))
+            if missing:
+                option_catalog.update(
+                    form_key, await context.evaluate(READ_OPTIONS_SCRIPT, missing)
+                )
+
+            choices, invalid = option_catalog.resolve(form_key, batch)
+            if invalid:
+                raise ValueError(
+                    "以下下拉框的值不是有效选项: "
+                    + ", ".join(f"{s}={t}" for s, t in invalid.items())
+                )
+            if choices:
+                logger.info("按选项目录设置 %s 个下拉框", len(choices))
+                failed = await context.evaluate(
+                    APPLY_OPTIONS_SCRIPT,
+                    [[s, option["value"], option["text"]] for s, option in choices.items()],
+                )
+                if failed:
+                    logger.warning("以下下拉框直接设置失败，改为展开下拉列表选择: %s", failed)
+
+        for selector, text in fields.items():
+            if selector not in choices or selector in failed:
+                await self._pick_option(selector, text, timeout)
+
+    async def _pick_option(self, selector: str, text: str, timeout: int):
+        """
+        填入文本后在展开的下拉列表中点击选项，依次按完全匹配和唯一的包含关系匹配
+        :param selector: 元素选择器
+        :param text: 选项的显示文本
+        :param timeout: 超时时间(毫秒)
+        """
+        logger.info("在 %s 中选择选项: %s", selector, text)
+
+        # 先填入文本，填入操作会自动等待输入框可见
+        await self.fill(selector, text, timeout)
+
+        items = self._get_element("li >> visible=true")
+        await items.first.wait_for(timeout=timeout)
+        texts = [t.strip() for t in await items.all_text_contents()]
+        option = match_option([{"value": t, "text": t} for t in texts], text)
+        if option is None:
+            raise Exception(f"未找到包含文本 '{text}' 的选项")
+        await items.nth(texts.index(option["text"])).click()
+
+    async def get_text(
+        self, selector: str, timeout: int = WaitConfig.DEFAULT_TIMEOUT
+    ) -> str:
+        """
+        获取元素文本
+        :param selector: 元素选择器
+        :param timeout: 超时时间(毫秒)
+        :return: 元素文本
+        """
+        logger.info("获取元素 %s 的文本", selector)
+        element = self._get_element(selector)
+        if await element.is_editable(timeout=timeout):
+            return await element.input_value(timeout=timeout)
+        return await element.text_content(timeout=timeout)
+
+    async def get_input_value(
+        self, selector: str, timeout: int = WaitConfig.DEFAULT_TIMEOUT
+    ) -> str:
+        """
+        获取输入框的值
+        :param selector: 元素选择器
+        :param timeout: 超时时间(毫秒)
+        :return: 输入框的值
+        """
+        logger.info("获取输入框 %s 的值", selector)
+        return await self._get_element(selector).input_value(timeout=timeout)
+
+    # 元素状态检查方法
+    async def is_visible(
+        self, selector: str, timeout: int = WaitConfig.DEFAULT_TIMEOUT
+    ) -> bool:
+        """
+        检查元素是否可见
+        :param selector: 元素选择器
+        :param timeout: 超时时间(毫秒)
+        :return: 元素是否可见
+        """
+        try:
+            await expect(self._get_element(selector)).to_be_visible(timeout=timeout)
+            return True
+        except Exception as e:
+            logger.error("元素 %s 不可见: %s", selector, e)
+            return False
+
+    async def is_value_equal(
+        self, selector: str, value: str, timeout: int = WaitConfig.DEFAULT_TIMEOUT
+    ) -> bool:
+        """
+        检查元素的值是否等于给定值
+        :param selector: 元素选择器
+        :param value: 期望的值
+        :param timeout: 超时时间(毫秒)
+        :return: 是否相等
+        """
+        try:
+            await expect(self._get_element(selector)).to_have_value(
+                value, timeout=timeout
+            )
+            return True
+        except Exception as e:
+            logger.error("元素 %s 的值不等于 %s: %s", selector, value, e)
+            return False
+
+    async def get_element_count(self, selector: str) -> int:
+        """
+        获取当前匹配的元素数量，不等待元素出现
+        :param selector: 元素选择器
+        :return: 元素数量
+        """
+        return await self._get_element(selector).count()
+
+    # 截图方法
+    async def take_screenshot(self, name: str = "screenshot") -> Optional[str]:
+        """
+        截取屏幕截图，编码和写盘在后台完成，截图失败不会影响调用方
+        :param name: 截图名称
+        :return: 截图路径，截图失败时返回None
+        """
+        try:
+            screenshot = await screenshot_service.capture_async(self.page, name)
+        except Exception as e:
+            logger.warning("截图失败: %s", e)
+            return None
+        logger.info("截图保存至: %s", screenshot.path)
+        return screenshot.path
+
+    # 等待方法
+    async def wait_for_selector(
+        self,
+        selector: str,
+        timeout: int = WaitConfig.DEFAULT_TIMEOUT,
+        state: str = None,
+    ):
+        """
+        等待元素出现
+        :param selector: 元素选择器
+        :param timeout: 超时时间(毫秒)
+        """
+        logger.info("等待元素出现: %s", selector)
+        return await self.get_context().wait_for_selector(
+            selector, timeout=timeout, state=state
+        )
+
+    async def wait_for_element_state(
+        self,
+        selector: str,
+        state: str = ElementState.VISIBLE,
+        timeout: int = WaitConfig.DEFAULT_TIMEOUT,
+    ):
+        """
+        等待元素达到指定状态
+        :param selector: 元素选择器
+        :param state: 期望的状态
+        :param timeout: 超时时间(毫秒)
+        """
+        logger.info("等待元素 %s 达到状态: %s", selector, state)
+        await self._get_element(selector).wait_for(state=state, timeout=timeout)
+
+    async def wait_for_grid_rows(
+        self,
+        row_selector: str,
+        empty_selector: str,
+        timeout: int = WaitConfig.DEFAULT_TIMEOUT,
+    ) -> int:
+        """
+        等待表格渲染出数据行或无数据提示，无数据时不必等到超时
+        :param row_selector: 数据行选择器
+        :param empty_selector: 无数据提示选择器
+        :param timeout: 超时时间(毫秒)
+        :return: 数据行数，显示无数据提示时返回0
+        """
+        logger.info("等待表格结果: %s", row_selector)
+        handle = await self.get_context().wait_for_function(
+            GRID_RESULT_SCRIPT,
+            arg={"rowSelector": row_selector, "emptySelector": empty_selector},
+            timeout=timeout,
+        )
+        return (await handle.json_value())["rows"]
+
+    # 请求响应相关方法
+    async def perform_and_wait_for_response(
+        self,
+        action: Callable[[], Awaitable[Any]],
+        url_or_predicate: Union[str, Pattern, Callable[[Response], bool]],
+        timeout: int = WaitConfig.RESPONSE_TIMEOUT,
+    ) -> Response:
+        """
+        执行操作并等待其触发的ajax或回发响应，收到响应后等待页面重新渲染完成
+        :param action: 触发请求的异步操作
+        :param url_or_predicate: 请求地址的正则表达式(见ResponsePattern)，或接收响应对象返回是否匹配的函数
+        :param timeout: 等待响应的超时时间(毫秒)
+        :return: 响应对象
+        """
+        async with self.page.expect_response(
+            BasePage.response_matcher(url_or_predicate), timeout=timeout
+        ) as response_info:
+            await action()
+        response = await response_info.value
+        logger.info("收到响应: %s %s", response.status, response.url)
+        await self.stabilize_page()
+        return response
+
+    async def click_and_wait_for_response(
+        self,
+        selector: str,
+        url_or_predicate: Union[str, Pattern, Callable[[Response], bool]],
+        timeout: int = WaitConfig.RESPONSE_TIMEOUT,
+    ) -> Response:
+        """
+        点击元素并等待其触发的ajax或回发响应
+        :param selector: 元素选择器
+        :param url_or_predicate: 请求地址的正则表达式(见ResponsePattern)，或接收响应对象返回是否匹配的函数
+        :param timeout: 等待响应的超时时间(毫秒)
+        :return: 响应对象
+        """
+        return await self.perform_and_wait_for_response(
+            lambda: self.click(selector), url_or_predicate, timeout
+        )
@@ -0,0 +1,49 @@
+"""
+异步页面导航组件，与Navigator流程一致
+"""
+
+from typing import Awaitable, Callable, Optional
+
+from pages.base.async_base_page import AsyncBasePage
+from pages.base.base_config import WaitConfig
+from pages.base.navigator import Navigator
+from pages.base.scripts import OPEN_MENU_LINK_SCRIPT
+from utils.logger import logger
+
+
+class AsyncNavigator:
+    """异步页面导航组件类，找不到页面的菜单链接时回退为逐级点击菜单"""
+
+    def __init__(self, page_object: AsyncBasePage):
+        """
+        初始化异步页面导航组件
+        :param page_object: 异步页面对象
+        """
+        self.page_object = page_object
+
+    async def open(
+        self,
+        url: str,
+        menu: Optional[Callable[[], Awaitable[None]]] = None,
+        timeout: int = WaitConfig.NAVIGATION_TIMEOUT,
+    ) -> str:
+        """
+        在主页面中打开页面标签，返回主文档并直接触发页面的菜单链接
+        :param url: 页面地址(见各页面定位器中的*_URL)
+        :param menu: 找不到菜单链接时逐级点击菜单打开页面的异步方法
+        :param timeout: 等待标签页iframe出现的超时时间(毫秒)
+        :return: 标签页iframe选择器
+        """
+        po = self.page_object
+        po.exit_frame()
+        logger.info("打开页面: %s", url)
+        link_selector = Navigator.url_selector("a", "href", url)
+        if not await po.page.evaluate(OPEN_MENU_LINK_SCRIPT, link_selector):
+            if menu is None:
+                raise Exception(f"未找到页面的菜单链接: {url}")
+            logger.info("未找到菜单链接，逐级点击菜单打开: %s", url)
+            await menu()
+
+        frame_selector = Navigator.url_selector("iframe", "src", url)
+        await po.wait_for_selector(frame_selector, timeout=timeout)
+        return frame_selector
@@ -0,0 +1,147 @@
+"""
+异步FineUI选择窗口(SelectGrid.aspx)组件，与SelectGridPicker流程一致
+"""
+
+import asyncio
+from typing import Dict, List
+
+from pages.base.async_base_page import AsyncBasePage
+from pages.base.base_config import WaitConfig, ElementState, ResponsePattern
+from pages.base.scripts import (
+    READ_PICKER_FIELD_SCRIPT,
+    APPLY_PICKER_FIELD_SCRIPT,
+)
+from pages.base.select_grid_picker import SelectGridPicker
+from locators.select_grid_locators import SelectGridLocators
+from utils.logger import logger
+from utils.picker_cache import picker_cache
+
+
+class AsyncSelectGridPicker:
+    """异步选择窗口组件类，每一步都等待页面真实的就绪信号，不使用固定等待"""
+
+    def __init__(self, page_object: AsyncBasePage):
+        """
+        初始化异步选择窗口组件
+        :param page_object: 打开选择窗口的异步页面对象，选择窗口在其当前所在的iframe内打开
+        """
+        self.page_object = page_object
+        self.locators = SelectGridLocators()
+
+    async def select(self, trigger: str, text: str, search: bool = True):
+        """
+        选中文本完全匹配的记录，已缓存回填值时直接回填，否则打开选择窗口选择并确定后缓存回填值
+        :param trigger: 打开选择窗口的搜索图标选择器
+        :param text: 要选择的记录文本
+        :param search: 记录不在当前表格中时是否按文本搜索
+        """
+        await self.select_many(trigger, [text], search)
+
+    async def select_many(self, trigger: str, texts: List[str], search: bool = True):
+        """
+        在一次选择窗口会话中依次选中多条记录后确定，多条记录时点击行首复选框，当前表格中没有的记录先搜索再选择
+        (FineUI重新加载表格后会清空之前选中的行)，确定后检查每条记录都已回填到字段中；
+        多条记录的回填值拆分为每条记录各自的回填值后缓存，单条记录已缓存时直接回填
+        :param trigger: 打开选择窗口的搜索图标选择器
+        :param texts: 要选择的记录文本列表
+        :param search: 记录不在当前表格中时是否按文本搜索
+        """
+        po = self.page_object
+        texts = list(dict.fromkeys(texts))
+        label = ",".join(texts)
+        scope = f"{po.base_url}|{trigger}"
+        # 多条记录的组合几乎不会重复出现，不按组合缓存
+        cacheable = len(texts) == 1
+        cached = await asyncio.to_thread(picker_cache.get, scope, label) if cacheable else None
+        try:
+            if cached and await self._apply_cached(trigger, label, cached):
+                return
+
+            logger.info("打开选择窗口选择: %s", label)
+            await po.click(trigger)
+
+            async with po.frame_context(
+                self.locators.IFRAME, timeout=WaitConfig.RESPONSE_TIMEOUT, nested=True
+            ):
+                await self.wait_for_rows()
+                for text in texts:
+                    await self._choose(text, search, multi=len(texts) > 1)
+                await po.click(self.locators.CONFIRM_BUTTON)
+
+            # 确定后选择窗口关闭，回填的值已写入表单
+            await po.wait_for_element_state(
+                self.locators.IFRAME, ElementState.HIDDEN, timeout=WaitConfig.RESPONSE_TIMEOUT
+            )
+
+            values = await po.get_context().evaluate(READ_PICKER_FIELD_SCRIPT, trigger)
+            missing = SelectGridPicker.missing_texts(values, texts)
+            if missing:
+                raise Exception(f"选择窗口确定后字段中缺少记录: {','.join(missing)}")
+            logger.info("已选择: %s", label)
+
+            # 多条记录按逗号拆分后分别缓存，供单条选择和后台造数复用
+            entries = {label: values} if cacheable else SelectGridPicker.split_values(values, texts)
+            await asyncio.to_thread(picker_cache.put_many, scope, entries)
+
+        except Exception as e:
+            # 缓存的回填值无法写入且重新选择失败时删除缓存，重新选择成功时由put直接覆盖，只写一次缓存文件
+            if cached:
+                await asyncio.to_thread(picker_cache.invalidate, scope, label)
+            logger.error("选择窗口选择 %s 时发生错误: %s", label, e)
+            await po.take_screenshot("select_grid_error")
+            raise
+
+    async def _choose(self, text: str, search: bool, multi: bool = False):
+        """
+        在已打开的选择窗口中选中一条记录，等待该行变为选中状态
+        FineUI表格中点击行会替换已选中的行，多选时点击行首复选框，保留之前选中的行
+        :param text: 记录文本
+        :param search: 记录不在当前表格中时是否按文本搜索
+        :param multi: 是否保留已选中的记录
+        """
+        po = self.page_object
+        cell = SelectGridPicker.cell_selector(text)
+        if not await po.get_element_count(cell):
+            if not search or not await self.search(text):
+                raise Exception(f"选择窗口中没有记录: {text}")
+        await po.click(SelectGridPicker.cell_selector(text, self.locators.CHECKER) if multi else cell)
+        await po.wait_for_selector(SelectGridPicker.cell_selector(text, self.locators.SELECTED_CELL))
+
+    async def _apply_cached(self, trigger: str, label: str, values: Dict[str, str]) -> bool:
+        """
+        用缓存的回填值直接回填字段，不打开选择窗口，也不向服务端校验记录
+        :param trigger: 搜索图标选择器
+        :param label: 选择的记录文本
+        :param values: 缓存的字段内输入框name -> 值
+        :return: 是否已回填，字段结构已变化(输入框不存在或写入后值不一致)时返回False
+        """
+        applied = await self.page_object.get_context().evaluate(
+            APPLY_PICKER_FIELD_SCRIPT, {"triggerSelector": trigger, "values": values}
+        )
+        if applied:
+            logger.info("使用缓存回填: %s", label)
+        else:
+            logger.info("选择窗口缓存与字段不一致，重新打开选择窗口: %s", label)
+        return bool(applied)
+
+    async def wait_for_rows(self) -> int:
+        """
+        等待选择窗口表格加载完成
+        :return: 数据行数
+        """
+        return await self.page_object.wait_for_grid_rows(
+            self.locators.ROWS, self.locators.EMPTY, timeout=WaitConfig.RESPONSE_TIMEOUT
+        )
+
+    async def search(self, keyword: str) -> int:
+        """
+        在选择窗口中搜索，等待表格数据响应后返回
+        :param keyword: 搜索关键字
+        :return: 数据行数
+        """
+        po = self.page_object
+        await po.fill(self.locators.SEARCH_INPUT, keyword)
+        await po.click_and_wait_for_response(
+            self.locators.SEARCH_BUTTON, ResponsePattern.SELECT_GRID
+        )
+        return await self.wait_for_rows()
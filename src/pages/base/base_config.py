@@ -11,7 +11,20 @@ class WaitConfig:
 
     DEFAULT_TIMEOUT: int = 10000  # 默认超时时间(毫秒)
     NAVIGATION_TIMEOUT: int = 30000  # 导航超时时间(毫秒)
-    STABILIZE_TIMEOUT: int = 1000  # 页面稳定等待时间(毫秒)
+    STABILIZE_TIMEOUT: int = 1000  # 页面稳定最长等待时间(毫秒)
+    STABILIZE_QUIET_PERIOD: int = 100  # 页面无变化持续多久视为稳定(毫秒)
+    STABILIZE_POLL_INTERVAL: int = 50  # 页面稳定检测轮询间隔(毫秒)
+    RESPONSE_TIMEOUT: int = 30000  # 等待ajax或回发响应的超时时间(毫秒)
+
+
+@dataclass
+class ResponsePattern:
+    """FineUI页面请求地址的正则表达式，用于等待操作触发的ajax或回发响应"""
+
+    LIST: str = r"Loadlists\.aspx"  # 列表搜索、删除
+    FORM: str = r"LoadForms\.aspx"  # 表单保存
+    DETAIL: str = r"LoadForms\.aspx\?.*Soflag=1"  # 详情页面
+    SELECT_GRID: str = r"SelectGrid\.aspx"  # 选择窗口数据
 
 
 @dataclass
@@ -3,14 +3,29 @@
 """
 
 import os
-import time
+import re
 from contextlib import contextmanager
-from typing import Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Pattern, Union
 
-from playwright.sync_api import expect, Page, Frame, Locator
+from playwright.sync_api import expect, Page, Frame, Locator, Response
 from utils.logger import logger
+from utils.screenshot_service import screenshot_service
 from config.config import SCREENSHOT_PATH, BASE_URL
 from pages.base.base_config import WaitConfig, ElementState, LoadState
+from pages.base.page_stability import PageStability
+from pages.base.locator_cache import LocatorCache
+from pages.base.frame_cache import FrameCache
+from pages.base.option_catalog import Option, option_catalog, match_option
+from pages.base.scripts import (
+    FILL_MANY_SCRIPT,
+    READ_VALUES_SCRIPT,
+    GRID_RESULT_SCRIPT,
+    READ_OPTIONS_SCRIPT,
+    APPLY_OPTIONS_SCRIPT,
+)
+
+# 视为ajax或回发的请求类型，排除脚本、样式、图片等静态资源
+AJAX_RESOURCE_TYPES = ("xhr", "fetch", "document")
 
 
 class BasePage:
@@ -23,7 +38,10 @@ class BasePage:
         """
         self.page = page
         self.base_url = BASE_URL
-        self.current_frame: Optional[Frame] = None
+        self.stability = PageStability()
+        self.locator_cache = LocatorCache.for_page(page)
+        self.frame_cache = FrameCache.for_page(page)
+        self._frame_stack: List[Frame] = []
         self._ensure_screenshot_dir()
 
     def _ensure_screenshot_dir(self):
@@ -31,20 +49,32 @@ class BasePage:
         if not os.path.exists(SCREENSHOT_PATH):
             os.makedirs(SCREENSHOT_PATH)
 
+    @property
+    def current_frame(self) -> Optional[Frame]:
+        """当前所在的iframe，位于主文档时为None"""
+        return self._frame_stack[-1] if self._frame_stack else None
+
     @contextmanager
     def frame_context(
-        self, frame_selector: str, timeout: int = WaitConfig.DEFAULT_TIMEOUT
+        self,
+        frame_selector: str,
+        timeout: int = WaitConfig.DEFAULT_TIMEOUT,
+        nested: bool = False,
     ):
         """
         iframe上下文管理器
         :param frame_selector: iframe选择器
         :param timeout: 超时时间(毫秒)
+        :param nested: 是否在当前iframe内进入嵌套iframe，为True时退出后返回上一层，否则返回主文档
         """
+        saved_stack = list(self._frame_stack)
         try:
-            self.enter_frame(frame_selector, timeout)
-            yield
+            yield self.enter_frame(frame_selector, timeout, nested=nested)
         finally:
-            self.exit_frame()
+            if nested:
+                self._frame_stack[:] = saved_stack
+            else:
+                self.exit_frame()
 
     def get_context(self) -> Union[Page, Frame]:
         """
@@ -53,18 +83,13 @@ class BasePage:
         """
         return self.current_frame if self.current_frame else self.page
 
-    def _get_element(
-        self, selector: str, timeout: int = WaitConfig.DEFAULT_TIMEOUT
-    ) -> Locator:
+    def _get_element(self, selector: str) -> Locator:
         """
-        获取元素定位器
+        获取元素定位器，元素等待由后续操作自动完成
         :param selector: 元素选择器
-        :param timeout: 超时时间(毫秒)
         :return: 元素定位器
         """
-        context = self.get_context()
-        context.wait_for_selector(selector, timeout=timeout)
-        return context.locator(selector)
+        return self.locator_cache.get(self.get_context(), selector)
 
     # 页面导航相关方法
     def navigate(self, url: Optional[str] = None):
@@ -73,7 +98,7 @@ class BasePage:
         :param url: 目标URL，默认为None，使用base_url
         """
         target_url = url if url else self.base_url
-        logger.info(f"导航到: {target_url}")
+        logger.info("导航到: %s", target_url)
         self.page.goto(target_url)
 
     def reload_page(self):
@@ -92,14 +117,14 @@ class BasePage:
         self.page.go_forward()
 
     # 页面状态相关方法
-    def stabilize_page(self, timeout: int = WaitConfig.STABILIZE_TIMEOUT):
+    def stabilize_page(self, timeout: int = WaitConfig.STABILIZE_TIMEOUT) -> bool:
         """
-        稳定页面，防止画面偏移
-        :param timeout: 等待时间(毫秒)
+        稳定页面，防止画面偏移，等待DOM变更静默、ajax请求结束且布局不再变化
+        :param timeout: 最长等待时间(毫秒)，页面稳定后立即返回
+        :return: 页面是否在最长等待时间内稳定
         """
         logger.info("稳定页面位置")
-        self.page.evaluate("window.scrollTo(0, 0)")
-        self.page.wait_for_timeout(timeout)
+        return self.stability.wait_until_stable(self.get_context(), timeout)
 
     def wait_for_navigation(self, timeout: int = WaitConfig.NAVIGATION_TIMEOUT):
         """
@@ -120,29 +145,62 @@ class BasePage:
 
     # iframe 相关方法
     def enter_frame(
-        self, frame_selector: str, timeout: int = WaitConfig.DEFAULT_TIMEOUT
+        self,
+        frame_selector: str,
+        timeout: int = WaitConfig.DEFAULT_TIMEOUT,
+        nested: bool = False,
     ) -> Frame:
         """
         进入iframe
         :param frame_selector: iframe的选择器
         :param timeout: 超时时间(毫秒)
+        :param nested: 是否在当前iframe内进入嵌套iframe，默认从主文档进入
+        :return: iframe对象
+        """
+        logger.info("进入iframe: %s", frame_selector)
+        if not nested:
+            self._frame_stack.clear()
+
+        frame = self._resolve_frame(frame_selector, timeout)
+        self._frame_stack.append(frame)
+        return frame
+
+    def _resolve_frame(self, frame_selector: str, timeout: int) -> Frame:
+        """
+        在当前上下文中解析iframe，已解析且仍有效的iframe直接复用
+        :param frame_selector: iframe的选择器
+        :param timeout: 超时时间(毫秒)
         :return: iframe对象
         """
-        logger.info(f"进入iframe: {frame_selector}")
-        frame = self.page.wait_for_selector(frame_selector, timeout=timeout)
-        self.current_frame = frame.content_frame()
+        parent = self.current_frame or self.page.main_frame
+        frame = self.frame_cache.get(parent, frame_selector)
+        if frame:
+            return frame
 
-        if not self.current_frame:
+        element = parent.wait_for_selector(frame_selector, timeout=timeout)
+        frame = element.content_frame() if element else None
+        if not frame:
             raise Exception(f"无法获取 iframe: {frame_selector}")
 
-        return self.current_frame
+        self.frame_cache.put(parent, frame_selector, frame)
+        return frame
 
     def exit_frame(self):
         """退出iframe，返回主文档"""
         logger.info("退出iframe，返回主文档")
-        self.current_frame = None
+        self._frame_stack.clear()
         return self.page
 
+    def pop_frame(self) -> Union[Page, Frame]:
+        """
+        退出当前iframe，返回上一层iframe或主文档
+        :return: 返回后的上下文
+        """
+        logger.info("退出当前iframe，返回上一层")
+        if self._frame_stack:
+            self._frame_stack.pop()
+        return self.get_context()
+
     # 元素操作方法
     def click(self, selector: str, timeout: int = WaitConfig.DEFAULT_TIMEOUT):
         """
@@ -150,9 +208,9 @@ class BasePage:
         :param selector: 元素选择器
         :param timeout: 超时时间(毫秒)
         """
-        logger.info(f"点击元素: {selector}")
+        logger.info("点击元素: %s", selector)
         self.stabilize_page()
-        self._get_element(selector, timeout).click()
+        self._get_element(selector).click(timeout=timeout)
 
     def fill(self, selector: str, text: str, timeout: int = WaitConfig.DEFAULT_TIMEOUT):
         """
@@ -161,9 +219,58 @@ class BasePage:
         :param text: 要填入的文本
         :param timeout: 超时时间(毫秒)
         """
-        logger.info(f"在 {selector} 中填入: {text}")
+        logger.info("在 %s 中填入: %s", selector, text)
         self.stabilize_page()
-        self._get_element(selector, timeout).fill(text)
+        self._get_element(selector).fill(text, timeout=timeout)
+
+    def fill_many(
+        self, mapping: Dict[str, str], timeout: int = WaitConfig.DEFAULT_TIMEOUT
+    ):
+        """
+        批量填写输入框，一次调用写入全部字段并触发FineUI所需的input/change/blur事件，
+        随后一次性回读校验，无法批量写入或校验不一致的字段退回逐个填写
+        :param mapping: 元素选择器到文本的映射，值为None的字段会被忽略
+        :param timeout: 超时时间(毫秒)
+        """
+        fields = {
+            selector: str(text) for selector, text in mapping.items() if text is not None
+        }
+        if not fields:
+            return
+
+        logger.info("批量填写 %s 个字段", len(fields))
+        batch = {s: t for s, t in fields.items() if self._is_css_selector(s)}
+        fallback = [s for s in fields if s not in batch]
+
+        if batch:
+            context = self.get_context()
+            # 等待首个字段出现，确保表单已渲染
+            self._get_element(next(iter(batch))).wait_for(
+                state=ElementState.ATTACHED, timeout=timeout
+            )
+            skipped = context.evaluate(FILL_MANY_SCRIPT, list(batch.items()))
+            selectors = [s for s in batch if s not in skipped]
+            actual_values = context.evaluate(READ_VALUES_SCRIPT, selectors)
+            mismatched = [
+                s for s, actual in zip(selectors, actual_values) if actual != batch[s]
+            ]
+            if skipped or mismatched:
+                logger.warning(
+                    "以下字段批量填写失败，改为逐个填写: %s", skipped + mismatched
+                )
+            fallback.extend(skipped + mismatched)
+
+        for selector in fallback:
+            self.fill(selector, fields[selector], timeout)
+
+    @staticmethod
+    def _is_css_selector(selector: str) -> bool:
+        """
+        判断选择器是否为可直接在浏览器中查询的CSS选择器
+        :param selector: 元素选择器
+        :return: 是否为CSS选择器
+        """
+        return ">>" not in selector and not re.match(r"^[\w-]+=", selector)
 
     def select_option(
         self,
@@ -174,41 +281,81 @@ class BasePage:
         """
         选择下拉选项（支持非标准下拉框）
         :param selector: 元素选择器
-        :param value: 选项的value值
+        :param value: 选项的显示文本或value值
         :param timeout: 超时时间(毫秒)
         """
-        option_text = value
-        logger.info(f"在 {selector} 中选择选项: {option_text}")
-
-        # 先等待输入框可见
-        self.wait_for_selector(selector, timeout)
+        self.select_options({selector: value}, timeout)
 
-        # 先填入文本
-        self.fill(selector, option_text)
+    def select_options(
+        self, mapping: Dict[str, Optional[str]], timeout: int = WaitConfig.DEFAULT_TIMEOUT
+    ):
+        """
+        批量选择下拉选项，一次调用读取全部下拉框的选项并缓存到表单的选项目录，
+        随后按选项值直接设置；无法读取选项或设置失败的下拉框退回展开下拉列表逐个选择
+        :param mapping: 元素选择器到选项显示文本或value值的映射，值为None的下拉框会被忽略
+        :param timeout: 超时时间(毫秒)
+        :raises ValueError: 存在不是有效选项的值时，在选择任何选项之前抛出
+        """
+        fields = {
+            selector: str(text) for selector, text in mapping.items() if text is not None
+        }
+        if not fields:
+            return
+
+        batch = {s: t for s, t in fields.items() if self._is_css_selector(s)}
+        choices: Dict[str, Option] = {}
+        failed: List[str] = []
+        if batch:
+            context = self.get_context()
+            form_key = option_catalog.form_key(context.url)
+            # 等待首个下拉框出现，确保表单已渲染
+            self._get_element(next(iter(batch))).wait_for(
+                state=ElementState.ATTACHED, timeout=timeout
+            )
+            missing = option_catalog.missing(form_key, list(batch))
+            if missing:
+                option_catalog.update(
+                    form_key, context.evaluate(READ_OPTIONS_SCRIPT, missing)
+                )
+
+            choices, invalid = option_catalog.resolve(form_key, batch)
+            if invalid:
+                raise ValueError(
+                    "以下下拉框的值不是有效选项: "
+                    + ", ".join(f"{s}={t}" for s, t in invalid.items())
+                )
+            if choices:
+                logger.info("按选项目录设置 %s 个下拉框", len(choices))
+                failed = context.evaluate(
+                    APPLY_OPTIONS_SCRIPT,
+                    [[s, option["value"], option["text"]] for s, option in choices.items()],
+                )
+                if failed:
+                    logger.warning("以下下拉框直接设置失败，改为展开下拉列表选择: %s", failed)
+
+        for selector, text in fields.items():
+            if selector not in choices or selector in failed:
+                self._pick_option(selector, text, timeout)
+
+    def _pick_option(self, selector: str, text: str, timeout: int):
+        """
+        填入文本后在展开的下拉列表中点击选项，依次按完全匹配和唯一的包含关系匹配
+        :param selector: 元素选择器
+        :param text: 选项的显示文本
+        :param timeout: 超时时间(毫秒)
+        """
+        logger.info("在 %s 中选择选项: %s", selector, text)
 
-        # 构建下拉选项的选择器
-        dropdown_selector = "li"
+        # 先填入文本，填入操作会自动等待输入框可见
+        self.fill(selector, text, timeout)
 
-        try:
-            # 首先尝试精确匹配
-            option_selector = f"{dropdown_selector} >> text='{option_text}'"
-            logger.info(f"尝试精确匹配选项: {option_text}")
-            option = self.get_context().locator(option_selector).first
-            option.wait_for(timeout=timeout)
-            option.click()
-        except Exception:
-            # 如果精确匹配失败，尝试模糊匹配
-            logger.info(f"精确匹配失败，尝试模糊匹配: {option_text}")
-            options = self.get_context().locator(dropdown_selector).all()
-            found = False
-            for option in options:
-                if option_text in option.text_content():
-                    option.click()
-                    found = True
-                    break
-
-            if not found:
-                raise Exception(f"未找到包含文本 '{option_text}' 的选项")
+        items = self._get_element("li >> visible=true")
+        items.first.wait_for(timeout=timeout)
+        texts = [t.strip() for t in items.all_text_contents()]
+        option = match_option([{"value": t, "text": t} for t in texts], text)
+        if option is None:
+            raise Exception(f"未找到包含文本 '{text}' 的选项")
+        items.nth(texts.index(option["text"])).click()
 
     def get_text(self, selector: str, timeout: int = WaitConfig.DEFAULT_TIMEOUT) -> str:
         """
@@ -217,10 +364,12 @@ class BasePage:
         :param timeout: 超时时间(毫秒)
         :return: 元素文本
         """
-        logger.info(f"获取元素 {selector} 的文本")
-        element = self._get_element(selector, timeout)
+        logger.info("获取元素 %s 的文本", selector)
+        element = self._get_element(selector)
         return (
-            element.input_value() if element.is_editable() else element.text_content()
+            element.input_value(timeout=timeout)
+            if element.is_editable(timeout=timeout)
+            else element.text_content(timeout=timeout)
         )
 
     def get_input_value(
@@ -232,8 +381,8 @@ class BasePage:
         :param timeout: 超时时间(毫秒)
         :return: 输入框的值
         """
-        logger.info(f"获取输入框 {selector} 的值")
-        return self._get_element(selector, timeout).input_value()
+        logger.info("获取输入框 %s 的值", selector)
+        return self._get_element(selector).input_value(timeout=timeout)
 
     # 元素状态检查方法
     def is_visible(
@@ -249,7 +398,7 @@ class BasePage:
             expect(self._get_element(selector)).to_be_visible(timeout=timeout)
             return True
         except Exception as e:
-            logger.error(f"元素 {selector} 不可见: {e}")
+            logger.error("元素 %s 不可见: %s", selector, e)
             return False
 
     def is_value_equal(
@@ -266,21 +415,31 @@ class BasePage:
             expect(self._get_element(selector)).to_have_value(value, timeout=timeout)
             return True
         except Exception as e:
-            logger.error(f"元素 {selector} 的值不等于 {value}: {e}")
+            logger.error("元素 %s 的值不等于 %s: %s", selector, value, e)
             return False
 
+    def get_element_count(self, selector: str) -> int:
+        """
+        获取当前匹配的元素数量，不等待元素出现
+        :param selector: 元素选择器
+        :return: 元素数量
+        """
+        return self._get_element(selector).count()
+
     # 截图方法
-    def take_screenshot(self, name: str = "screenshot") -> str:
+    def take_screenshot(self, name: str = "screenshot") -> Optional[str]:
         """
-        截取屏幕截图
+        截取屏幕截图，编码和写盘在后台完成，截图失败不会影响调用方
         :param name: 截图名称
-        :return: 截图路径
+        :return: 截图路径，截图失败时返回None
         """
-        timestamp = time.strftime("%Y%m%d%H%M%S")
-        file_path = os.path.join(SCREENSHOT_PATH, f"{name}_{timestamp}.png")
-        logger.info(f"截图保存至: {file_path}")
-        self.page.screenshot(path=file_path)
-        return file_path
+        try:
+            screenshot = screenshot_service.capture(self.page, name)
+        except Exception as e:
+            logger.warning("截图失败: %s", e)
+            return None
+        logger.info("截图保存至: %s", screenshot.path)
+        return screenshot.path
 
     # 等待方法
     def wait_for_selector(
@@ -294,7 +453,7 @@ class BasePage:
         :param selector: 元素选择器
         :param timeout: 超时时间(毫秒)
         """
-        logger.info(f"等待元素出现: {selector}")
+        logger.info("等待元素出现: %s", selector)
         return self.get_context().wait_for_selector(
             selector, timeout=timeout, state=state
         )
@@ -311,5 +470,83 @@ class BasePage:
         :param state: 期望的状态
         :param timeout: 超时时间(毫秒)
         """
-        logger.info(f"等待元素 {selector} 达到状态: {state}")
+        logger.info("等待元素 %s 达到状态: %s", selector, state)
         self._get_element(selector).wait_for(state=state, timeout=timeout)
+
+    def wait_for_grid_rows(
+        self,
+        row_selector: str,
+        empty_selector: str,
+        timeout: int = WaitConfig.DEFAULT_TIMEOUT,
+    ) -> int:
+        """
+        等待表格渲染出数据行或无数据提示，无数据时不必等到超时
+        :param row_selector: 数据行选择器
+        :param empty_selector: 无数据提示选择器
+        :param timeout: 超时时间(毫秒)
+        :return: 数据行数，显示无数据提示时返回0
+        """
+        logger.info("等待表格结果: %s", row_selector)
+        handle = self.get_context().wait_for_function(
+            GRID_RESULT_SCRIPT,
+            arg={"rowSelector": row_selector, "emptySelector": empty_selector},
+            timeout=timeout,
+        )
+        return handle.json_value()["rows"]
+
+    # 请求响应相关方法
+    @staticmethod
+    def response_matcher(
+        url_or_predicate: Union[str, Pattern, Callable[[Any], bool]]
+    ) -> Callable[[Any], bool]:
+        """
+        构建响应匹配函数
+        :param url_or_predicate: 请求地址的正则表达式，或接收响应对象返回是否匹配的函数
+        :return: 响应匹配函数
+        """
+        if callable(url_or_predicate):
+            return url_or_predicate
+        pattern = re.compile(url_or_predicate)
+        return lambda response: (
+            response.request.resource_type in AJAX_RESOURCE_TYPES
+            and pattern.search(response.url) is not None
+        )
+
+    def perform_and_wait_for_response(
+        self,
+        action: Callable[[], Any],
+        url_or_predicate: Union[str, Pattern, Callable[[Response], bool]],
+        timeout: int = WaitConfig.RESPONSE_TIMEOUT,
+    ) -> Response:
+        """
+        执行操作并等待其触发的ajax或回发响应，收到响应后等待页面重新渲染完成
+        :param action: 触发请求的操作
+        :param url_or_predicate: 请求地址的正则表达式(见ResponsePattern)，或接收响应对象返回是否匹配的函数
+        :param timeout: 等待响应的超时时间(毫秒)
+        :return: 响应对象
+        """
+        with self.page.expect_response(
+            self.response_matcher(url_or_predicate), timeout=timeout
+        ) as response_info:
+            action()
+        response = response_info.value
+        logger.info("收到响应: %s %s", response.status, response.url)
+        self.stabilize_page()
+        return response
+
+    def click_and_wait_for_response(
+        self,
+        selector: str,
+        url_or_predicate: Union[str, Pattern, Callable[[Response], bool]],
+        timeout: int = WaitConfig.RESPONSE_TIMEOUT,
+    ) -> Response:
+        """
+        点击元素并等待其触发的ajax或回发响应
+        :param selector: 元素选择器
+        :param url_or_predicate: 请求地址的正则表达式(见ResponsePattern)，或接收响应对象返回是否匹配的函数
+        :param timeout: 等待响应的超时时间(毫秒)
+        :return: 响应对象
+        """
+        return self.perform_and_wait_for_response(
+            lambda: self.click(selector), url_or_predicate, timeout
+        )
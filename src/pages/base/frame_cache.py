@@ -0,0 +1,84 @@
+"""
+iframe解析缓存，按(父frame, iframe选择器)缓存已解析的Frame对象
+"""
+
+from typing import Dict, Optional, Tuple
+
+from playwright.sync_api import Page, Frame
+
+
+class FrameCache:
+    """iframe解析缓存类，iframe导航或卸载时相关缓存自动失效"""
+
+    # 缓存保存在页面对象自身的属性上，不使用全局表，页面关闭后随页面一起回收
+    _PAGE_ATTR = "_frame_cache"
+
+    def __init__(self, page: Page):
+        """
+        初始化iframe解析缓存
+        :param page: playwright页面对象
+        """
+        self._cache: Dict[Tuple[Frame, str], Frame] = {}
+        page.on("framenavigated", self.invalidate)
+        page.on("framedetached", self.invalidate)
+        page.once("close", self._on_close)
+
+    @classmethod
+    def for_page(cls, page: Page) -> "FrameCache":
+        """
+        获取页面共享的iframe解析缓存
+        :param page: playwright页面对象
+        :return: iframe解析缓存
+        """
+        cache = getattr(page, cls._PAGE_ATTR, None)
+        if cache is None:
+            cache = cls(page)
+            setattr(page, cls._PAGE_ATTR, cache)
+        return cache
+
+    def _on_close(self, page: Page):
+        """
+        页面关闭时移除事件监听并清空缓存，解除页面与缓存之间的引用
+        :param page: 已关闭的playwright页面对象
+        """
+        page.remove_listener("framenavigated", self.invalidate)
+        page.remove_listener("framedetached", self.invalidate)
+        self.clear()
+
+    def get(self, parent: Frame, selector: str) -> Optional[Frame]:
+        """
+        获取已解析的iframe
+        :param parent: 父frame
+        :param selector: iframe选择器
+        :return: 已解析且仍然有效的iframe，不存在时返回None
+        """
+        key = (parent, selector)
+        frame = self._cache.get(key)
+        if frame is not None and (frame.is_detached() or frame.url in ("", "about:blank")):
+            del self._cache[key]
+            return None
+        return frame
+
+    def put(self, parent: Frame, selector: str, frame: Frame):
+        """
+        缓存已解析的iframe
+        :param parent: 父frame
+        :param selector: iframe选择器
+        :param frame: 解析得到的iframe
+        """
+        self._cache[(parent, selector)] = frame
+
+    def invalidate(self, frame: Frame):
+        """
+        使与frame相关的缓存失效，包括以其为父frame的条目和解析结果为其本身的条目
+        :param frame: 发生导航或被卸载的frame
+        """
+        self._cache = {
+            key: cached
+            for key, cached in self._cache.items()
+            if key[0] is not frame and cached is not frame
+        }
+
+    def clear(self):
+        """清空缓存"""
+        self._cache.clear()
@@ -0,0 +1,72 @@
+"""
+定位器缓存，按(frame, selector)缓存Locator，避免重复创建定位器
+"""
+
+from typing import Dict, Union
+
+from playwright.sync_api import Page, Frame, Locator
+
+
+class LocatorCache:
+    """定位器缓存类，iframe导航或卸载时对应的缓存自动失效"""
+
+    # 缓存保存在页面对象自身的属性上，不使用全局表，页面关闭后随页面一起回收
+    _PAGE_ATTR = "_locator_cache"
+
+    def __init__(self, page: Page):
+        """
+        初始化定位器缓存
+        :param page: playwright页面对象
+        """
+        self._cache: Dict[Frame, Dict[str, Locator]] = {}
+        page.on("framenavigated", self.invalidate)
+        page.on("framedetached", self.invalidate)
+        page.once("close", self._on_close)
+
+    @classmethod
+    def for_page(cls, page: Page) -> "LocatorCache":
+        """
+        获取页面共享的定位器缓存，同一页面上的页面对象共用一份缓存
+        :param page: playwright页面对象
+        :return: 定位器缓存
+        """
+        cache = getattr(page, cls._PAGE_ATTR, None)
+        if cache is None:
+            cache = cls(page)
+            setattr(page, cls._PAGE_ATTR, cache)
+        return cache
+
+    def _on_close(self, page: Page):
+        """
+        页面关闭时移除事件监听并清空缓存，解除页面与缓存之间的引用
+        :param page: 已关闭的playwright页面对象
+        """
+        page.remove_listener("framenavigated", self.invalidate)
+        page.remove_listener("framedetached", self.invalidate)
+        self.clear()
+
+    def get(self, context: Union[Page, Frame], selector: str) -> Locator:
+        """
+        获取元素定位器
+        :param context: 页面或iframe
+        :param selector: 元素选择器
+        :return: 元素定位器
+        """
+        frame = getattr(context, "main_frame", context)
+        locators = self._cache.setdefault(frame, {})
+        locator = locators.get(selector)
+        if locator is None:
+            locator = frame.locator(selector)
+            locators[selector] = locator
+        return locator
+
+    def invalidate(self, frame: Frame):
+        """
+        使iframe对应的缓存失效
+        :param frame: 发生导航或被卸载的iframe
+        """
+        self._cache.pop(frame, None)
+
+    def clear(self):
+        """清空缓存"""
+        self._cache.clear()
@@ -0,0 +1,61 @@
+"""
+页面导航组件，按页面地址直接打开列表和表单页面的标签页，不再逐级点击模块和菜单
+"""
+
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+from pages.base.base_page import BasePage
+from pages.base.base_config import WaitConfig
+from pages.base.scripts import OPEN_MENU_LINK_SCRIPT
+from utils.logger import logger
+
+
+class Navigator:
+    """页面导航组件类，找不到页面的菜单链接时回退为逐级点击菜单"""
+
+    def __init__(self, page_object: BasePage):
+        """
+        初始化页面导航组件
+        :param page_object: 页面对象
+        """
+        self.page_object = page_object
+
+    @staticmethod
+    def url_selector(tag: str, attr: str, url: str) -> str:
+        """
+        按页面地址的路径和每个参数构建选择器，与参数顺序和附加参数无关
+        :param tag: 元素标签，菜单链接为a，标签页为iframe
+        :param attr: 地址所在的属性，菜单链接为href，标签页为src
+        :param url: 页面地址，如 Loadlists.aspx?listid=391&ModuleID=30012822
+        :return: 元素选择器
+        """
+        parts = urlsplit(url)
+        conditions = [parts.path] + [param for param in parts.query.split("&") if param]
+        return tag + "".join(f'[{attr}*="{condition}"]' for condition in conditions)
+
+    def open(
+        self,
+        url: str,
+        menu: Optional[Callable[[], None]] = None,
+        timeout: int = WaitConfig.NAVIGATION_TIMEOUT,
+    ) -> str:
+        """
+        在主页面中打开页面标签，返回主文档并直接触发页面的菜单链接
+        :param url: 页面地址(见各页面定位器中的*_URL)
+        :param menu: 找不到菜单链接时逐级点击菜单打开页面的方法
+        :param timeout: 等待标签页iframe出现的超时时间(毫秒)
+        :return: 标签页iframe选择器
+        """
+        po = self.page_object
+        po.exit_frame()
+        logger.info("打开页面: %s", url)
+        if not po.page.evaluate(OPEN_MENU_LINK_SCRIPT, self.url_selector("a", "href", url)):
+            if menu is None:
+                raise Exception(f"未找到页面的菜单链接: {url}")
+            logger.info("未找到菜单链接，逐级点击菜单打开: %s", url)
+            menu()
+
+        frame_selector = self.url_selector("iframe", "src", url)
+        po.wait_for_selector(frame_selector, timeout=timeout)
+        return frame_selector
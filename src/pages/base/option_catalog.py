@@ -0,0 +1,106 @@
+"""
+下拉框选项目录，按表单缓存FineUI下拉框的全部选项，选择时直接按值设置，不再逐个展开下拉列表
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# 单个选项：{"value": 选项值, "text": 显示文本}
+Option = Dict[str, str]
+
+
+def match_option(options: List[Option], text: str) -> Optional[Option]:
+    """
+    在选项列表中查找要选择的选项，依次按显示文本、选项值完全匹配，最后按唯一的包含关系匹配
+    :param options: 选项列表
+    :param text: 要选择的文本或选项值
+    :return: 匹配的选项，没有匹配或包含关系匹配到多个时返回None
+    """
+    for key in ("text", "value"):
+        for option in options:
+            if option[key] == text:
+                return option
+    partial = [option for option in options if text in option["text"]]
+    return partial[0] if len(partial) == 1 else None
+
+
+class OptionCatalog:
+    """下拉框选项目录类，按(表单, 下拉框选择器)缓存选项列表，同一表单的选项在进程内只读取一次"""
+
+    def __init__(self):
+        """初始化下拉框选项目录"""
+        self._forms: Dict[str, Dict[str, Optional[List[Option]]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def form_key(url: str) -> str:
+        """
+        根据表单地址生成缓存键，LoadForms.aspx按formid区分，其他页面按路径区分
+        :param url: 表单所在页面或iframe的地址
+        :return: 缓存键
+        """
+        parts = urlsplit(url)
+        form_id = parse_qs(parts.query).get("formid")
+        return f"formid={form_id[0]}" if form_id else parts.path
+
+    def missing(self, form_key: str, selectors: List[str]) -> List[str]:
+        """
+        获取尚未读取选项的下拉框
+        :param form_key: 表单缓存键
+        :param selectors: 下拉框选择器列表
+        :return: 尚未读取的选择器列表
+        """
+        with self._lock:
+            known = self._forms.get(form_key, {})
+            return [selector for selector in selectors if selector not in known]
+
+    def update(self, form_key: str, catalog: Dict[str, Optional[List[Option]]]):
+        """
+        保存读取到的选项列表
+        :param form_key: 表单缓存键
+        :param catalog: 选择器 -> 选项列表，无法读取选项的下拉框为None
+        """
+        with self._lock:
+            self._forms.setdefault(form_key, {}).update(catalog)
+
+    def options(self, form_key: str, selector: str) -> Optional[List[Option]]:
+        """
+        获取下拉框的选项列表
+        :param form_key: 表单缓存键
+        :param selector: 下拉框选择器
+        :return: 选项列表，未读取或无法读取时返回None
+        """
+        with self._lock:
+            return self._forms.get(form_key, {}).get(selector)
+
+    def resolve(
+        self, form_key: str, fields: Dict[str, str]
+    ) -> Tuple[Dict[str, Option], Dict[str, str]]:
+        """
+        为每个下拉框查找要选择的选项
+        :param form_key: 表单缓存键
+        :param fields: 选择器 -> 要选择的文本
+        :return: (选择器 -> 匹配的选项, 选择器 -> 不是有效选项的文本)，没有选项列表的下拉框两者都不包含
+        """
+        choices: Dict[str, Option] = {}
+        invalid: Dict[str, str] = {}
+        for selector, text in fields.items():
+            options = self.options(form_key, selector)
+            if options is None:
+                continue
+            option = match_option(options, text)
+            if option is None:
+                invalid[selector] = text
+            else:
+                choices[selector] = option
+        return choices, invalid
+
+    def clear(self):
+        """清空全部缓存，站点选项变更后使用"""
+        with self._lock:
+            self._forms.clear()
+
+
+# 创建全局下拉框选项目录实例
+option_catalog = OptionCatalog()
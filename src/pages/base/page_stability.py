@@ -0,0 +1,98 @@
+"""
+页面稳定检测，基于DOM变更、ajax请求和布局变化判断页面是否已经稳定
+"""
+
+from typing import Union
+
+from playwright.sync_api import Page, Frame, Error as PlaywrightError
+from utils.logger import logger
+from pages.base.base_config import WaitConfig, LoadState
+from pages.base.scripts import STABILIZE_SCRIPT
+
+
+class PageStability:
+    """页面稳定检测器，页面稳定后立即返回，超过上限时间则放弃等待"""
+
+    def __init__(
+        self,
+        quiet_period: int = WaitConfig.STABILIZE_QUIET_PERIOD,
+        poll_interval: int = WaitConfig.STABILIZE_POLL_INTERVAL,
+    ):
+        """
+        初始化页面稳定检测器
+        :param quiet_period: DOM和布局无变化且无ajax请求持续多久视为稳定(毫秒)
+        :param poll_interval: 浏览器端轮询间隔(毫秒)
+        """
+        self.quiet_period = quiet_period
+        self.poll_interval = poll_interval
+
+    def wait_until_stable(
+        self,
+        context: Union[Page, Frame],
+        timeout: int = WaitConfig.STABILIZE_TIMEOUT,
+    ) -> bool:
+        """
+        等待页面或iframe稳定
+        :param context: 需要检测的页面或iframe
+        :param timeout: 最长等待时间(毫秒)
+        :return: 是否在最长等待时间内稳定
+        """
+        try:
+            settled = context.evaluate(
+                STABILIZE_SCRIPT,
+                {
+                    "quietPeriod": min(self.quiet_period, timeout),
+                    "pollInterval": self.poll_interval,
+                    "timeout": timeout,
+                },
+            )
+        except PlaywrightError as e:
+            # 检测过程中发生导航或iframe被销毁时，退回到等待DOM加载完成
+            logger.warning("页面稳定检测被中断: %s", e)
+            try:
+                context.wait_for_load_state(LoadState.DOMCONTENTLOADED, timeout=timeout)
+            except PlaywrightError:
+                pass
+            return False
+
+        if not settled:
+            logger.warning("页面在 %sms 内未稳定，继续执行", timeout)
+        return settled
+
+
+class AsyncPageStability(PageStability):
+    """页面稳定检测器的异步版本，供异步页面对象使用"""
+
+    async def wait_until_stable(
+        self,
+        context,
+        timeout: int = WaitConfig.STABILIZE_TIMEOUT,
+    ) -> bool:
+        """
+        等待页面或iframe稳定
+        :param context: 需要检测的异步页面或iframe
+        :param timeout: 最长等待时间(毫秒)
+        :return: 是否在最长等待时间内稳定
+        """
+        try:
+            settled = await context.evaluate(
+                STABILIZE_SCRIPT,
+                {
+                    "quietPeriod": min(self.quiet_period, timeout),
+                    "pollInterval": self.poll_interval,
+                    "timeout": timeout,
+                },
+            )
+        except PlaywrightError as e:
+            logger.warning("页面稳定检测被中断: %s", e)
+            try:
+                await context.wait_for_load_state(
+                    LoadState.DOMCONTENTLOADED, timeout=timeout
+                )
+            except PlaywrightError:
+                pass
+            return False
+
+        if not settled:
+            logger.warning("页面在 %sms 内未稳定，继续执行", timeout)
+        return settled
@@ -0,0 +1,315 @@
+"""
+页面注入脚本，集中存放在浏览器中执行的JavaScript片段
+"""
+
+# 页面稳定检测脚本：
+# 在一次evaluate调用内等待DOM变更静默、FineUI/jQuery的ajax请求结束、布局不再偏移，
+# 满足条件或达到上限时间后返回，返回值表示页面是否在上限时间内稳定
+STABILIZE_SCRIPT = """
+async ({ quietPeriod, pollInterval, timeout }) => {
+    try {
+        window.top.scrollTo(0, 0);
+    } catch (e) {
+        window.scrollTo(0, 0);
+    }
+
+    const start = performance.now();
+    let lastChange = start;
+    const observer = new MutationObserver(() => {
+        lastChange = performance.now();
+    });
+    observer.observe(document, {
+        subtree: true,
+        childList: true,
+        attributes: true,
+        characterData: true,
+    });
+
+    const isShown = (el) => {
+        if (!el) return false;
+        const style = window.getComputedStyle(el);
+        return style.display !== 'none' && style.visibility !== 'hidden';
+    };
+
+    const ajaxBusy = () => {
+        const jq = window.jQuery || (window.F && window.F.$);
+        if (jq && jq.active > 0) return true;
+        if (window.F && window.F.ajaxProcessing) return true;
+        if (document.readyState !== 'complete') return true;
+        const masks = document.querySelectorAll(
+            '#f_ajax_loading, .f-ajax-loading, .f-loading-mask, .f-mask-loading'
+        );
+        for (const mask of masks) {
+            if (isShown(mask)) return true;
+        }
+        return false;
+    };
+
+    const layoutKey = () => {
+        const body = document.body;
+        if (!body) return '';
+        const rect = body.getBoundingClientRect();
+        return [rect.width, rect.height, body.scrollWidth, body.scrollHeight].join(',');
+    };
+
+    let lastLayout = layoutKey();
+    return await new Promise((resolve) => {
+        const tick = () => {
+            const now = performance.now();
+            const layout = layoutKey();
+            if (layout !== lastLayout) {
+                lastLayout = layout;
+                lastChange = now;
+            }
+            if (ajaxBusy()) {
+                lastChange = now;
+            }
+            if (now - lastChange >= quietPeriod) {
+                observer.disconnect();
+                resolve(true);
+                return;
+            }
+            if (now - start >= timeout) {
+                observer.disconnect();
+                resolve(false);
+                return;
+            }
+            setTimeout(tick, pollInterval);
+        };
+        tick();
+    });
+}
+"""
+
+# 批量填写脚本：
+# 逐个写入输入框的值并依次触发focus、input、change、blur事件，同时同步FineUI组件的值，
+# 返回无法写入的选择器列表（元素不存在、禁用或只读）
+FILL_MANY_SCRIPT = """
+(fields) => {
+    const inputSetter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    const textareaSetter = Object.getOwnPropertyDescriptor(HTMLTextAreaElement.prototype, 'value').set;
+    const fire = (el, type, EventType = Event) => {
+        el.dispatchEvent(new EventType(type, { bubbles: type !== 'focus' && type !== 'blur' }));
+    };
+
+    const skipped = [];
+    for (const [selector, value] of fields) {
+        let el = null;
+        try {
+            el = document.querySelector(selector);
+        } catch (e) {
+            el = null;
+        }
+        if (!el || el.disabled || el.readOnly || !('value' in el)) {
+            skipped.push(selector);
+            continue;
+        }
+
+        fire(el, 'focus', FocusEvent);
+        fire(el, 'focusin', FocusEvent);
+
+        const cmpId = el.id ? el.id.replace(/-inputEl$/, '') : '';
+        if (cmpId && typeof window.F === 'function') {
+            try {
+                const cmp = window.F(cmpId);
+                if (cmp && typeof cmp.setValue === 'function') {
+                    cmp.setValue(value);
+                }
+            } catch (e) {
+                // 非FineUI组件时只写入DOM
+            }
+        }
+
+        const setter = el instanceof HTMLTextAreaElement ? textareaSetter : inputSetter;
+        setter.call(el, value);
+        fire(el, 'input');
+        fire(el, 'change');
+        fire(el, 'blur', FocusEvent);
+        fire(el, 'focusout', FocusEvent);
+    }
+    return skipped;
+}
+"""
+
+# 批量读取输入框值的脚本，元素不存在时对应位置返回null
+READ_VALUES_SCRIPT = """
+(selectors) => selectors.map((selector) => {
+    let el = null;
+    try {
+        el = document.querySelector(selector);
+    } catch (e) {
+        el = null;
+    }
+    return el && 'value' in el ? el.value : null;
+})
+"""
+
+# 表格结果检测脚本：
+# 表格已有数据行时返回行数，显示空数据提示时返回0，两者都没有时返回null以便继续等待，
+# 结果包装为对象，避免行数为0时被wait_for_function当作条件不成立
+GRID_RESULT_SCRIPT = """
+({ rowSelector, emptySelector }) => {
+    const rows = document.querySelectorAll(rowSelector).length;
+    if (rows > 0) return { rows };
+    const empty = document.querySelector(emptySelector);
+    if (empty) {
+        const style = window.getComputedStyle(empty);
+        if (style.display !== 'none' && style.visibility !== 'hidden') return { rows: 0 };
+    }
+    return null;
+}
+"""
+
+# 读取选择窗口回填字段的脚本：
+# 返回搜索图标所在字段内全部带name的输入框的值(含隐藏值)，字段不存在时返回null
+READ_PICKER_FIELD_SCRIPT = """
+(triggerSelector) => {
+    const trigger = document.querySelector(triggerSelector);
+    const field = trigger && trigger.closest('.f-field');
+    if (!field) return null;
+    const values = {};
+    field.querySelectorAll('input[name]').forEach((input) => {
+        values[input.name] = input.value;
+    });
+    return values;
+}
+"""
+
+# 直接回填选择窗口字段的脚本：
+# 按name写入字段内的输入框并触发input、change事件，同步FineUI组件的值，
+# 字段或任一输入框已不存在、回读值不一致时返回false，由调用方改为打开选择窗口
+APPLY_PICKER_FIELD_SCRIPT = """
+({ triggerSelector, values }) => {
+    const trigger = document.querySelector(triggerSelector);
+    const field = trigger && trigger.closest('.f-field');
+    if (!field) return false;
+    const inputs = Array.from(field.querySelectorAll('input[name]'));
+    const find = (name) => inputs.find((input) => input.name === name);
+    const entries = Object.entries(values);
+    if (!entries.every(([name]) => find(name))) return false;
+
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    for (const [name, value] of entries) {
+        const input = find(name);
+        const cmpId = input.id ? input.id.replace(/-inputEl$/, '') : '';
+        if (cmpId && cmpId !== input.id && typeof window.F === 'function') {
+            try {
+                const cmp = window.F(cmpId);
+                if (cmp && typeof cmp.setValue === 'function') {
+                    cmp.setValue(value);
+                }
+            } catch (e) {
+                // 非FineUI组件时只写入DOM
+            }
+        }
+        setter.call(input, value);
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+        input.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+    return entries.every(([name, value]) => find(name).value === value);
+}
+"""
+
+# 读取下拉框选项的脚本：
+# 优先读取FineUI组件的数据，其次读取输入框data-options属性中的JSON，
+# 统一转换为{value, text}列表，无法读取选项的下拉框返回null
+READ_OPTIONS_SCRIPT = """
+(selectors) => {
+    const normalize = (item) => {
+        if (Array.isArray(item)) {
+            return { value: String(item[0]), text: String(item.length > 1 ? item[1] : item[0]) };
+        }
+        if (item && typeof item === 'object') {
+            const value = item.value !== undefined ? item.value : item.text;
+            const text = item.text !== undefined ? item.text : item.value;
+            return { value: String(value), text: String(text) };
+        }
+        return { value: String(item), text: String(item) };
+    };
+
+    const catalog = {};
+    for (const selector of selectors) {
+        let el = null;
+        try {
+            el = document.querySelector(selector);
+        } catch (e) {
+            el = null;
+        }
+
+        let items = null;
+        const cmpId = el && el.id ? el.id.replace(/-inputEl$/, '') : '';
+        if (cmpId && cmpId !== el.id && typeof window.F === 'function') {
+            try {
+                const cmp = window.F(cmpId);
+                const data = cmp && (typeof cmp.getData === 'function' ? cmp.getData() : cmp.data);
+                if (Array.isArray(data)) items = data;
+            } catch (e) {
+                items = null;
+            }
+        }
+        if (!items && el && el.dataset && el.dataset.options) {
+            try {
+                items = JSON.parse(el.dataset.options);
+            } catch (e) {
+                items = null;
+            }
+        }
+        catalog[selector] = Array.isArray(items) ? items.map(normalize) : null;
+    }
+    return catalog;
+}
+"""
+
+# 批量设置下拉框的脚本：
+# 参数为[选择器, 选项值, 显示文本]列表，FineUI组件通过setValue按选项值设置，否则直接写入显示文本，
+# 触发change事件后回读，返回设置失败的选择器列表
+APPLY_OPTIONS_SCRIPT = """
+(choices) => {
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    const failed = [];
+    for (const [selector, value, text] of choices) {
+        let el = null;
+        try {
+            el = document.querySelector(selector);
+        } catch (e) {
+            el = null;
+        }
+        if (!el || el.disabled || !(el instanceof HTMLInputElement)) {
+            failed.push(selector);
+            continue;
+        }
+
+        let applied = false;
+        const cmpId = el.id ? el.id.replace(/-inputEl$/, '') : '';
+        if (cmpId && cmpId !== el.id && typeof window.F === 'function') {
+            try {
+                const cmp = window.F(cmpId);
+                if (cmp && typeof cmp.setValue === 'function') {
+                    cmp.setValue(value);
+                    applied = true;
+                }
+            } catch (e) {
+                applied = false;
+            }
+        }
+        if (!applied) {
+            setter.call(el, text);
+        }
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+        if (el.value !== text) failed.push(selector);
+    }
+    return failed;
+}
+"""
+
+# 打开菜单链接的脚本：
+# 直接触发主页面中菜单链接的点击事件，由FineUI按链接地址新建或激活标签页，
+# 折叠的菜单中的链接同样有效，页面中没有该链接时返回false
+OPEN_MENU_LINK_SCRIPT = """
+(linkSelector) => {
+    const link = document.querySelector(linkSelector);
+    if (!link) return false;
+    link.click();
+    return true;
+}
+"""
@@ -0,0 +1,181 @@
+"""
+FineUI选择窗口(SelectGrid.aspx)组件，客户、借款等页面的人员和项目选择共用
+"""
+
+import json
+from typing import Dict, List, Optional
+
+from pages.base.base_page import BasePage
+from pages.base.base_config import WaitConfig, ElementState, ResponsePattern
+from pages.base.scripts import (
+    READ_PICKER_FIELD_SCRIPT,
+    APPLY_PICKER_FIELD_SCRIPT,
+)
+from locators.select_grid_locators import SelectGridLocators
+from utils.logger import logger
+from utils.picker_cache import picker_cache
+
+
+class SelectGridPicker:
+    """选择窗口组件类，每一步都等待页面真实的就绪信号，不使用固定等待"""
+
+    def __init__(self, page_object: BasePage):
+        """
+        初始化选择窗口组件
+        :param page_object: 打开选择窗口的页面对象，选择窗口在其当前所在的iframe内打开
+        """
+        self.page_object = page_object
+        self.locators = SelectGridLocators()
+
+    @staticmethod
+    def cell_selector(text: str, template: str = SelectGridLocators.CELL) -> str:
+        """
+        构建按完整文本匹配单元格的选择器
+        :param text: 单元格文本
+        :param template: 选择器模板，默认匹配任意行，SELECTED_CELL只匹配已选中的行
+        :return: 单元格选择器
+        """
+        return template.format(text=json.dumps(text, ensure_ascii=False))
+
+    @staticmethod
+    def missing_texts(values: Optional[Dict[str, str]], texts: List[str]) -> List[str]:
+        """
+        检查确定后回填到字段中的值，找出没有回填的记录
+        :param values: 字段内输入框name -> 值，多条记录用逗号分隔
+        :param texts: 要选择的记录文本列表
+        :return: 字段中缺少的记录文本列表
+        """
+        filled = {item.strip() for value in (values or {}).values() for item in str(value).split(",")}
+        return [text for text in texts if text not in filled]
+
+    @staticmethod
+    def split_values(values: Optional[Dict[str, str]], texts: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        将多条记录的回填值按逗号拆分为每条记录各自的回填值
+        :param values: 字段内输入框name -> 值，多条记录用逗号分隔
+        :param texts: 选择的记录文本列表，与回填值中的顺序一致
+        :return: 记录文本 -> 字段内输入框name -> 值，有输入框的值不能按记录数拆分时返回空字典
+        """
+        parts = {name: str(value).split(",") for name, value in (values or {}).items()}
+        if not parts or any(len(items) != len(texts) for items in parts.values()):
+            return {}
+        return {
+            text: {name: items[index] for name, items in parts.items()}
+            for index, text in enumerate(texts)
+        }
+
+    def select(self, trigger: str, text: str, search: bool = True):
+        """
+        选中文本完全匹配的记录，已缓存回填值时直接回填，否则打开选择窗口选择并确定后缓存回填值
+        :param trigger: 打开选择窗口的搜索图标选择器
+        :param text: 要选择的记录文本
+        :param search: 记录不在当前表格中时是否按文本搜索
+        """
+        self.select_many(trigger, [text], search)
+
+    def select_many(self, trigger: str, texts: List[str], search: bool = True):
+        """
+        在一次选择窗口会话中依次选中多条记录后确定，多条记录时点击行首复选框，当前表格中没有的记录先搜索再选择
+        (FineUI重新加载表格后会清空之前选中的行)，确定后检查每条记录都已回填到字段中；
+        多条记录的回填值拆分为每条记录各自的回填值后缓存，单条记录已缓存时直接回填
+        :param trigger: 打开选择窗口的搜索图标选择器
+        :param texts: 要选择的记录文本列表
+        :param search: 记录不在当前表格中时是否按文本搜索
+        """
+        po = self.page_object
+        texts = list(dict.fromkeys(texts))
+        label = ",".join(texts)
+        scope = f"{po.base_url}|{trigger}"
+        # 多条记录的组合几乎不会重复出现，不按组合缓存
+        cacheable = len(texts) == 1
+        cached = picker_cache.get(scope, label) if cacheable else None
+        try:
+            if cached and self._apply_cached(trigger, label, cached):
+                return
+
+            logger.info("打开选择窗口选择: %s", label)
+            po.click(trigger)
+
+            with po.frame_context(
+                self.locators.IFRAME, timeout=WaitConfig.RESPONSE_TIMEOUT, nested=True
+            ):
+                self.wait_for_rows()
+                for text in texts:
+                    self._choose(text, search, multi=len(texts) > 1)
+                po.click(self.locators.CONFIRM_BUTTON)
+
+            # 确定后选择窗口关闭，回填的值已写入表单
+            po.wait_for_element_state(
+                self.locators.IFRAME, ElementState.HIDDEN, timeout=WaitConfig.RESPONSE_TIMEOUT
+            )
+
+            values = po.get_context().evaluate(READ_PICKER_FIELD_SCRIPT, trigger)
+            missing = self.missing_texts(values, texts)
+            if missing:
+                raise Exception(f"选择窗口确定后字段中缺少记录: {','.join(missing)}")
+            logger.info("已选择: %s", label)
+
+            # 多条记录按逗号拆分后分别缓存，供单条选择和后台造数复用
+            entries = {label: values} if cacheable else self.split_values(values, texts)
+            picker_cache.put_many(scope, entries)
+
+        except Exception as e:
+            # 缓存的回填值无法写入且重新选择失败时删除缓存，重新选择成功时由put直接覆盖，只写一次缓存文件
+            if cached:
+                picker_cache.invalidate(scope, label)
+            logger.error("选择窗口选择 %s 时发生错误: %s", label, e)
+            po.take_screenshot("select_grid_error")
+            raise
+
+    def _choose(self, text: str, search: bool, multi: bool = False):
+        """
+        在已打开的选择窗口中选中一条记录，等待该行变为选中状态
+        FineUI表格中点击行会替换已选中的行，多选时点击行首复选框，保留之前选中的行
+        :param text: 记录文本
+        :param search: 记录不在当前表格中时是否按文本搜索
+        :param multi: 是否保留已选中的记录
+        """
+        po = self.page_object
+        cell = self.cell_selector(text)
+        if not po.get_element_count(cell):
+            if not search or not self.search(text):
+                raise Exception(f"选择窗口中没有记录: {text}")
+        po.click(self.cell_selector(text, self.locators.CHECKER) if multi else cell)
+        po.wait_for_selector(self.cell_selector(text, self.locators.SELECTED_CELL))
+
+    def _apply_cached(self, trigger: str, label: str, values: Dict[str, str]) -> bool:
+        """
+        用缓存的回填值直接回填字段，不打开选择窗口，也不向服务端校验记录
+        :param trigger: 搜索图标选择器
+        :param label: 选择的记录文本
+        :param values: 缓存的字段内输入框name -> 值
+        :return: 是否已回填，字段结构已变化(输入框不存在或写入后值不一致)时返回False
+        """
+        applied = self.page_object.get_context().evaluate(
+            APPLY_PICKER_FIELD_SCRIPT, {"triggerSelector": trigger, "values": values}
+        )
+        if applied:
+            logger.info("使用缓存回填: %s", label)
+        else:
+            logger.info("选择窗口缓存与字段不一致，重新打开选择窗口: %s", label)
+        return bool(applied)
+
+    def wait_for_rows(self) -> int:
+        """
+        等待选择窗口表格加载完成
+        :return: 数据行数
+        """
+        return self.page_object.wait_for_grid_rows(
+            self.locators.ROWS, self.locators.EMPTY, timeout=WaitConfig.RESPONSE_TIMEOUT
+        )
+
+    def search(self, keyword: str) -> int:
+        """
+        在选择窗口中搜索，等待表格数据响应后返回
+        :param keyword: 搜索关键字
+        :return: 数据行数
+        """
+        po = self.page_object
+        po.fill(self.locators.SEARCH_INPUT, keyword)
+        po.click_and_wait_for_response(self.locators.SEARCH_BUTTON, ResponsePattern.SELECT_GRID)
+        return self.wait_for_rows()
@@ -4,6 +4,9 @@
 
 from playwright.sync_api import Page
 from pages.base.base_page import BasePage
+from pages.base.base_config import ResponsePattern
+from pages.base.navigator import Navigator
+from pages.base.select_grid_picker import SelectGridPicker
 from locators.customer_locators import CustomerLocators
 from models.customer import Customer
 from utils.logger import logger
@@ -19,6 +22,8 @@ class CustomerPage(BasePage):
         """
         super().__init__(page)
         self.locators = CustomerLocators()
+        self.picker = SelectGridPicker(self)
+        self.navigator = Navigator(self)
 
     def navigate_to_customer_page(self):
         """导航到客户管理页面"""
@@ -32,109 +37,43 @@ class CustomerPage(BasePage):
         self.click(self.locators.CUSTOMER_MENU)
         self.wait_for_selector(self.locators.CUSTOMER_LIST_PAGE)
 
-    def _select_person(
-        self,
-        search_icon: str,
-        search_input: str,
-        search_btn: str,
-        select_btn: str,
-        person_result: str,
-        person_name: str,
-    ):
-        """
-        通用人员选择方法
-        :param search_icon: 搜索图标选择器
-        :param search_input: 搜索输入框选择器
-        :param search_btn: 搜索按钮选择器
-        :param select_btn: 确定按钮选择器
-        :param person_result: 人员结果选择器
-        :param person_name: 人员姓名
-        """
-        try:
-            self.click(search_icon)
-            self.page.wait_for_timeout(3000)  # 增加等待时间
-
-            frame_element = self.wait_for_selector(
-                self.locators.SELECT_GRID_IFRAME,
-                timeout=30000,
-                state="visible",
-            )
-
-            if not frame_element:
-                raise Exception("无法找到人员选择iframe")
-
-            nested_frame = frame_element.content_frame()
-            if not nested_frame:
-                raise Exception("无法获取iframe内容")
-
-            self.current_frame = nested_frame
-
-            # 增加稳定等待
-            self.page.wait_for_timeout(2000)
-            self.stabilize_page()
+    def open_customer_list(self):
+        """直接打开客户信息列表，找不到菜单链接时逐级点击菜单"""
+        self.navigator.open(self.locators.CUSTOMER_LIST_URL, self._open_customer_list_by_menu)
 
-            self.wait_for_selector(search_input, timeout=20000)
-            self.fill(search_input, person_name)
-            self.click(search_btn)
+    def _open_customer_list_by_menu(self):
+        """逐级点击客户模块、客户信息菜单和客户信息列表"""
+        self.navigate_to_customer_page()
+        self.click_customer_menu()
+        self.click(self.locators.CUSTOMER_LIST_PAGE)
 
-            # 等待搜索结果加载
-            self.page.wait_for_timeout(2000)
-
-            # 增加对搜索结果的等待
-            self.wait_for_selector(person_result, timeout=20000)
-            self.click(person_result)
-
-            # 增加选择后的稳定等待
-            self.page.wait_for_timeout(1000)
-            self.click(select_btn)
-
-            self.current_frame = frame_element.owner_frame()
-
-        except Exception as e:
-            logger.error(f"选择人员时发生错误: {str(e)}")
-            self.take_screenshot("select_person_error")
-            raise
+    def _open_add_customer_form_by_menu(self):
+        """逐级点击客户模块、客户信息菜单和新增客户"""
+        self.navigate_to_customer_page()
+        self.click_customer_menu()
+        self.click(self.locators.ADD_CUSTOMER_PAGE)
 
     def select_responsible_person(self, customer: Customer):
         """
         选择负责人
         :param customer: 客户数据对象
         """
-        logger.info(f"选择负责人: {customer.responsible_person}")
-        self._select_person(
-            self.locators.RESPONSIBLE_PERSON_SEARCH,
-            self.locators.RESPONSIBLE_PERSON_INPUT,
-            self.locators.RESPONSIBLE_PERSON_SEARCH_BTN,
-            self.locators.RESPONSIBLE_PERSON_SELECT_BTN,
-            self.locators.RESPONSIBLE_PERSON_RESULT.format(customer=customer),
-            customer.responsible_person,
+        logger.info("选择负责人: %s", customer.responsible_person)
+        self.picker.select(
+            self.locators.RESPONSIBLE_PERSON_SEARCH, customer.responsible_person
         )
 
     def select_shared_persons(self, customer: Customer):
         """
-        选择共享人
+        选择共享人，全部共享人在同一个选择窗口中多选
         :param customer: 客户数据对象
         """
         if not customer.shared_persons:
             logger.info("没有需要选择的共享人")
             return
 
-        logger.info(f"选择共享人: {customer.shared_persons}")
-        first_person = customer.shared_persons[0]
-        self._select_person(
-            self.locators.SHARED_PERSON_SEARCH,
-            self.locators.SHARED_PERSON_SEARCH_INPUT,
-            self.locators.SHARED_PERSON_SEARCH_BTN,
-            self.locators.SHARED_PERSON_SELECT_BTN,
-            self.locators.SHARED_PERSON_RESULT.format(customer=customer),
-            first_person,
-        )
-
-        if len(customer.shared_persons) > 1:
-            shared_persons_str = ",".join(customer.shared_persons)
-            self.wait_for_selector(self.locators.SHARED_PERSON)
-            self.page.wait_for_timeout(2000)
-            self.fill(self.locators.SHARED_PERSON, shared_persons_str)
+        logger.info("选择共享人: %s", customer.shared_persons)
+        self.picker.select_many(self.locators.SHARED_PERSON_SEARCH, customer.shared_persons)
 
     def fill_customer_form(self, customer: Customer):
         """
@@ -157,14 +96,23 @@ class CustomerPage(BasePage):
                 "level": (self.locators.CUSTOMER_LEVEL, True),
             }
 
-            for field, (selector, is_select) in field_mapping.items():
-                value = getattr(customer, field, None)
-                if value is not None:
-                    if is_select:
-                        self.select_option(selector, value)
-                    else:
-                        self.fill(selector, value)
-                    self.stabilize_page(500)
+            # 下拉框先按选项目录校验并设置，存在无效选项时不填写任何字段
+            self.select_options(
+                {
+                    selector: getattr(customer, field, None)
+                    for field, (selector, is_select) in field_mapping.items()
+                    if is_select
+                }
+            )
+
+            # 普通输入框批量填写
+            self.fill_many(
+                {
+                    selector: getattr(customer, field, None)
+                    for field, (selector, is_select) in field_mapping.items()
+                    if not is_select
+                }
+            )
 
             if customer.responsible_person:
                 self.select_responsible_person(customer)
@@ -173,7 +121,7 @@ class CustomerPage(BasePage):
                 self.select_shared_persons(customer)
 
         except Exception as e:
-            logger.error(f"填写表单时发生错误: {str(e)}")
+            logger.error("填写表单时发生错误: %s", e)
             self.take_screenshot("form_fill_error")
             raise
 
@@ -182,35 +130,36 @@ class CustomerPage(BasePage):
         添加客户
         :param customer: 客户数据对象
         """
-        logger.info(f"添加客户: {customer.name}")
+        logger.info("添加客户: %s", customer.name)
 
         try:
-            self.click(self.locators.ADD_CUSTOMER_PAGE)
-            self.wait_for_selector(self.locators.ADD_CUSTOMER_FORM_IFRAME)
+            self.navigator.open(
+                self.locators.ADD_CUSTOMER_FORM_URL, self._open_add_customer_form_by_menu
+            )
 
             with self.frame_context(self.locators.ADD_CUSTOMER_FORM_IFRAME):
                 self.stabilize_page()
                 self.fill_customer_form(customer)
-                self.click(self.locators.SAVE_AND_NEW_BUTTON)
+                self.click_and_wait_for_response(
+                    self.locators.SAVE_AND_NEW_BUTTON, ResponsePattern.FORM
+                )
                 self.wait_for_selector(self.locators.SUCCESS_ADD_CUSTOMER_MESSAGE)
                 logger.info("客户添加成功")
 
         except Exception as e:
-            logger.error(f"添加客户时发生错误: {str(e)}")
+            logger.error("添加客户时发生错误: %s", e)
             self.take_screenshot("add_customer_error")
             raise
 
-    def search_customer(self, customer: Customer):
+    def search_customer(self, customer: Customer) -> int:
         """
-        搜索客户
+        搜索客户，搜索结果渲染完成后立即返回
         :param customer: 客户数据对象
+        :return: 搜索结果行数
         """
         try:
-            self.click(self.locators.CUSTOMER_LIST_PAGE)
-            self.wait_for_iframe_ready()
-
+            self.open_customer_list()
             self.enter_frame(self.locators.CUSTOMER_LIST_IFRAME)
-            self.page.wait_for_timeout(5000)
             self.stabilize_page()
 
             # 填写搜索条件
@@ -222,12 +171,17 @@ class CustomerPage(BasePage):
             if customer.level:
                 self.fill(self.locators.SEARCH_CUSTOMER_LEVEL_INPUT, customer.level)
 
-            self.click(self.locators.SEARCH_CUSTOMER_BUTTON)
-            self.page.wait_for_timeout(5000)
-            self.wait_for_selector(self.locators.SEARCH_CUSTOMER_LIST)
+            self.click_and_wait_for_response(
+                self.locators.SEARCH_CUSTOMER_BUTTON, ResponsePattern.LIST
+            )
+            rows = self.wait_for_grid_rows(
+                self.locators.SEARCH_CUSTOMER_ROWS, self.locators.SEARCH_CUSTOMER_EMPTY
+            )
+            logger.info("搜索到 %s 条客户记录", rows)
+            return rows
 
         except Exception as e:
-            logger.error(f"搜索客户时发生错误: {str(e)}")
+            logger.error("搜索客户时发生错误: %s", e)
             self.take_screenshot("search_customer_error")
             self.exit_frame()
             raise
@@ -239,18 +193,19 @@ class CustomerPage(BasePage):
         :return: 客户是否存在
         """
         try:
-            self.search_customer(customer)
-            return self.is_visible(self.locators.SEARCH_CUSTOMER_RESULT.format(customer=customer))
+            # 无数据时表格直接显示无数据提示，不需要等待结果行超时
+            if self.search_customer(customer) and self.get_element_count(
+                self.locators.SEARCH_CUSTOMER_RESULT.format(customer=customer)
+            ):
+                return True
+            logger.info("客户不存在")
+            self.exit_frame()
+            return False
         except Exception as e:
-            if "Timeout 10000ms exceeded." in str(e):
-                logger.info("客户不存在")
-                self.exit_frame()
-                return False
-            else:
-                logger.error(f"检查客户是否存在时发生错误: {str(e)}")
-                self.exit_frame()
-                self.take_screenshot("check_customer_exists_error")
-                raise
+            logger.error("检查客户是否存在时发生错误: %s", e)
+            self.exit_frame()
+            self.take_screenshot("check_customer_exists_error")
+            raise
 
     def edit_customer(self, customer: Customer, updated_customer: Customer):
         """
@@ -265,16 +220,16 @@ class CustomerPage(BasePage):
                 self.click(self.locators.SEARCH_CUSTOMER_RESULT_CHECK)
                 self.click(self.locators.EDIT_CUSTOMER_BUTTON)
 
-            self.wait_for_selector(self.locators.EDIT_CUSTOMER_FORM_IFRAME)
-
             with self.frame_context(self.locators.EDIT_CUSTOMER_FORM_IFRAME):
                 self.stabilize_page()
                 self.fill_customer_form(updated_customer)
-                self.click(self.locators.SAVE_BUTTON)
-                logger.info(f"客户 {customer.name} 更新成功")
+                self.click_and_wait_for_response(
+                    self.locators.SAVE_BUTTON, ResponsePattern.FORM
+                )
+                logger.info("客户 %s 更新成功", customer.name)
 
         except Exception as e:
-            logger.error(f"编辑客户时发生错误: {str(e)}")
+            logger.error("编辑客户时发生错误: %s", e)
             self.exit_frame()
             self.take_screenshot("edit_customer_error")
             raise
@@ -292,14 +247,16 @@ class CustomerPage(BasePage):
                 self.click(self.locators.DELETE_CUSTOMER_BUTTON)
 
                 self.wait_for_selector(self.locators.CONFIRM_DELETE_DIALOG)
-                self.click(self.locators.CONFIRM_DELETE_YES)
-                logger.info(f"客户 {customer.name} 删除成功")
+                self.click_and_wait_for_response(
+                    self.locators.CONFIRM_DELETE_YES, ResponsePattern.LIST
+                )
+                logger.info("客户 %s 删除成功", customer.name)
 
         except Exception as e:
             if "Timeout 10000ms exceeded." in str(e):
                 logger.info("客户不存在")
                 return False
-            logger.error(f"删除客户时发生错误: {str(e)}")
+            logger.error("删除客户时发生错误: %s", e)
             self.exit_frame()
             self.take_screenshot("delete_customer_error")
             raise
@@ -309,20 +266,21 @@ class CustomerPage(BasePage):
         查看客户详情
         :param customer_data: 客户数据对象
         """
-        logger.info(f"查看客户详情: {customer_data.name}")
+        logger.info("查看客户详情: %s", customer_data.name)
 
         try:
             self.search_customer(customer_data)
-            self.click(self.locators.SEARCH_CUSTOMER_RESULT.format(customer=customer_data))
-
-            self.page.wait_for_timeout(3000)
+            self.click_and_wait_for_response(
+                self.locators.SEARCH_CUSTOMER_RESULT.format(customer=customer_data),
+                ResponsePattern.DETAIL,
+            )
 
             with self.frame_context(self.locators.CUSTOMER_DETAIL_IFRAME):
                 self.stabilize_page()
                 self.wait_for_selector(self.locators.CUSTOMER_DETAIL_CONTENT)
 
         except Exception as e:
-            logger.error(f"查看客户详情时发生错误: {str(e)}")
+            logger.error("查看客户详情时发生错误: %s", e)
             self.exit_frame()
             self.take_screenshot("view_customer_error")
             raise
@@ -343,8 +301,6 @@ class CustomerPage(BasePage):
                 self.click(self.locators.SEARCH_CUSTOMER_RESULT_CHECK)
                 self.click(self.locators.EDIT_CUSTOMER_BUTTON)
 
-            self.wait_for_selector(self.locators.EDIT_CUSTOMER_FORM_IFRAME)
-
             with self.frame_context(self.locators.EDIT_CUSTOMER_FORM_IFRAME):
                 self.stabilize_page()
 
@@ -360,13 +316,13 @@ class CustomerPage(BasePage):
                     if value is not None:
                         actual_value = self.get_input_value(selector)
                         if actual_value != value:
-                            logger.error(f"字段 {field} 的值不匹配: 期望 {value}, 实际 {actual_value}")
+                            logger.error("字段 %s 的值不匹配: 期望 %s, 实际 %s", field, value, actual_value)
                             return False
 
                 return True
 
         except Exception as e:
-            logger.error(f"验证客户编辑时发生错误: {str(e)}")
+            logger.error("验证客户编辑时发生错误: %s", e)
             self.exit_frame()
             self.take_screenshot("verify_customer_edit_error")
             raise
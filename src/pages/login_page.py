@@ -4,8 +4,9 @@
 
 from pages.base.base_page import BasePage
 from utils.logger import logger
+from utils.auth_cache import auth_cache
 from config.config import LOGIN_USERNAME, LOGIN_PASSWORD
-from playwright.async_api import Page
+from playwright.sync_api import Page
 from locators.login_locators import LoginLocators
 
 
@@ -35,13 +36,38 @@ class LoginPage(BasePage):
         :param username: 用户名
         :param password: 密码
         """
-        logger.info(f"使用用户名 {username} 登录")
+        logger.info("使用用户名 %s 登录", username)
         self.navigate_to_login()
         self.fill(self.selectors.USERNAME_INPUT, username)
         self.fill(self.selectors.PASSWORD_INPUT, password)
         self.click(self.selectors.LOGIN_BUTTON)
         self.wait_for_navigation()
 
+    def is_on_login_page(self) -> bool:
+        """
+        判断当前是否位于登录页面，会话过期时访问任意页面都会被重定向到登录页
+        :return: 是否位于登录页面
+        """
+        return self.login_url.lower() in self.page.url.lower()
+
+    def ensure_logged_in(self, username=LOGIN_USERNAME, password=LOGIN_PASSWORD):
+        """
+        确保已登录，优先复用已保存的登录状态，会话过期时重新登录并更新缓存
+        浏览器上下文需使用auth_cache.storage_state()创建才能复用登录状态
+        :param username: 用户名
+        :param password: 密码
+        """
+        cached = auth_cache.load(username)
+        if cached:
+            self.navigate(cached["landing_url"])
+            if not self.is_on_login_page():
+                logger.info("复用已保存的登录状态: %s", username)
+                return
+            logger.info("登录状态已失效，重新登录: %s", username)
+            auth_cache.invalidate(username)
+        self.login(username, password)
+        auth_cache.save(self.page.context, username, self.page.url)
+
     def is_login_successful(self):
         """
         判断登录是否成功
@@ -0,0 +1,4 @@
+"""
+本地FineUI替身服务包，提供与演示环境相同元素ID的登录、菜单、列表、表单和选择页面，
+数据保存在内存中，可注入延迟，用于离线运行测试和基准测试
+"""
@@ -0,0 +1,497 @@
+"""
+替身服务的页面定义和HTML渲染，元素ID与定位器保持一致
+"""
+
+import json
+from dataclasses import dataclass
+from html import escape
+from typing import Dict, List, Optional, Tuple
+
+from locators.customer_locators import CustomerLocators
+from locators.loan_locators import LoanLocators
+from locators.login_locators import LoginLocators
+from utils.test_data import TestData
+
+
+def field_name(selector: str) -> str:
+    """
+    根据替身页面元素选择器生成表单提交时使用的字段名，与ASP.NET控件的UniqueID一致
+    例如 #Panel_txtUserID -> Panel$txtUserID
+    :param selector: 元素选择器
+    :return: 表单字段名
+    """
+    control_id = selector.lstrip("#")
+    if control_id.endswith("-inputEl"):
+        control_id = control_id[: -len("-inputEl")]
+    return control_id.replace("_", "$")
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """表单字段定义"""
+
+    attr: str  # 数据模型属性名
+    label: str  # 字段标签
+    selector: str  # 输入框选择器，取自定位器
+    kind: str = "text"  # 字段类型：text, combo, picker
+    options: Tuple[str, ...] = ()  # 下拉选项
+    picker: str = ""  # 选择窗口类型：person, project
+    multi: bool = False  # 选择窗口是否多选
+
+    @property
+    def input_id(self) -> str:
+        """输入框ID"""
+        return self.selector.lstrip("#")
+
+    @property
+    def control_id(self) -> str:
+        """控件ID，即去掉-inputEl后缀的输入框ID"""
+        return self.input_id.replace("-inputEl", "")
+
+    @property
+    def name(self) -> str:
+        """表单提交时使用的字段名"""
+        return field_name(self.selector)
+
+    @property
+    def key_name(self) -> str:
+        """选择窗口字段保存所选记录键值的隐藏字段名"""
+        return f"{self.control_id}-hiddenEl"
+
+    @property
+    def key_attr(self) -> str:
+        """记录中保存所选记录键值的属性名"""
+        return f"{self.attr}_key"
+
+
+@dataclass(frozen=True)
+class FormSpec:
+    """表单页面定义"""
+
+    form_id: str
+    entity: str  # 数据类型：customer, loan
+    title: str
+    title_attr: str  # 详情页标题使用的字段
+    fields: Tuple[FieldSpec, ...]
+    save_button: str = "Panel2_Toptb_Button2"
+    save_and_new_button: str = "Panel2_Toptb_Button3"
+
+    def field_by_name(self) -> Dict[str, FieldSpec]:
+        """
+        按提交字段名索引字段定义
+        :return: 字段名与字段定义的字典
+        """
+        return {spec.name: spec for spec in self.fields}
+
+
+@dataclass(frozen=True)
+class ListSpec:
+    """列表页面定义"""
+
+    list_id: str
+    module_id: str
+    entity: str
+    form_id: str
+    title: str
+    search_fields: Tuple[Tuple[str, str, str], ...]  # (输入框选择器, 属性名, 标签)
+    link_attr: str  # 以链接显示、点击后打开详情的字段
+    link_label: str  # 链接列标题
+    columns: Tuple[Tuple[str, str], ...]  # (属性名, 列标题)
+    date_range: Optional[Tuple[str, str, str]] = None  # (开始日期选择器, 结束日期选择器, 属性名)
+
+
+_C = CustomerLocators
+_L = LoanLocators
+
+FORMS: Dict[str, FormSpec] = {
+    "646": FormSpec(
+        form_id="646",
+        entity="customer",
+        title="客户信息",
+        title_attr="name",
+        fields=(
+            FieldSpec("name", "客户名称", _C.CUSTOMER_NAME),
+            FieldSpec("type", "客户分类", _C.CUSTOMER_TYPE, "combo", tuple(TestData.customer_types)),
+            FieldSpec("code", "客户编号", _C.CUSTOMER_CODE),
+            FieldSpec("industry", "所属行业", _C.INDUSTRY, "combo", tuple(TestData.industries)),
+            FieldSpec("phone", "电话", _C.PHONE),
+            FieldSpec("region", "所在地区", _C.REGION, "combo", tuple(TestData.regions)),
+            FieldSpec("mobile", "手机", _C.MOBILE),
+            FieldSpec("scale", "规模", _C.SCALE, "combo", tuple(TestData.scales)),
+            FieldSpec("qq", "QQ", _C.QQ),
+            FieldSpec("source", "来源", _C.CUSTOMER_SOURCE, "combo", tuple(TestData.sources)),
+            FieldSpec("department", "部门", _C.DEPARTMENT, "combo", tuple(dict.fromkeys(TestData.departments))),
+            FieldSpec("level", "客户等级", _C.CUSTOMER_LEVEL, "combo", tuple(TestData.levels)),
+            FieldSpec("responsible_person", "负责人", _C.RESPONSIBLE_PERSON, "picker", picker="person"),
+            FieldSpec("shared_persons", "共享人", _C.SHARED_PERSON, "picker", picker="person", multi=True),
+        ),
+    ),
+    "2879": FormSpec(
+        form_id="2879",
+        entity="loan",
+        title="借款申请",
+        title_attr="project_name",
+        fields=(
+            FieldSpec("project_name", "项目名称", _L.PROJECT_NAME, "picker", picker="project"),
+            FieldSpec("borrower", "借款人", _L.BORROWER, "picker", picker="person"),
+            FieldSpec("loan_amount", "借款金额", _L.LOAN_AMOUNT),
+            FieldSpec("loan_purpose", "借款事由", _L.LOAN_PURPOSE),
+            FieldSpec("payment_method", "支付方式", _L.PAYMENT_METHOD, "combo", tuple(TestData.payment_methods)),
+            FieldSpec("repayment_method", "还款方式", _L.REPAYMENT_METHOD, "combo", tuple(TestData.repayment_methods)),
+            FieldSpec("loan_period", "借款日期", _L.LOAN_PERIOD),
+            FieldSpec("borrower_bank", "借款人开户银行", _L.BORROWER_BANK),
+            FieldSpec("bank_account", "借款人银行账号", _L.BANK_ACCOUNT),
+            FieldSpec("bank_branch", "开户银行地址", _L.BANK_BRANCH),
+            FieldSpec("handler", "经办人", _L.HANDLER, "picker", picker="person"),
+            FieldSpec("application_date", "申请日期", _L.APPLICATION_DATE),
+            FieldSpec("account_name", "开户行名称", _L.ACCOUNT_NAME),
+            FieldSpec("bank_account_number", "银行账户", _L.BANK_ACCOUNT_NUMBER),
+        ),
+    ),
+}
+
+LISTS: Dict[str, ListSpec] = {
+    "391": ListSpec(
+        list_id="391",
+        module_id="30012822",
+        entity="customer",
+        form_id="646",
+        title="客户信息列表",
+        search_fields=(
+            (_C.SEARCH_CUSTOMER_NAME_INPUT, "name", "客户名称"),
+            (_C.SEARCH_CUSTOMER_TYPE_INPUT, "type", "客户分类"),
+            (_C.SEARCH_CUSTOMER_REGION_INPUT, "region", "所在地区"),
+            (_C.SEARCH_CUSTOMER_LEVEL_INPUT, "level", "客户等级"),
+        ),
+        link_attr="name",
+        link_label="客户名称",
+        columns=(("type", "客户分类"), ("region", "所在地区"), ("level", "客户等级"), ("phone", "电话")),
+    ),
+    "10643": ListSpec(
+        list_id="10643",
+        module_id="30013823",
+        entity="loan",
+        form_id="2879",
+        title="借款申请列表",
+        search_fields=(
+            (_L.SEARCH_LOAN_PROJECT_NAME, "project_name", "项目名称"),
+            (_L.SEARCH_LOAN_BORROWER, "borrower", "借款人"),
+        ),
+        link_attr="borrower",
+        link_label="借款人",
+        columns=(("project_name", "项目名称"), ("loan_amount", "借款金额"), ("loan_period", "借款日期")),
+        date_range=(_L.SEARCH_LOAN_PERIOD_START, _L.SEARCH_LOAN_PERIOD_END, "loan_period"),
+    ),
+}
+
+# 主页面顶部模块和左侧菜单：(模块元素ID, 模块名称, [(菜单名称, [(链接文字, 链接地址)])])
+MODULES = (
+    (
+        _C.CUSTOMER_PAGE.lstrip("#"),
+        "客户",
+        [("客户信息", [("新增客户", _C.ADD_CUSTOMER_FORM_URL), ("客户列表", _C.CUSTOMER_LIST_URL)])],
+    ),
+    (
+        _L.LOAN_PAGE.lstrip("#"),
+        "财务",
+        [("借支管理", [("借款申请", _L.LOAN_LIST_URL)])],
+    ),
+)
+
+# 列表搜索按钮，点击后以ajax方式回发
+LIST_SEARCH_BUTTON = "#Panel1_panelTop_BtnSearch"
+
+# 表单回发时携带的隐藏字段，后台造数会原样回传
+HIDDEN_FIELDS = {
+    "__VIEWSTATE": "standin",
+    "__VIEWSTATEGENERATOR": "STANDIN",
+    "__EVENTVALIDATION": "standin",
+    "F_STATE": "e30=",
+}
+
+
+def _layout(title: str, body: str, data: dict) -> str:
+    """
+    页面框架
+    :param title: 页面标题
+    :param body: 页面内容
+    :param data: 传给页面脚本的初始化数据
+    :return: 完整HTML
+    """
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{escape(title)}</title>
+<link rel="stylesheet" href="/res/standin.css">
+<script src="/res/standin.js"></script>
+</head>
+<body class="f-body">
+{body}
+<script>standin.init({json.dumps(data, ensure_ascii=False)});</script>
+</body>
+</html>"""
+
+
+def _button(button_id: str, text: str) -> str:
+    """
+    FineUI样式的按钮
+    :param button_id: 按钮ID
+    :param text: 按钮文字
+    :return: HTML
+    """
+    return (
+        f'<a id="{button_id}" class="f-btn" href="javascript:;">'
+        f'<span class="f-btn-text"><span>{escape(text)}</span></span></a>'
+    )
+
+
+def _hidden_fields() -> str:
+    """
+    隐藏字段
+    :return: HTML
+    """
+    return "".join(
+        f'<input type="hidden" name="{name}" id="{name}" value="{value}" />'
+        for name, value in HIDDEN_FIELDS.items()
+    )
+
+
+def render_login(return_url: str = "", error: str = "") -> str:
+    """
+    登录页面
+    :param return_url: 登录后返回的地址
+    :param error: 错误信息
+    :return: HTML
+    """
+    action = "login.aspx" + (f"?ReturnUrl={escape(return_url)}" if return_url else "")
+    username = LoginLocators.USERNAME_INPUT.lstrip("#")
+    password = LoginLocators.PASSWORD_INPUT.lstrip("#")
+    body = f"""
+<form id="form1" method="post" action="{action}">
+{_hidden_fields()}
+<input type="hidden" name="__EVENTTARGET" value="Panel$btnLogin" />
+<div id="Panel" class="f-panel f-login">
+  <div class="f-panel-header">系统登录</div>
+  <div class="f-field"><label>用户名</label><input id="{username}" name="{field_name(username)}" autocomplete="off" /></div>
+  <div class="f-field"><label>密码</label><input id="{password}" name="{field_name(password)}" type="password" /></div>
+  {_button(LoginLocators.LOGIN_BUTTON.lstrip("#"), "登录")}
+</div>
+</form>"""
+    return _layout("登录", body, {"page": "login", "error": error})
+
+
+def render_main(username: str) -> str:
+    """
+    登录后的主页面，包含顶部模块、左侧菜单和标签页区域
+    :param username: 当前用户
+    :return: HTML
+    """
+    modules = []
+    menus = []
+    for module_id, module_text, module_menus in MODULES:
+        modules.append(f'<a id="{module_id}" class="f-module" data-module="{module_id}">{escape(module_text)}</a>')
+        nodes = []
+        for menu_text, links in module_menus:
+            items = "".join(
+                f'<a class="f-tree-link" href="{escape(url)}">{escape(text)}</a>' for text, url in links
+            )
+            nodes.append(
+                f'<div class="f-tree-node"><span class="f-tree-node-text"><span>{escape(menu_text)}</span></span>'
+                f'<div class="f-tree-children" hidden>{items}</div></div>'
+            )
+        menus.append(f'<div class="f-menu" data-module="{module_id}" hidden>{"".join(nodes)}</div>')
+
+    body = f"""
+<div id="Panel2" class="f-main">
+  <div id="Panel2_bodyRegion_topPanel" class="f-top">
+    <div class="f-logo">泛普软件</div>
+    <div id="Panel2_bodyRegion_topPanel_Panel1" class="f-modules">{"".join(modules)}</div>
+    <div class="welcome-message">欢迎您，{escape(username)}</div>
+  </div>
+  <div id="Panel2_leftRegion" class="f-left">{"".join(menus)}</div>
+  <div id="Panel2_mainRegion" class="f-tabs">
+    <div class="f-tab-strip"></div>
+    <div class="f-tab-body"></div>
+  </div>
+</div>"""
+    return _layout("泛普软件", body, {"page": "main"})
+
+
+def render_list(spec: ListSpec) -> str:
+    """
+    列表页面
+    :param spec: 列表定义
+    :return: HTML
+    """
+    search = []
+    for selector, attr, label in spec.search_fields:
+        input_id = selector.lstrip("#")
+        search.append(
+            f'<div class="f-field"><label>{escape(label)}</label>'
+            f'<input id="{input_id}" name="{field_name(selector)}" data-attr="{attr}" autocomplete="off" /></div>'
+        )
+    if spec.date_range:
+        start, end, attr = spec.date_range
+        search.append(
+            f'<div class="f-field"><label>日期</label>'
+            f'<input id="{start.lstrip("#")}" data-range="start" data-attr="{attr}" autocomplete="off" />'
+            f'<span>至</span><input id="{end.lstrip("#")}" data-range="end" data-attr="{attr}" autocomplete="off" /></div>'
+        )
+    headers = "".join(f"<th>{escape(label)}</th>" for _, label in spec.columns)
+    body = f"""
+<form id="form1" method="post">
+{_hidden_fields()}
+<div id="Panel1" class="f-panel">
+  <div id="Panel1_panelTop" class="f-search">{"".join(search)}{_button(LIST_SEARCH_BUTTON.lstrip("#"), "搜索")}</div>
+  <div id="Panel1_Toolbar1" class="f-toolbar">
+    {_button("Panel1_Toolbar1_Button2", "新增")}{_button("Panel1_Toolbar1_Button3", "修改")}{_button("Panel1_Toolbar1_Button4", "删除")}
+  </div>
+  <div id="Panel1_Grid1" class="f-grid">
+    <table><thead><tr><th class="f-grid-check"></th><th>{escape(spec.link_label)}</th>{headers}</tr></thead><tbody></tbody></table>
+    <div class="f-grid-emptytext" hidden>没有数据</div>
+  </div>
+</div>
+</form>"""
+    data = {
+        "page": "list",
+        "listId": spec.list_id,
+        "moduleId": spec.module_id,
+        "formId": spec.form_id,
+        "title": spec.title,
+        "linkAttr": spec.link_attr,
+        "columns": [attr for attr, _ in spec.columns],
+    }
+    return _layout(spec.title, body, data)
+
+
+def _field_html(spec: FieldSpec, value: str, key: str = "") -> str:
+    """
+    表单字段
+    :param spec: 字段定义
+    :param value: 字段值
+    :param key: 选择窗口字段所选记录的键值
+    :return: HTML
+    """
+    attrs = f'id="{spec.input_id}" name="{spec.name}" value="{escape(value)}" autocomplete="off"'
+    trigger = ""
+    if spec.kind == "combo":
+        options = escape(json.dumps(list(spec.options), ensure_ascii=False))
+        attrs += f' data-kind="combo" data-options="{options}"'
+    elif spec.kind == "picker":
+        trigger = (
+            f'<i class="f-triggerbox-trigger1 f-triggericon-search" data-picker="{spec.picker}" '
+            f'data-multi="{1 if spec.multi else 0}" data-field="{spec.control_id}"></i>'
+            f'<input type="hidden" id="{spec.control_id}-hiddenEl" name="{spec.key_name}" value="{escape(key)}" />'
+        )
+    kind = " f-triggerbox" if spec.kind == "picker" else ""
+    return (
+        f'<div id="{spec.control_id}" class="f-field{kind}">'
+        f"<label>{escape(spec.label)}</label><input {attrs} />{trigger}</div>"
+    )
+
+
+def _record_value(record: Optional[dict], attr: str) -> str:
+    """
+    获取记录中的字段值
+    :param record: 记录
+    :param attr: 属性名
+    :return: 字段值文本
+    """
+    value = (record or {}).get(attr, "")
+    return ",".join(value) if isinstance(value, list) else str(value)
+
+
+def render_form(spec: FormSpec, record: Optional[dict] = None, is_add: bool = True) -> str:
+    """
+    新增或修改表单页面
+    :param spec: 表单定义
+    :param record: 修改时的原记录
+    :param is_add: 是否为新增表单，新增表单显示"保存并新增"按钮
+    :return: HTML
+    """
+    fields = "".join(
+        _field_html(f, _record_value(record, f.attr), _record_value(record, f.key_attr))
+        for f in spec.fields
+    )
+    buttons = _button(spec.save_button, "保存")
+    if is_add:
+        buttons += _button(spec.save_and_new_button, "保存并新增")
+    body = f"""
+<form id="form1" method="post">
+{_hidden_fields()}
+<div id="Panel2" class="f-panel">
+  <div id="Panel2_Toptb" class="f-toolbar">{buttons}</div>
+  <div id="Panel2_ContentPanel1" class="f-form">{fields}</div>
+</div>
+</form>"""
+    return _layout(spec.title, body, {"page": "form", "formId": spec.form_id})
+
+
+def render_detail(spec: FormSpec, record: dict) -> str:
+    """
+    详情页面
+    :param spec: 表单定义
+    :param record: 记录
+    :return: HTML
+    """
+    rows = "".join(
+        f"<tr><th>{escape(f.label)}</th><td>{escape(_record_value(record, f.attr))}</td></tr>"
+        for f in spec.fields
+    )
+    body = f"""
+<div id="Panel2" class="f-panel">
+  <div id="Panel2_ContentPanel1" class="f-form">
+    <table class="f-detail">
+      <tr><td id="Panel2_ContentPanel1_MainTitleTD" colspan="2">{escape(_record_value(record, spec.title_attr))}</td></tr>
+      {rows}
+    </table>
+  </div>
+</div>"""
+    return _layout(f"{spec.title}详情", body, {"page": "detail"})
+
+
+def render_select_grid(picker: str, field_id: str, multi: bool) -> str:
+    """
+    选择窗口页面
+    :param picker: 选择类型：person, project
+    :param field_id: 选择结果回填的控件ID
+    :param multi: 是否多选
+    :return: HTML
+    """
+    body = f"""
+<div id="PanMain" class="f-panel">
+  <div id="PanMain_Toolbar1" class="f-toolbar">
+    <input id="PanMain_Toolbar1_TextBox1-inputEl" name="PanMain$Toolbar1$TextBox1" autocomplete="off" />
+    {_button("PanMain_Toolbar1_Button3", "搜索")}{_button("PanMain_Toolbar1_Button1", "确定")}
+  </div>
+  <div id="PanMain_Grid1" class="f-grid">
+    <table><tbody></tbody></table>
+    <div class="f-grid-emptytext" hidden>没有数据</div>
+  </div>
+</div>"""
+    data = {"page": "select", "picker": picker, "field": field_id, "multi": multi}
+    return _layout("选择", body, data)
+
+
+def list_rows(spec: ListSpec, records: List[dict]) -> List[dict]:
+    """
+    将记录转换为列表数据
+    :param spec: 列表定义
+    :param records: 记录列表
+    :return: 列表行数据
+    """
+    attrs = [spec.link_attr] + [attr for attr, _ in spec.columns]
+    return [
+        {"id": record["id"], **{attr: _record_value(record, attr) for attr in attrs}}
+        for record in records
+    ]
+
+
+def render_list_postback(rows: List[dict]) -> str:
+    """
+    列表搜索按钮ajax回发的响应，与FineUI一致，返回更新表格数据的脚本，不回显搜索框的值
+    :param rows: 列表行数据
+    :return: 脚本
+    """
+    return f"F('Panel1_Grid1').loadData({json.dumps(rows, ensure_ascii=False)});"
@@ -0,0 +1,457 @@
+"""
+FineUI替身服务，在本机模拟被测系统的登录、主页面、列表、表单和选择窗口，供离线运行和基准测试使用
+用法(在src目录下执行):
+    python -m standin.server [--port 8765] [--latency-ms 0] [--jitter-ms 0]
+"""
+
+import argparse
+import json
+import mimetypes
+import os
+import random
+import sys
+import threading
+import time
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, quote, urlsplit
+
+from config.config import (
+    STANDIN_HOST,
+    STANDIN_PORT,
+    STANDIN_LATENCY_MS,
+    STANDIN_JITTER_MS,
+)
+from standin.pages import (
+    FORMS,
+    LISTS,
+    LIST_SEARCH_BUTTON,
+    field_name,
+    list_rows,
+    render_detail,
+    render_form,
+    render_list,
+    render_list_postback,
+    render_login,
+    render_main,
+    render_select_grid,
+)
+from standin.store import Store
+from utils.logger import logger
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+AUTH_COOKIE = ".ASPXAUTH"
+SUCCESS_MESSAGE = "保存数据成功！"
+
+# 需要登录才能访问的页面
+PROTECTED_PAGES = ("/default.aspx", "/loadlists.aspx", "/loadforms.aspx", "/selectgrid.aspx")
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """替身服务请求处理类"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "Microsoft-IIS/10.0"
+
+    @property
+    def standin(self) -> "StandinServer":
+        """所属的替身服务"""
+        return self.server.standin
+
+    def log_message(self, format, *args):
+        """请求日志只在调试级别输出"""
+        logger.debug("替身服务: " + format, *args)
+
+    # 请求解析
+    def _parse(self):
+        """解析请求路径和查询参数"""
+        parts = urlsplit(self.path)
+        self.route = parts.path.lower()
+        self.query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+
+    def _form(self) -> Dict[str, str]:
+        """
+        读取urlencoded请求体
+        :return: 字段名与值的字典
+        """
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8") if length else ""
+        return {k: v[-1] for k, v in parse_qs(body, keep_blank_values=True).items()}
+
+    def _token(self) -> Optional[str]:
+        """
+        获取请求中的会话令牌
+        :return: 会话令牌
+        """
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return cookie[AUTH_COOKIE].value if AUTH_COOKIE in cookie else None
+
+    def _is_ajax(self) -> bool:
+        """是否为页面脚本发起的请求"""
+        return self.headers.get("X-Requested-With") == "XMLHttpRequest"
+
+    # 响应输出
+    def _send(
+        self,
+        status: int,
+        body: bytes = b"",
+        content_type: str = "text/html; charset=utf-8",
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        输出响应
+        :param status: 状态码
+        :param body: 响应内容
+        :param content_type: 内容类型
+        :param headers: 额外的响应头
+        """
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _html(self, page_html: str, status: int = HTTPStatus.OK):
+        """输出HTML页面"""
+        self._send(status, page_html.encode("utf-8"), headers={"Cache-Control": "no-cache"})
+
+    def _json(self, data, status: int = HTTPStatus.OK):
+        """输出JSON数据"""
+        self._send(
+            status,
+            json.dumps(data, ensure_ascii=False).encode("utf-8"),
+            "application/json; charset=utf-8",
+            {"Cache-Control": "no-cache"},
+        )
+
+    def _redirect(self, location: str, headers: Optional[Dict[str, str]] = None):
+        """输出302跳转"""
+        self._send(HTTPStatus.FOUND, headers={"Location": location, **(headers or {})})
+
+    def _not_found(self):
+        """输出404"""
+        self._send(HTTPStatus.NOT_FOUND, "页面不存在".encode("utf-8"), "text/plain; charset=utf-8")
+
+    # 请求分发
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        self._dispatch()
+
+    def do_POST(self):
+        self._dispatch()
+
+    def _dispatch(self):
+        """按路径分发请求"""
+        self._parse()
+        try:
+            if self.route.startswith("/res/"):
+                return self._static()
+            if self.route.startswith("/standin/"):
+                return self._admin()
+
+            self.standin.delay()
+            user = self.standin.store.session_user(self._token())
+            if self.route in PROTECTED_PAGES and not user:
+                if self._is_ajax():
+                    return self._send(HTTPStatus.UNAUTHORIZED)
+                return self._redirect("/login.aspx?ReturnUrl=" + quote(self.path, safe=""))
+
+            handler = {
+                "/": self._root,
+                "/login.aspx": self._login,
+                "/logout.aspx": self._logout,
+                "/default.aspx": self._main,
+                "/loadlists.aspx": self._list,
+                "/loadforms.aspx": self._form_page,
+                "/selectgrid.aspx": self._select_grid,
+            }.get(self.route)
+            if handler is None:
+                return self._not_found()
+            handler(user)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        except Exception as e:
+            logger.error("替身服务处理请求失败: %s %s, %s", self.command, self.path, e)
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR, str(e).encode("utf-8"), "text/plain; charset=utf-8")
+
+    def _static(self):
+        """静态资源，不注入延迟"""
+        name = os.path.basename(self.route)
+        path = os.path.join(STATIC_DIR, name)
+        if not os.path.isfile(path):
+            return self._not_found()
+        with open(path, "rb") as f:
+            body = f.read()
+        content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        self._send(
+            HTTPStatus.OK,
+            body,
+            f"{content_type}; charset=utf-8",
+            {"Cache-Control": "public, max-age=3600"},
+        )
+
+    def _admin(self):
+        """管理接口：健康检查、重置数据、调整延迟"""
+        store = self.standin.store
+        if self.route == "/standin/health":
+            return self._json(
+                {
+                    "status": "ok",
+                    "customers": store.count("customer"),
+                    "loans": store.count("loan"),
+                    "latency_ms": self.standin.latency_ms,
+                    "jitter_ms": self.standin.jitter_ms,
+                }
+            )
+        if self.command != "POST":
+            return self._send(HTTPStatus.METHOD_NOT_ALLOWED)
+        if self.route == "/standin/reset":
+            store.reset()
+            return self._json({"status": "ok"})
+        if self.route == "/standin/latency":
+            length = int(self.headers.get("Content-Length") or 0)
+            data = json.loads(self.rfile.read(length) or b"{}")
+            self.standin.latency_ms = int(data.get("latency_ms", self.standin.latency_ms))
+            self.standin.jitter_ms = int(data.get("jitter_ms", self.standin.jitter_ms))
+            return self._json({"status": "ok"})
+        self._not_found()
+
+    # 页面
+    def _root(self, user: Optional[str]):
+        self._redirect("/Default.aspx" if user else "/login.aspx")
+
+    def _login(self, user: Optional[str]):
+        """登录页面，POST时校验用户名密码并写入登录Cookie"""
+        return_url = self.query.get("ReturnUrl", "")
+        if self.command != "POST":
+            return self._html(render_login(return_url))
+
+        form = self._form()
+        token = self.standin.store.login(
+            form.get("Panel$txtUserID", ""), form.get("Panel$txtPassword", "")
+        )
+        if not token:
+            return self._html(render_login(return_url, "用户名或密码错误"))
+        # 只允许站内跳转
+        location = return_url if return_url.startswith("/") else "/Default.aspx"
+        self._redirect(location, {"Set-Cookie": f"{AUTH_COOKIE}={token}; Path=/; HttpOnly"})
+
+    def _logout(self, user: Optional[str]):
+        self.standin.store.logout(self._token())
+        self._redirect("/login.aspx", {"Set-Cookie": f"{AUTH_COOKIE}=; Path=/; Max-Age=0"})
+
+    def _main(self, user: str):
+        self._html(render_main(user))
+
+    def _list(self, user: str):
+        """
+        列表页面，action=data返回列表数据，action=delete删除记录，
+        搜索按钮回发时按回发的搜索框的值搜索，返回更新表格数据的脚本
+        """
+        spec = LISTS.get(self.query.get("listid", ""))
+        if spec is None:
+            return self._not_found()
+        store = self.standin.store
+        action = self.query.get("action")
+
+        if action == "data":
+            filters = {
+                attr: self.query.get(attr, "").strip()
+                for _, attr, _ in spec.search_fields
+            }
+            date_range = None
+            if spec.date_range:
+                attr = spec.date_range[2]
+                date_range = (
+                    attr,
+                    self.query.get(f"{attr}_start", "").strip(),
+                    self.query.get(f"{attr}_end", "").strip(),
+                )
+            records = store.search(spec.entity, filters, date_range)
+            return self._json({"rows": list_rows(spec, records)})
+
+        if action == "delete":
+            if self.command != "POST":
+                return self._send(HTTPStatus.METHOD_NOT_ALLOWED)
+            record_id = self._form().get("id") or self.query.get("id", "")
+            success = record_id.isdigit() and store.delete(spec.entity, int(record_id))
+            return self._json({"success": bool(success)})
+
+        if self.command == "POST":
+            form = self._form()
+            if form.get("__EVENTTARGET") != field_name(LIST_SEARCH_BUTTON):
+                return self._send(HTTPStatus.BAD_REQUEST)
+            filters = {
+                attr: form.get(field_name(selector), "").strip()
+                for selector, attr, _ in spec.search_fields
+            }
+            rows = list_rows(spec, store.search(spec.entity, filters))
+            return self._send(
+                HTTPStatus.OK,
+                render_list_postback(rows).encode("utf-8"),
+                "text/plain; charset=utf-8",
+                {"Cache-Control": "no-cache"},
+            )
+
+        self._html(render_list(spec))
+
+    def _form_page(self, user: str):
+        """表单页面：新增、修改、详情(Soflag=1)，POST时保存"""
+        spec = FORMS.get(self.query.get("formid", ""))
+        if spec is None:
+            return self._not_found()
+        store = self.standin.store
+        record_id = self.query.get("id", "")
+        record_id = int(record_id) if record_id.isdigit() else None
+        record = store.get(spec.entity, record_id) if record_id else None
+        if record_id and record is None:
+            return self._not_found()
+
+        if self.command == "POST":
+            return self._save(spec, record_id)
+        if self.query.get("Soflag") == "1" and record:
+            return self._html(render_detail(spec, record))
+        self._html(render_form(spec, record, is_add=record is None))
+
+    def _save(self, spec, record_id: Optional[int]):
+        """
+        保存表单，与FineUI一致，成功时返回包含保存成功提示的响应
+        :param spec: 表单定义
+        :param record_id: 修改的记录ID，新增时为None
+        """
+        form = self._form()
+        fields = {
+            field.attr: form.get(field.name, "").strip()
+            for field in spec.fields
+            if field.name in form
+        }
+        # 选择窗口字段与FineUI一致，以隐藏字段中所选记录的键值为准
+        for field in spec.fields:
+            keys = [key for key in form.get(field.key_name, "").split(",") if key] if field.picker else []
+            if not keys:
+                continue
+            names = self.standin.store.picker_names(field.picker, keys)
+            if names is None:
+                return self._html(f"保存失败：{field.label}选择的记录不存在")
+            fields[field.attr] = ",".join(names)
+            fields[field.key_attr] = ",".join(keys)
+        title_field = next(f for f in spec.fields if f.attr == spec.title_attr)
+        if record_id is None and not fields.get(spec.title_attr):
+            return self._html(f"保存失败：{title_field.label}不能为空")
+        saved_id = self.standin.store.save(spec.entity, fields, record_id)
+        logger.debug("替身服务保存记录: %s %s", spec.entity, saved_id)
+        self._html(SUCCESS_MESSAGE)
+
+    def _select_grid(self, user: str):
+        """选择窗口页面，action=data返回可选数据(含记录键值)，q按文本搜索"""
+        picker = self.query.get("type", "person")
+        if self.query.get("action") == "data":
+            keyword = self.query.get("q", "").strip()
+            rows = self.standin.store.picker_rows(picker)
+            return self._json({"rows": [row for row in rows if keyword in row["name"]]})
+        self._html(
+            render_select_grid(
+                picker, self.query.get("field", ""), self.query.get("multi") == "1"
+            )
+        )
+
+
+class StandinServer:
+    """替身服务类，在后台线程中运行HTTP服务"""
+
+    def __init__(
+        self,
+        host: str = STANDIN_HOST,
+        port: int = STANDIN_PORT,
+        latency_ms: int = STANDIN_LATENCY_MS,
+        jitter_ms: int = STANDIN_JITTER_MS,
+    ):
+        """
+        初始化替身服务
+        :param host: 监听地址
+        :param port: 监听端口，为0时由系统分配
+        :param latency_ms: 每个动态请求注入的延迟(毫秒)
+        :param jitter_ms: 延迟的随机抖动范围(毫秒)
+        """
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.store = Store()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """服务地址"""
+        return f"http://{self.host}:{self.port}"
+
+    def delay(self):
+        """按配置注入响应延迟"""
+        delay_ms = self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+    def start(self) -> str:
+        """
+        在后台线程中启动服务
+        :return: 服务地址
+        """
+        self._httpd = ThreadingHTTPServer((self.host, self.port), StandinHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.standin = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="standin-server", daemon=True
+        )
+        self._thread.start()
+        logger.info("替身服务已启动: %s", self.base_url)
+        return self.base_url
+
+    def stop(self):
+        """停止服务"""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+            logger.info("替身服务已停止: %s", self.base_url)
+
+    def __enter__(self) -> "StandinServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def main(argv=None):
+    """
+    命令行入口
+    :param argv: 命令行参数
+    """
+    parser = argparse.ArgumentParser(description="本地FineUI替身服务")
+    parser.add_argument("--host", default=STANDIN_HOST, help="监听地址")
+    parser.add_argument("--port", type=int, default=STANDIN_PORT, help="监听端口")
+    parser.add_argument("--latency-ms", type=int, default=STANDIN_LATENCY_MS, help="注入延迟(毫秒)")
+    parser.add_argument("--jitter-ms", type=int, default=STANDIN_JITTER_MS, help="延迟抖动(毫秒)")
+    args = parser.parse_args(argv)
+
+    server = StandinServer(args.host, args.port, args.latency_ms, args.jitter_ms)
+    print(server.start())
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
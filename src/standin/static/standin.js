@@ -0,0 +1,388 @@
+/* FineUI替身服务页面脚本，只实现自动化测试用到的交互 */
+(function () {
+    'use strict';
+
+    // FineUI组件访问入口：F(id) 返回带 setValue/getValue 的组件对象
+    const F = function (id) {
+        const el = document.getElementById(id + '-inputEl') || document.getElementById(id);
+        if (!el || !('value' in el)) return null;
+        return {
+            setValue: (value) => { el.value = value == null ? '' : String(value); },
+            getValue: () => el.value,
+        };
+    };
+    F.ajaxProcessing = false;
+    window.F = F;
+
+    let pending = 0;
+
+    const $ = (selector, root) => (root || document).querySelector(selector);
+    const $$ = (selector, root) => Array.from((root || document).querySelectorAll(selector));
+
+    const escapeHtml = (text) => String(text == null ? '' : text)
+        .replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+
+    const fire = (el, type) => el.dispatchEvent(new Event(type, { bubbles: true }));
+
+    // 异步请求，请求期间 F.ajaxProcessing 为 true
+    const ajax = async (url, options) => {
+        pending += 1;
+        F.ajaxProcessing = true;
+        try {
+            const response = await fetch(url, Object.assign({
+                credentials: 'same-origin',
+                headers: { 'X-Requested-With': 'XMLHttpRequest' },
+            }, options || {}));
+            if (response.status === 401) {
+                window.top.location.href = '/login.aspx';
+                throw new Error('登录已失效');
+            }
+            return response;
+        } finally {
+            pending -= 1;
+            F.ajaxProcessing = pending > 0;
+        }
+    };
+
+    const postForm = (url, params) => ajax(url, {
+        method: 'POST',
+        headers: {
+            'X-Requested-With': 'XMLHttpRequest',
+            'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+        },
+        body: params.toString(),
+    });
+
+    // 消息框，返回点击的按钮(ok/cancel)
+    const messagebox = (message, withCancel) => new Promise((resolve) => {
+        const mask = document.createElement('div');
+        mask.className = 'f-mask';
+        const box = document.createElement('div');
+        box.className = 'f-messagebox';
+        box.innerHTML =
+            '<div class="f-messagebox-header">提示</div>' +
+            '<div class="f-messagebox-message"><span>' + escapeHtml(message) + '</span></div>' +
+            '<div class="f-messagebox-buttons">' +
+            '<a class="f-btn" href="javascript:;" data-action="ok"><span class="f-btn-text"><span>确定</span></span></a>' +
+            (withCancel ? '<a class="f-btn" href="javascript:;" data-action="cancel"><span class="f-btn-text"><span>取消</span></span></a>' : '') +
+            '</div>';
+        box.addEventListener('click', (event) => {
+            const button = event.target.closest('[data-action]');
+            if (!button) return;
+            mask.remove();
+            box.remove();
+            resolve(button.dataset.action);
+        });
+        document.body.appendChild(mask);
+        document.body.appendChild(box);
+    });
+
+    const onClick = (id, handler) => {
+        const el = document.getElementById(id);
+        if (el) el.addEventListener('click', (event) => { event.preventDefault(); handler(event); });
+    };
+
+    // 去掉记录ID后的地址作为标签页标识，同一表单的新增和修改共用一个标签页
+    const tabKey = (url) => url.replace(/[?&]id=\d+/i, '');
+
+    // 主页面：模块切换、菜单展开、标签页
+    const initMain = () => {
+        const strip = $('.f-tab-strip');
+        const body = $('.f-tab-body');
+
+        const activate = (key) => {
+            $$('.f-tab-header', strip).forEach((h) => h.classList.toggle('f-tab-active', h.dataset.key === key));
+            $$('.f-tab-pane', body).forEach((p) => { p.hidden = p.dataset.key !== key; });
+        };
+
+        const openTab = (url, title) => {
+            const key = tabKey(url);
+            let pane = $$('.f-tab-pane', body).find((p) => p.dataset.key === key);
+            if (pane) {
+                const frame = $('iframe', pane);
+                if (frame.getAttribute('src') !== url) frame.setAttribute('src', url);
+                $$('.f-tab-header', strip).find((h) => h.dataset.key === key).firstChild.textContent = title;
+            } else {
+                const header = document.createElement('div');
+                header.className = 'f-tab-header';
+                header.dataset.key = key;
+                header.innerHTML = escapeHtml(title) + '<em class="f-tab-close">×</em>';
+                header.addEventListener('click', (event) => {
+                    if (event.target.classList.contains('f-tab-close')) {
+                        header.remove();
+                        pane.remove();
+                        const last = $$('.f-tab-header', strip).pop();
+                        if (last) activate(last.dataset.key);
+                    } else {
+                        activate(key);
+                    }
+                });
+                strip.appendChild(header);
+                pane = document.createElement('div');
+                pane.className = 'f-tab-pane';
+                pane.dataset.key = key;
+                pane.innerHTML = '<iframe frameborder="0"></iframe>';
+                $('iframe', pane).setAttribute('src', url);
+                body.appendChild(pane);
+            }
+            activate(key);
+        };
+        standin.openTab = openTab;
+
+        $$('.f-module').forEach((module) => {
+            module.addEventListener('click', () => {
+                $$('.f-module').forEach((m) => m.classList.toggle('f-module-active', m === module));
+                $$('.f-menu').forEach((menu) => { menu.hidden = menu.dataset.module !== module.dataset.module; });
+            });
+        });
+        $$('.f-tree-node-text').forEach((text) => {
+            text.addEventListener('click', () => { text.nextElementSibling.hidden = false; });
+        });
+        $$('.f-tree-link').forEach((link) => {
+            link.addEventListener('click', (event) => {
+                event.preventDefault();
+                openTab(link.getAttribute('href'), link.textContent);
+            });
+        });
+    };
+
+    // 在主页面的标签页中打开地址，不在主页面中时直接跳转
+    const openTab = (url, title) => {
+        try {
+            if (window.top.standin && window.top.standin.openTab) {
+                window.top.standin.openTab(url, title);
+                return;
+            }
+        } catch (e) {
+            // 跨域时直接跳转
+        }
+        window.location.href = url;
+    };
+
+    // 列表页面：搜索、选择行、新增、修改、删除
+    const initList = (data) => {
+        const tbody = $('#Panel1_Grid1 tbody');
+        const empty = $('#Panel1_Grid1 .f-grid-emptytext');
+        const base = 'Loadlists.aspx?listid=' + data.listId;
+        const formUrl = 'LoadForms.aspx?formid=' + data.formId;
+        let query = '';
+        let selected = null;
+
+        const render = (rows) => {
+            selected = null;
+            tbody.innerHTML = rows.map((row, index) =>
+                '<tr class="f-grid-row" data-rowid="frow' + index + '" data-id="' + row.id + '">' +
+                '<td data-columnid="fineui_14" class="f-grid-cell-check"><div class="f-grid-checkbox"></div></td>' +
+                '<td data-columnid="fineui_15"><div class="f-grid-cell-inner">' +
+                '<a href="javascript:;" class="f-grid-link" data-title="' + escapeHtml(row[data.linkAttr]) + '">' +
+                escapeHtml(row[data.linkAttr]) + '</a></div></td>' +
+                data.columns.map((attr, i) =>
+                    '<td data-columnid="fineui_' + (16 + i) + '"><div class="f-grid-cell-inner">' +
+                    escapeHtml(row[attr]) + '</div></td>').join('') +
+                '</tr>').join('');
+            empty.hidden = rows.length > 0;
+        };
+
+        // 与FineUI一致，请求期间清空表格，避免把上一次的结果当作本次结果
+        const clear = () => {
+            selected = null;
+            tbody.innerHTML = '';
+            empty.hidden = true;
+        };
+
+        const load = async () => {
+            clear();
+            const response = await ajax(base + '&action=data' + query);
+            render((await response.json()).rows);
+        };
+
+        const collectQuery = () => {
+            const params = new URLSearchParams();
+            $$('#Panel1_panelTop input[data-attr]').forEach((input) => {
+                const name = input.dataset.range ? input.dataset.attr + '_' + input.dataset.range : input.dataset.attr;
+                if (input.value.trim()) params.set(name, input.value.trim());
+            });
+            const text = params.toString();
+            return text ? '&' + text : '';
+        };
+
+        tbody.addEventListener('click', (event) => {
+            const row = event.target.closest('tr.f-grid-row');
+            if (!row) return;
+            const link = event.target.closest('a.f-grid-link');
+            if (link) {
+                event.preventDefault();
+                openTab(formUrl + '&Soflag=1&id=' + row.dataset.id, link.dataset.title);
+                return;
+            }
+            $$('tr.f-grid-row', tbody).forEach((r) => r.classList.toggle('f-grid-row-selected', r === row));
+            selected = row.dataset.id;
+        });
+
+        onClick('Panel1_panelTop_BtnSearch', () => { query = collectQuery(); load(); });
+        $$('#Panel1_panelTop input').forEach((input) => {
+            input.addEventListener('keydown', (event) => {
+                if (event.key === 'Enter') { query = collectQuery(); load(); }
+            });
+        });
+        onClick('Panel1_Toolbar1_Button2', () => openTab(formUrl + '&ModuleID=' + data.moduleId, '新增'));
+        onClick('Panel1_Toolbar1_Button3', () => {
+            if (!selected) { messagebox('请选择一条记录'); return; }
+            openTab(formUrl + '&ModuleID=' + data.moduleId + '&id=' + selected, '修改');
+        });
+        onClick('Panel1_Toolbar1_Button4', async () => {
+            if (!selected) { messagebox('请选择一条记录'); return; }
+            const id = selected;
+            if (await messagebox('是否确定要删除选中记录？', true) !== 'ok') return;
+            await postForm(base + '&action=delete', new URLSearchParams({ id: id }));
+            await load();
+        });
+
+        load();
+    };
+
+    // 下拉框：获得焦点或输入时在输入框下方显示匹配的选项
+    const initCombo = (input) => {
+        const options = JSON.parse(input.dataset.options || '[]');
+        const wrapper = input.parentElement;
+        const close = () => { const list = $('ul.f-combo-list', wrapper); if (list) list.remove(); };
+        const open = () => {
+            close();
+            const keyword = input.value.trim();
+            let matched = options.filter((o) => o.indexOf(keyword) >= 0);
+            if (!matched.length) matched = options;
+            const list = document.createElement('ul');
+            list.className = 'f-combo-list';
+            list.innerHTML = matched.map((o) => '<li>' + escapeHtml(o) + '</li>').join('');
+            list.addEventListener('mousedown', (event) => {
+                const item = event.target.closest('li');
+                if (!item) return;
+                event.preventDefault();
+                input.value = item.textContent;
+                fire(input, 'change');
+                close();
+            });
+            wrapper.appendChild(list);
+        };
+        input.addEventListener('focus', open);
+        input.addEventListener('input', open);
+        input.addEventListener('click', () => { if (!$('ul.f-combo-list', wrapper)) open(); });
+        input.addEventListener('blur', () => setTimeout(close, 150));
+    };
+
+    // 表单页面：下拉框、选择窗口、保存
+    const initForm = () => {
+        const form = $('#form1');
+        $$('input[data-kind="combo"]', form).forEach(initCombo);
+
+        $$('.f-triggericon-search', form).forEach((trigger) => {
+            trigger.addEventListener('click', () => {
+                const win = document.createElement('div');
+                win.className = 'f-window';
+                win.dataset.field = trigger.dataset.field;
+                win.innerHTML =
+                    '<div class="f-window-header">选择<em class="f-window-close">×</em></div>' +
+                    '<iframe frameborder="0"></iframe>';
+                $('iframe', win).setAttribute('src', 'SelectGrid.aspx?type=' + trigger.dataset.picker +
+                    '&field=' + encodeURIComponent(trigger.dataset.field) + '&multi=' + trigger.dataset.multi);
+                $('.f-window-close', win).addEventListener('click', () => win.remove());
+                document.body.appendChild(win);
+            });
+        });
+
+        // 选择窗口确定后回填并关闭窗口
+        standin.pickerSelected = (field, values, keys) => {
+            const input = document.getElementById(field + '-inputEl');
+            const hidden = document.getElementById(field + '-hiddenEl');
+            if (hidden) hidden.value = keys.join(',');
+            if (input) {
+                input.value = values.join(',');
+                fire(input, 'change');
+            }
+            $$('.f-window').filter((w) => w.dataset.field === field).forEach((w) => w.remove());
+        };
+
+        const save = async (button, andNew) => {
+            const params = new URLSearchParams(new FormData(form));
+            params.set('__EVENTTARGET', button.replace(/_/g, '$'));
+            params.set('__EVENTARGUMENT', '');
+            const response = await postForm(window.location.href, params);
+            const text = await response.text();
+            if (text.indexOf('保存数据成功') >= 0) {
+                if (andNew) {
+                    $$('#Panel2_ContentPanel1 input', form).forEach((input) => { input.value = ''; });
+                }
+                messagebox('保存数据成功！');
+            } else {
+                messagebox(text || '保存失败');
+            }
+        };
+        onClick('Panel2_Toptb_Button2', () => save('Panel2_Toptb_Button2', false));
+        onClick('Panel2_Toptb_Button3', () => save('Panel2_Toptb_Button3', true));
+    };
+
+    // 选择窗口页面：搜索、选择、确定
+    // 与FineUI一致：点击行只选中该行，多选时点击行首的复选框增减选中行，重新加载数据后清空选中
+    const initSelect = (data) => {
+        const tbody = $('#PanMain_Grid1 tbody');
+        const empty = $('#PanMain_Grid1 .f-grid-emptytext');
+        const keyword = $('#PanMain_Toolbar1_TextBox1-inputEl');
+        const keys = {};
+
+        const load = async () => {
+            const url = 'SelectGrid.aspx?type=' + data.picker + '&action=data&q=' + encodeURIComponent(keyword.value.trim());
+            tbody.innerHTML = '';
+            empty.hidden = true;
+            const rows = (await (await ajax(url)).json()).rows;
+            rows.forEach((row) => { keys[row.name] = row.id; });
+            const checker = data.multi
+                ? '<td class="f-grid-cell-check"><div class="f-grid-checkbox"></div></td>'
+                : '';
+            tbody.innerHTML = rows.map((row, index) =>
+                '<tr class="f-grid-row" data-rowid="frow' + index + '" data-value="' + escapeHtml(row.name) + '">' + checker +
+                '<td><div class="f-grid-cell-inner"><span>' + escapeHtml(row.name) + '</span></div></td></tr>').join('');
+            empty.hidden = rows.length > 0;
+        };
+
+        tbody.addEventListener('click', (event) => {
+            const row = event.target.closest('tr.f-grid-row');
+            if (!row) return;
+            if (data.multi && event.target.closest('.f-grid-checkbox')) {
+                row.classList.toggle('f-grid-row-selected');
+            } else {
+                $$('tr.f-grid-row', tbody).forEach((r) => r.classList.toggle('f-grid-row-selected', r === row));
+            }
+        });
+
+        onClick('PanMain_Toolbar1_Button3', load);
+        keyword.addEventListener('keydown', (event) => { if (event.key === 'Enter') load(); });
+        onClick('PanMain_Toolbar1_Button1', () => {
+            const values = $$('tr.f-grid-row-selected', tbody).map((r) => r.dataset.value);
+            if (!values.length) { messagebox('请选择记录'); return; }
+            window.parent.standin.pickerSelected(data.field, values, values.map((name) => keys[name]));
+        });
+
+        load();
+    };
+
+    // 登录页面：点击登录按钮或回车提交表单
+    const initLogin = (data) => {
+        const form = $('#form1');
+        onClick('Panel_btnLogin', () => form.submit());
+        $$('input', form).forEach((input) => {
+            input.addEventListener('keydown', (event) => { if (event.key === 'Enter') form.submit(); });
+        });
+        if (data.error) messagebox(data.error);
+    };
+
+    const standin = {
+        init: (data) => {
+            const pages = { login: initLogin, main: initMain, list: initList, form: initForm, select: initSelect };
+            if (pages[data.page]) pages[data.page](data);
+        },
+        openTab: null,
+        pickerSelected: null,
+        messagebox: messagebox,
+    };
+    window.standin = standin;
+})();
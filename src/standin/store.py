@@ -0,0 +1,167 @@
+"""
+替身服务的内存数据存储
+"""
+
+import secrets
+import threading
+from typing import Dict, List, Optional
+
+from config.config import LOGIN_USERNAME, LOGIN_PASSWORD
+from utils.test_data import TestData
+
+
+class Store:
+    """内存数据存储类，保存用户会话、客户和借款申请记录，多线程共享"""
+
+    def __init__(self):
+        """初始化数据存储"""
+        self._lock = threading.Lock()
+        self.users = {LOGIN_USERNAME: LOGIN_PASSWORD}
+        self.persons = list(TestData.person_name)
+        self.projects = list(TestData.project_names)
+        self._sessions: Dict[str, str] = {}
+        self._records: Dict[str, Dict[int, dict]] = {"customer": {}, "loan": {}}
+        self._next_id = 1
+
+    def reset(self):
+        """清空所有记录和会话"""
+        with self._lock:
+            self._sessions.clear()
+            for records in self._records.values():
+                records.clear()
+            self._next_id = 1
+
+    # 选择窗口相关
+    def picker_rows(self, picker: str) -> List[dict]:
+        """
+        获取选择窗口的全部可选记录，键值为记录在列表中的序号
+        :param picker: 选择窗口类型：person, project
+        :return: [{"id": 键值, "name": 记录文本}]
+        """
+        names = self.projects if picker == "project" else self.persons
+        return [{"id": str(index + 1), "name": name} for index, name in enumerate(names)]
+
+    def picker_names(self, picker: str, keys: List[str]) -> Optional[List[str]]:
+        """
+        按键值查找选择窗口记录的文本
+        :param picker: 选择窗口类型
+        :param keys: 键值列表
+        :return: 记录文本列表，有键值不存在时返回None
+        """
+        names = {row["id"]: row["name"] for row in self.picker_rows(picker)}
+        if not all(key in names for key in keys):
+            return None
+        return [names[key] for key in keys]
+
+    # 会话相关
+    def login(self, username: str, password: str) -> Optional[str]:
+        """
+        校验用户名密码并创建会话
+        :param username: 用户名
+        :param password: 密码
+        :return: 会话令牌，校验失败时返回None
+        """
+        if self.users.get(username) != password:
+            return None
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._sessions[token] = username
+        return token
+
+    def session_user(self, token: Optional[str]) -> Optional[str]:
+        """
+        获取会话对应的用户
+        :param token: 会话令牌
+        :return: 用户名，会话无效时返回None
+        """
+        with self._lock:
+            return self._sessions.get(token) if token else None
+
+    def logout(self, token: Optional[str]):
+        """
+        结束会话
+        :param token: 会话令牌
+        """
+        with self._lock:
+            self._sessions.pop(token, None)
+
+    # 记录相关
+    def save(self, entity: str, fields: dict, record_id: Optional[int] = None) -> int:
+        """
+        新增或更新记录
+        :param entity: 数据类型：customer, loan
+        :param fields: 字段值，键为数据模型属性名
+        :param record_id: 记录ID，为None时新增
+        :return: 记录ID
+        """
+        with self._lock:
+            records = self._records[entity]
+            if record_id is None or record_id not in records:
+                record_id = self._next_id
+                self._next_id += 1
+                records[record_id] = {"id": record_id}
+            records[record_id].update(fields)
+            return record_id
+
+    def get(self, entity: str, record_id: int) -> Optional[dict]:
+        """
+        获取记录
+        :param entity: 数据类型
+        :param record_id: 记录ID
+        :return: 记录副本，不存在时返回None
+        """
+        with self._lock:
+            record = self._records[entity].get(record_id)
+            return dict(record) if record else None
+
+    def delete(self, entity: str, record_id: int) -> bool:
+        """
+        删除记录
+        :param entity: 数据类型
+        :param record_id: 记录ID
+        :return: 是否删除成功
+        """
+        with self._lock:
+            return self._records[entity].pop(record_id, None) is not None
+
+    def search(
+        self,
+        entity: str,
+        filters: Dict[str, str],
+        date_range: Optional[tuple] = None,
+        limit: int = 20,
+    ) -> List[dict]:
+        """
+        搜索记录，文本条件按包含匹配，结果按ID倒序
+        :param entity: 数据类型
+        :param filters: 字段名与搜索文本的字典
+        :param date_range: (字段名, 开始日期, 结束日期)，日期为空表示不限
+        :param limit: 最多返回的记录数
+        :return: 记录副本列表
+        """
+        results = []
+        with self._lock:
+            for record in reversed(list(self._records[entity].values())):
+                if any(
+                    text and text not in str(record.get(field, ""))
+                    for field, text in filters.items()
+                ):
+                    continue
+                if date_range:
+                    field, start, end = date_range
+                    value = str(record.get(field, ""))
+                    if (start and value < start) or (end and value > end):
+                        continue
+                results.append(dict(record))
+                if len(results) >= limit:
+                    break
+        return results
+
+    def count(self, entity: str) -> int:
+        """
+        获取记录总数
+        :param entity: 数据类型
+        :return: 记录数
+        """
+        with self._lock:
+            return len(self._records[entity])
@@ -2,17 +2,23 @@
 Pytest配置文件，包含测试固件
 """
 
-import os
 import pytest
 import allure
-from datetime import datetime
 
 from utils.browser_factory import BrowserFactory
+from utils.context_pool import ContextPool
 from utils.logger import logger
 from pages.login_page import LoginPage
 from pages.customer_page import CustomerPage
 from pages.loan_page import LoanPage
-from config.config import SCREENSHOT_PATH
+from utils.screenshot_service import screenshot_service
+from utils.network_profile import get_route_stats
+from standin.pages import FORMS
+from standin.server import StandinServer
+from utils import data_seeder
+from utils.data_seeder import CUSTOMER_PICKER_FIELDS, LOAN_PICKER_FIELDS
+from utils.picker_cache import PickerCache
+from config.config import BROWSER_SERVER_ENABLED, STANDIN_ENABLED, BASE_URL
 
 
 @pytest.fixture(scope="session")
@@ -24,19 +30,68 @@ def browser_context_args():
 
 
 @pytest.fixture(scope="session")
-def browser(request):
+def standin_server():
+    """
+    启用替身服务时在本进程启动FineUI替身服务，端口已被占用时使用已运行的服务
+    """
+    if not STANDIN_ENABLED:
+        yield None
+        return
+
+    server = StandinServer()
+    try:
+        server.start()
+    except OSError as e:
+        logger.info("替身服务端口已被占用，使用已运行的服务 %s: %s", BASE_URL, e)
+        yield None
+        return
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="module")
+def standin():
+    """在随机端口启动替身服务"""
+    with StandinServer(port=0) as server:
+        yield server
+
+
+@pytest.fixture(scope="function")
+def picker_values(standin, tmp_path, monkeypatch):
+    """
+    与界面选择后一致的选择窗口回填值缓存：每个选择窗口字段、每条可选记录各一条，
+    回填值为字段内输入框name -> 值(记录文本和键值)
+    """
+    cache = PickerCache(path=str(tmp_path / "picker_cache.json"))
+    monkeypatch.setattr(data_seeder, "picker_cache", cache)
+    fields = {field.attr: field for spec in FORMS.values() for field in spec.fields}
+    for attr, trigger in {**CUSTOMER_PICKER_FIELDS, **LOAN_PICKER_FIELDS}.items():
+        field = fields[attr]
+        cache.put_many(
+            f"{standin.base_url}|{trigger}",
+            {
+                row["name"]: {field.name: row["name"], field.key_name: row["id"]}
+                for row in standin.store.picker_rows(field.picker)
+            },
+        )
+    return cache
+
+
+@pytest.fixture(scope="session")
+def browser(request, standin_server):
     """
     创建浏览器实例
     """
     browser_type = request.config.getoption("--browser-type")
     headless = request.config.getoption("--headless-mode")
+    use_server = request.config.getoption("--browser-server")
 
     browser_factory = BrowserFactory()
     browser_instance, playwright_instance = browser_factory.get_browser(
-        browser_type=browser_type, headless=headless
+        browser_type=browser_type, headless=headless, use_server=use_server
     )
 
-    logger.info(f"启动{browser_type}浏览器实例，无头模式：{headless}")
+    logger.info("启动%s浏览器实例，无头模式：%s", browser_type, headless)
     yield browser_instance
 
     logger.info("关闭浏览器实例")
@@ -44,31 +99,46 @@ def browser(request):
     playwright_instance.stop()
 
 
+@pytest.fixture(scope="session")
+def context_pool(browser):
+    """
+    创建浏览器上下文池，每个进程预热若干个已登录的上下文
+    """
+    pool = ContextPool(browser)
+    pool.warm_up()
+    yield pool
+
+    logger.info("关闭浏览器上下文池")
+    pool.close()
+
+
 @pytest.fixture(scope="function")
-def context(browser):
+def context(context_pool, request):
     """
-    创建浏览器上下文
+    从上下文池借出浏览器上下文，用例结束后重置并归还
     """
-    browser_factory = BrowserFactory()
-    context = browser_factory.get_context(browser)
+    pooled = context_pool.acquire()
 
-    logger.info("创建浏览器上下文")
-    yield context
+    logger.info("借出浏览器上下文，已使用 %s 次", pooled.uses)
+    yield pooled.context
 
-    logger.info("关闭浏览器上下文")
-    context.close()
+    stats = get_route_stats(pooled.context)
+    if stats:
+        logger.info("网络路由统计: %s", stats.summary())
+
+    # 用例未通过时上下文状态不可信，直接回收
+    report = getattr(request.node, "rep_call", None)
+    context_pool.release(pooled, dirty=report is None or report.failed)
 
 
 @pytest.fixture(scope="function")
 def page(context):
     """
-    创建页面实例
+    获取页面实例，使用上下文中保留的页面，由上下文池负责重置
     """
-    page = context.new_page()
-    logger.info("创建新页面")
-    yield page
-    logger.info("关闭页面")
-    page.close()
+    page = context.pages[0] if context.pages else context.new_page()
+    logger.info("获取页面")
+    return page
 
 
 @pytest.fixture(scope="function")
@@ -84,7 +154,7 @@ def customer_page(page, login_page):
     """
     创建客户管理页面实例，并确保已登录
     """
-    login_page.login()
+    login_page.ensure_logged_in()
     return CustomerPage(page)
 
 @pytest.fixture(scope="class")
@@ -98,7 +168,7 @@ def loan_page(page, login_page):
     """
     创建借款申请页面实例，并确保已登录
     """
-    login_page.login()
+    login_page.ensure_logged_in()
     return LoanPage(page)
 
 
@@ -111,40 +181,45 @@ def shared_loan_data():
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    在测试失败时截图
+    记录用例结果，并在测试失败时截图
     """
     outcome = yield
     report = outcome.get_result()
+    # 保存各阶段的结果，供fixture在清理时判断用例是否通过
+    setattr(item, f"rep_{report.when}", report)
 
     if report.when == "call" and report.failed:
         try:
             page = item.funcargs.get("page")
             if page:
-                # 确保截图目录存在
-                if not os.path.exists(SCREENSHOT_PATH):
-                    os.makedirs(SCREENSHOT_PATH)
-
-                # 生成截图文件名
-                timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+                # 生成截图名称
                 test_name = (
                     item.nodeid.replace("/", "_").replace(":", "_").replace("::", "_")
                 )
-                screenshot_path = os.path.join(
-                    SCREENSHOT_PATH, f"fail_{test_name}_{timestamp}.png"
-                )
 
-                # 保存截图
-                page.screenshot(path=screenshot_path)
-                logger.info(f"测试失败，截图保存至: {screenshot_path}")
+                # 截图数据保存在内存中，写盘在后台完成
+                screenshot = screenshot_service.capture(page, f"fail_{test_name}")
+                logger.info("测试失败，截图保存至: %s", screenshot.path)
 
-                # 将截图附加到Allure报告
-                allure.attach.file(
-                    screenshot_path,
+                # 将内存中的截图直接附加到Allure报告
+                allure.attach(
+                    screenshot.data,
                     name="失败截图",
-                    attachment_type=allure.attachment_type.PNG,
+                    attachment_type=(
+                        allure.attachment_type.JPG
+                        if screenshot.image_type == "jpeg"
+                        else allure.attachment_type.PNG
+                    ),
                 )
         except Exception as e:
-            logger.error(f"保存失败截图时出错: {e}")
+            logger.error("保存失败截图时出错: %s", e)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    测试会话结束时等待后台截图写入完成
+    """
+    screenshot_service.flush()
 
 
 def pytest_addoption(parser):
@@ -160,3 +235,9 @@ def pytest_addoption(parser):
     parser.addoption(
         "--headless-mode", action="store_true", default=False, help="以无头模式运行"
     )
+    parser.addoption(
+        "--browser-server",
+        action="store_true",
+        default=BROWSER_SERVER_ENABLED,
+        help="连接本机共享的浏览器服务，不存在时自动启动",
+    )
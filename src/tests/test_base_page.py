@@ -0,0 +1,193 @@
+"""
+页面对象基类工具方法测试用例
+"""
+
+import gc
+import weakref
+from types import SimpleNamespace
+
+import allure
+from assertpy import assert_that
+
+from locators.customer_locators import CustomerLocators
+from locators.loan_locators import LoanLocators
+from pages.base.base_config import ResponsePattern
+from pages.base.base_page import BasePage
+from pages.base.frame_cache import FrameCache
+from pages.base.locator_cache import LocatorCache
+from pages.base.navigator import Navigator
+from pages.base.option_catalog import OptionCatalog, match_option
+from pages.base.scripts import APPLY_PICKER_FIELD_SCRIPT
+from pages.base import select_grid_picker
+from pages.base.select_grid_picker import SelectGridPicker
+from utils.picker_cache import PickerCache
+
+
+def fake_response(url: str, resource_type: str = "xhr"):
+    """构造只包含url和请求类型的响应对象"""
+    return SimpleNamespace(url=url, request=SimpleNamespace(resource_type=resource_type))
+
+
+class FakePage:
+    """只实现事件注册的页面对象"""
+
+    def __init__(self):
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def once(self, event, handler):
+        self.on(event, handler)
+
+    def remove_listener(self, event, handler):
+        self.handlers[event].remove(handler)
+
+    def emit(self, event, *args):
+        for handler in list(self.handlers.get(event, [])):
+            handler(*args)
+
+
+class HtmlOnlyContext:
+    """
+    模拟真实FineUI的页面上下文：SelectGrid.aspx只返回HTML，
+    除回填字段外的任何脚本(如请求选择窗口数据并按JSON解析)都会失败
+    """
+
+    def __init__(self):
+        self.scripts = []
+
+    def evaluate(self, script, arg=None):
+        self.scripts.append(script)
+        if script != APPLY_PICKER_FIELD_SCRIPT:
+            raise ValueError("SyntaxError: Unexpected token '<', \"<!DOCTYPE html>\" is not valid JSON")
+        return True
+
+
+class FakePickerPage:
+    """只提供站点地址和页面上下文的页面对象，打开选择窗口时失败"""
+
+    base_url = "http://fineui"
+
+    def __init__(self):
+        self.context = HtmlOnlyContext()
+
+    def get_context(self):
+        return self.context
+
+    def click(self, selector, *args, **kwargs):
+        raise AssertionError(f"命中缓存时不应打开选择窗口: {selector}")
+
+
+@allure.epic("测试工具")
+@allure.feature("页面对象基类")
+class TestBasePage:
+    """页面对象基类测试类"""
+
+    @allure.title("测试响应匹配")
+    def test_response_matcher(self):
+        """测试按地址匹配时只匹配ajax和页面请求，自定义函数原样使用"""
+        matcher = BasePage.response_matcher(ResponsePattern.LIST)
+        assert_that(matcher(fake_response("http://x/Loadlists.aspx?listid=391&action=data", "fetch"))).is_true()
+        assert_that(matcher(fake_response("http://x/LoadForms.aspx?formid=646"))).is_false()
+        assert_that(matcher(fake_response("http://x/Loadlists.aspx/res.axd", "script"))).is_false()
+
+        detail = BasePage.response_matcher(ResponsePattern.DETAIL)
+        assert_that(detail(fake_response("http://x/LoadForms.aspx?formid=646&Soflag=1&id=3", "document"))).is_true()
+        assert_that(detail(fake_response("http://x/LoadForms.aspx?formid=646&ModuleID=1", "document"))).is_false()
+
+        predicate = lambda response: response.url.endswith("ok")
+        assert_that(BasePage.response_matcher(predicate)).is_same_as(predicate)
+
+    @allure.title("测试选择窗口单元格选择器")
+    def test_select_grid_cell_selector(self):
+        """测试单元格按带引号的完整文本匹配，文本中的引号被转义"""
+        assert_that(SelectGridPicker.cell_selector("张三")).contains('>> text="张三" >>')
+        assert_that(SelectGridPicker.cell_selector('A"B')).contains(r'text="A\"B"')
+
+    @allure.title("测试选择窗口缓存命中时不请求服务端")
+    def test_select_grid_cache_without_lookup(self, tmp_path, monkeypatch):
+        """测试选择窗口地址只返回HTML时，缓存的回填值仍直接回填，不打开选择窗口也不改写缓存文件"""
+        cache = PickerCache(path=str(tmp_path / "picker_cache.json"))
+        monkeypatch.setattr(select_grid_picker, "picker_cache", cache)
+        page = FakePickerPage()
+        trigger = "#fzr i.f-triggericon-search"
+        cache.put(f"{page.base_url}|{trigger}", "张三", {"Panel2$fzr": "张三"})
+        with open(cache.path, "rb") as f:
+            content = f.read()
+
+        SelectGridPicker(page).select(trigger, "张三")
+
+        assert_that(page.context.scripts).is_equal_to([APPLY_PICKER_FIELD_SCRIPT])
+        with open(cache.path, "rb") as f:
+            assert_that(f.read()).is_equal_to(content)
+
+    @allure.title("测试选择窗口确定后检查回填结果")
+    def test_select_grid_missing_texts(self):
+        """测试按逗号拆分字段内各输入框的值，找出没有回填的记录"""
+        values = {"gxr": "张三,李四", "gxr$Value": "1,2"}
+        assert_that(SelectGridPicker.missing_texts(values, ["张三", "李四"])).is_empty()
+        assert_that(SelectGridPicker.missing_texts(values, ["张三", "王五", "李"])).is_equal_to(["王五", "李"])
+        assert_that(SelectGridPicker.missing_texts(None, ["张三"])).is_equal_to(["张三"])
+
+    @allure.title("测试多条记录的回填值拆分")
+    def test_select_grid_split_values(self):
+        """测试多选的回填值按逗号拆分为每条记录各自的回填值，数量对不上时不拆分"""
+        values = {"gxr": "张三,李四", "gxr-hiddenEl": "1,2"}
+        assert_that(SelectGridPicker.split_values(values, ["张三", "李四"])).is_equal_to(
+            {"张三": {"gxr": "张三", "gxr-hiddenEl": "1"}, "李四": {"gxr": "李四", "gxr-hiddenEl": "2"}}
+        )
+        assert_that(SelectGridPicker.split_values({"gxr": "张三,李四", "gxr-hiddenEl": ""}, ["张三", "李四"])).is_empty()
+        assert_that(SelectGridPicker.split_values(None, ["张三"])).is_empty()
+
+    @allure.title("测试下拉框选项目录")
+    def test_option_catalog(self):
+        """测试按formid缓存选项，按文本、选项值和唯一包含关系匹配，无效值单独返回"""
+        options = [{"value": "1", "text": "华南"}, {"value": "2", "text": "华东"}, {"value": "3", "text": "亚洲"}]
+        assert_that(match_option(options, "华东")).has_value("2")
+        assert_that(match_option(options, "3")).has_text("亚洲")
+        assert_that(match_option(options, "亚")).has_value("3")
+        assert_that(match_option(options, "华")).is_none()
+
+        catalog = OptionCatalog()
+        form_key = catalog.form_key("http://x/LoadForms.aspx?formid=646&ModuleID=30012928")
+        assert_that(form_key).is_equal_to(catalog.form_key("http://x/LoadForms.aspx?formid=646&id=8"))
+        catalog.update(form_key, {"#region": options, "#plain": None})
+        assert_that(catalog.missing(form_key, ["#region", "#plain", "#level"])).is_equal_to(["#level"])
+
+        choices, invalid = catalog.resolve(form_key, {"#region": "华南", "#plain": "x", "#level": "6星"})
+        assert_that(choices).is_equal_to({"#region": options[0]})
+        assert_that(invalid).is_empty()
+        assert_that(catalog.resolve(form_key, {"#region": "欧洲"})[1]).is_equal_to({"#region": "欧洲"})
+
+    @allure.title("测试按页面地址生成菜单链接和标签页选择器")
+    def test_navigator_url_selector(self):
+        """测试生成的选择器与定位器中的菜单链接和列表iframe一致"""
+        assert_that(Navigator.url_selector("a", "href", CustomerLocators.CUSTOMER_LIST_URL)).is_equal_to(
+            CustomerLocators.CUSTOMER_LIST_PAGE
+        )
+        assert_that(Navigator.url_selector("iframe", "src", CustomerLocators.ADD_CUSTOMER_FORM_URL)).is_equal_to(
+            CustomerLocators.ADD_CUSTOMER_FORM_IFRAME
+        )
+        assert_that(Navigator.url_selector("iframe", "src", LoanLocators.LOAN_LIST_URL)).is_equal_to(
+            LoanLocators.LOAN_LIST_IFRAME
+        )
+
+    @allure.title("测试页面缓存随页面释放")
+    def test_page_caches_released_with_page(self):
+        """测试同一页面共用一份缓存，页面关闭时移除事件监听，页面不再被引用后可以回收"""
+        page = FakePage()
+        locator_cache = LocatorCache.for_page(page)
+        frame_cache = FrameCache.for_page(page)
+        assert_that(LocatorCache.for_page(page)).is_same_as(locator_cache)
+        assert_that(FrameCache.for_page(page)).is_same_as(frame_cache)
+        assert_that(page.handlers["framenavigated"]).is_length(2)
+
+        page.emit("close", page)
+        assert_that(page.handlers["framenavigated"]).is_empty()
+        assert_that(page.handlers["framedetached"]).is_empty()
+
+        page_ref = weakref.ref(page)
+        del page, locator_cache, frame_cache
+        gc.collect()
+        assert_that(page_ref()).is_none()
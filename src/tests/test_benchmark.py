@@ -0,0 +1,58 @@
+"""
+基准测试工具测试用例
+"""
+
+import allure
+from assertpy import assert_that
+
+from benchmarks.primitives import evaluate_overhead
+from benchmarks.runner import compare, format_report, summarize_durations
+
+
+@allure.epic("测试工具")
+@allure.feature("基准测试")
+class TestBenchmark:
+    """基准测试工具测试类"""
+
+    @allure.title("测试耗时汇总")
+    def test_summarize_durations(self):
+        """测试只保留报告需要的统计指标"""
+        result = summarize_durations([100, 200, 300, 400], errors=1)
+        assert_that(result).contains_key("min", "median", "p95", "errors")
+        assert_that(result).does_not_contain_key("p99")
+        assert_that(result).has_min(100).has_median(250).has_errors(1)
+
+    @allure.title("测试与基线比较")
+    def test_compare(self):
+        """测试超过比例且超过噪声阈值时才判定为回退"""
+        baseline = {
+            "add_loan": {"median": 1000},
+            "search_loan": {"median": 100},
+            "edit_loan": {"median": 1000},
+        }
+        current = {
+            "add_loan": summarize_durations([1300]),
+            # 增长50%但只多了50ms，视为噪声
+            "search_loan": summarize_durations([150]),
+            "edit_loan": summarize_durations([], errors=2),
+            "delete_loan": summarize_durations([500]),
+        }
+        comparison = compare(current, baseline, tolerance=0.2, min_delta_ms=100)
+
+        assert_that(comparison["add_loan"]).has_status("regressed")
+        assert_that(comparison["add_loan"]["ratio"]).is_close_to(1.3, 0.001)
+        assert_that(comparison["search_loan"]).has_status("ok")
+        assert_that(comparison["edit_loan"]).has_status("failed")
+        assert_that(comparison["delete_loan"]).has_status("new")
+        assert_that(format_report(current, comparison)).contains("regressed", "+30%")
+
+    @allure.title("测试基础操作额外开销判定")
+    def test_evaluate_overhead(self):
+        """测试中位数额外开销超过阈值时判定为回退"""
+        raw = summarize_durations([2.0, 2.0, 2.0])
+        within = evaluate_overhead(summarize_durations([5.0, 6.0, 7.0]), raw, threshold_ms=5)
+        assert_that(within).has_overhead_ms(4.0).has_status("ok")
+        assert_that(within["overhead_ratio"]).is_equal_to(3.0)
+
+        exceeded = evaluate_overhead(summarize_durations([9.0, 9.0, 9.0]), raw, threshold_ms=5)
+        assert_that(exceeded).has_status("regressed")
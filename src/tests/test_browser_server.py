@@ -0,0 +1,79 @@
+"""
+浏览器服务测试用例
+"""
+
+import base64
+import hashlib
+import socket
+import threading
+
+import allure
+from assertpy import assert_that
+
+from utils.browser_server import BROWSER_SERVER_HOST, LAUNCH_SERVER_SCRIPT, WEBSOCKET_GUID, websocket_handshake
+
+
+def serve_once(respond) -> int:
+    """
+    在本机启动只处理一次连接的服务
+    :param respond: 根据请求头生成响应内容的函数
+    :return: 监听端口
+    """
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+
+    def handle():
+        conn, _ = server.accept()
+        with conn, server:
+            request = b""
+            while b"\r\n\r\n" not in request:
+                request += conn.recv(4096)
+            conn.sendall(respond(request.decode()))
+
+    threading.Thread(target=handle, daemon=True).start()
+    return server.getsockname()[1]
+
+
+def websocket_response(request: str) -> bytes:
+    """
+    按请求中的Sec-WebSocket-Key生成websocket握手响应
+    :param request: 请求内容
+    :return: 响应内容
+    """
+    key = next(
+        line.split(":", 1)[1].strip()
+        for line in request.split("\r\n")
+        if line.lower().startswith("sec-websocket-key:")
+    )
+    accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+    return (
+        "HTTP/1.1 101 Switching Protocols\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+    ).encode()
+
+
+@allure.epic("测试工具")
+@allure.feature("浏览器服务")
+class TestBrowserServer:
+    """浏览器服务测试类"""
+
+    @allure.title("测试健康检查完成websocket握手")
+    def test_websocket_handshake(self):
+        """测试服务端完成握手时健康检查通过"""
+        port = serve_once(websocket_response)
+        assert_that(websocket_handshake(f"ws://127.0.0.1:{port}/abc")).is_true()
+
+    @allure.title("测试端口可连接但不是websocket服务时健康检查失败")
+    def test_websocket_handshake_rejects_plain_http(self):
+        """测试端口被普通HTTP服务占用时健康检查失败，不会只凭TCP连接判定可用"""
+        port = serve_once(lambda request: b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+        assert_that(websocket_handshake(f"ws://127.0.0.1:{port}/abc")).is_false()
+
+    @allure.title("测试浏览器服务只监听本机回环地址")
+    def test_server_binds_loopback(self):
+        """测试启动脚本把监听地址传给launchServer"""
+        assert_that(BROWSER_SERVER_HOST).is_equal_to("127.0.0.1")
+        assert_that(LAUNCH_SERVER_SCRIPT).contains("host: process.env.PW_HOST")
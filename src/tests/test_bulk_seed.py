@@ -0,0 +1,107 @@
+"""
+批量造数工具测试用例
+"""
+
+import json
+import time
+
+import allure
+import requests
+from assertpy import assert_that
+
+from config.config import LOGIN_USERNAME, LOGIN_PASSWORD
+from utils.bulk_seed import ProgressJournal, RateLimiter, run, submit_with_retry
+
+
+@allure.epic("测试工具")
+@allure.feature("批量造数")
+class TestBulkSeed:
+    """批量造数工具测试类"""
+
+    @allure.title("测试进度日志只跳过已成功的序号")
+    def test_journal_resume(self, tmp_path):
+        """测试进度日志断点续传"""
+        journal = ProgressJournal(str(tmp_path / "seed" / "customer.jsonl"))
+        journal.record(0, "ok", name="a")
+        journal.record(1, "failed", name="b")
+        journal.record(2, "ok", name="c")
+        # 模拟中断时写了一半的行
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"index": 3, "sta')
+
+        assert_that(journal.completed()).is_equal_to({0, 2})
+
+    @allure.title("测试令牌桶限流")
+    def test_rate_limiter(self):
+        """测试限流器在令牌用完后按速率等待"""
+        limiter = RateLimiter(rate=20, burst=2)
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+        # 前2个令牌立即可用，后2个各需等待0.05秒
+        assert_that(time.monotonic() - start).is_between(0.08, 0.5)
+
+    @allure.title("测试失败重试")
+    def test_submit_with_retry(self):
+        """测试提交失败后重试，返回成功时的尝试次数"""
+        results = iter([False, False, True])
+        attempts = submit_with_retry(
+            lambda: next(results), RateLimiter(0), retries=3, backoff=0
+        )
+        assert_that(attempts).is_equal_to(3)
+
+        attempts = submit_with_retry(
+            lambda: False, RateLimiter(0), retries=1, backoff=0
+        )
+        assert_that(attempts).is_equal_to(0)
+
+    @allure.title("测试结果未知时重试前确认记录是否已创建")
+    def test_submit_with_retry_checks_existing(self):
+        """测试提交结果未知时先查询记录，已创建时不再提交，查询失败时本次不提交；确认未创建时直接重新提交"""
+        submits = []
+
+        def submit(result):
+            def _submit():
+                submits.append(1)
+                return result
+            return _submit
+
+        attempts = submit_with_retry(
+            submit(None), RateLimiter(0), retries=3, backoff=0, exists=iter([None, True]).__next__
+        )
+        assert_that(attempts).is_equal_to(2)
+        assert_that(submits).is_length(1)
+
+        submits.clear()
+        lookups = []
+        attempts = submit_with_retry(
+            submit(False), RateLimiter(0), retries=2, backoff=0, exists=lambda: lookups.append(1)
+        )
+        assert_that(attempts).is_equal_to(0)
+        assert_that(submits).is_length(3)
+        assert_that(lookups).is_empty()
+
+    @allure.title("测试在替身服务上批量造数")
+    def test_run_against_standin(self, standin, picker_values, tmp_path):
+        """测试通过FineUI回发保存、在列表回发的脚本响应(非JSON)中确认记录，全部成功且不重复创建"""
+        standin.store.reset()
+        session = requests.Session()
+        session.post(
+            f"{standin.base_url}/login.aspx",
+            data={"Panel$txtUserID": LOGIN_USERNAME, "Panel$txtPassword": LOGIN_PASSWORD},
+            timeout=5,
+        )
+        storage_state = tmp_path / "storage_state.json"
+        storage_state.write_text(
+            json.dumps(
+                {"cookies": [{"name": c.name, "value": c.value, "domain": c.domain, "path": c.path} for c in session.cookies]}
+            ),
+            encoding="utf-8",
+        )
+        journal_path = str(tmp_path / "seed" / "loan.jsonl")
+
+        failed = run("loan", 3, 2, 0, 1, journal_path, str(storage_state), standin.base_url)
+
+        assert_that(failed).is_equal_to(0)
+        assert_that(ProgressJournal(journal_path).completed()).is_equal_to({0, 1, 2})
+        assert_that(standin.store.count("loan")).is_equal_to(3)
@@ -7,6 +7,7 @@ import pytest
 from assertpy import assert_that
 from models.customer import Customer
 from utils.test_data import test_data_generator
+from utils.data_seeder import data_seeder
 from pages.customer_page import CustomerPage
 
 
@@ -17,14 +18,17 @@ class TestCustomer:
 
     def ensure_customer_exists(self, customer_page: CustomerPage, shared_customer_data):
         """确保测试客户存在，如果不存在则创建"""
-        customer_page.navigate_to_customer_page()
-        customer_page.click_customer_menu()
+        customer_page.open_customer_list()
         if not shared_customer_data:
             customer_data = test_data_generator.generate_customer_data()
-            customer_page.add_customer(customer_data)
-            assert_that(customer_page.is_customer_exists(customer_data)).is_true()
+            # 优先通过后台提交表单创建，确认未创建(返回False)时再走界面流程；
+            # 无法确认结果(返回None)时不再重复创建，由后续步骤的列表搜索校验
+            data_seeder.load_from_context(customer_page.page.context)
+            if data_seeder.seed_customer(customer_data) is False:
+                customer_page.add_customer(customer_data)
+                assert_that(customer_page.is_customer_exists(customer_data)).is_true()
+                customer_page.exit_frame()
             shared_customer_data.update(vars(customer_data))
-            customer_page.exit_frame()
         return Customer(**shared_customer_data)
 
     @pytest.mark.order(1)
@@ -36,11 +40,8 @@ class TestCustomer:
         with allure.step("生成测试客户数据"):
             customer_data = test_data_generator.generate_customer_data()
 
-        with allure.step("导航到客户管理页面"):
-            customer_page.navigate_to_customer_page()
-
-        with allure.step("点击客户管理菜单"):
-            customer_page.click_customer_menu()
+        with allure.step("打开客户信息列表"):
+            customer_page.open_customer_list()
 
         with allure.step("添加新客户"):
             customer_page.add_customer(customer_data)
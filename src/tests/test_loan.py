@@ -7,6 +7,7 @@ import pytest
 from assertpy import assert_that
 from models.loan import Loan
 from utils.test_data import test_data_generator
+from utils.data_seeder import data_seeder
 from pages.loan_page import LoanPage
 
 
@@ -17,15 +18,17 @@ class TestLoan:
 
     def ensure_loan_exists(self, loan_page: LoanPage, shared_loan_data):
         """确保测试借款存在，如果不存在则创建"""
-        loan_page.navigate_to_loan_page()
-        loan_page.click_loan_menu()
-        loan_page.click_loan_list()
+        loan_page.open_loan_list()
         if not shared_loan_data:
             loan_data = test_data_generator.generate_loan_data()
-            loan_page.add_loan(loan_data)
-            assert_that(loan_page.is_loan_exists(loan_data)).is_true()
+            # 优先通过后台提交表单创建，确认未创建(返回False)时再走界面流程；
+            # 无法确认结果(返回None)时不再重复创建，由后续步骤的列表搜索校验
+            data_seeder.load_from_context(loan_page.page.context)
+            if data_seeder.seed_loan(loan_data) is False:
+                loan_page.add_loan(loan_data)
+                assert_that(loan_page.is_loan_exists(loan_data)).is_true()
+                loan_page.exit_frame()
             shared_loan_data.update(vars(loan_data))
-            loan_page.exit_frame()
         return Loan(**shared_loan_data)
 
     @pytest.mark.order(5)
@@ -37,14 +40,8 @@ class TestLoan:
         with allure.step("生成测试借款数据"):
             loan_data = test_data_generator.generate_loan_data()
 
-        with allure.step("导航到借款管理页面"):
-            loan_page.navigate_to_loan_page()
-
-        with allure.step("点击借款管理菜单"):
-            loan_page.click_loan_menu()
-
-        with allure.step("点击借款申请列表"):
-            loan_page.click_loan_list()
+        with allure.step("打开借款申请列表"):
+            loan_page.open_loan_list()
 
         with allure.step("添加新借款"):
             loan_page.add_loan(loan_data)
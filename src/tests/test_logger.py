@@ -0,0 +1,37 @@
+"""
+日志工具测试用例
+"""
+
+import logging
+import queue
+
+import allure
+from assertpy import assert_that
+
+from utils.logger import DeferredQueueHandler
+
+
+@allure.epic("测试工具")
+@allure.feature("日志")
+class TestLogger:
+    """日志工具测试类"""
+
+    @allure.title("测试入队时拼接消息参数")
+    def test_prepare_formats_args(self):
+        """测试可变参数在记录日志后被修改时，队列中的消息仍为记录时的值"""
+        log_queue = queue.Queue()
+        test_logger = logging.getLogger("test_deferred_queue_handler")
+        test_logger.propagate = False
+        test_logger.setLevel(logging.INFO)
+        handler = DeferredQueueHandler(log_queue)
+        test_logger.addHandler(handler)
+        try:
+            state = {"step": 1}
+            test_logger.info("页面状态: %s", state)
+            state["step"] = 2
+        finally:
+            test_logger.removeHandler(handler)
+
+        record = log_queue.get_nowait()
+        assert_that(record.getMessage()).is_equal_to("页面状态: {'step': 1}")
+        assert_that(record.args).is_none()
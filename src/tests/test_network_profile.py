@@ -0,0 +1,57 @@
+"""
+网络路由配置测试用例
+"""
+
+import os
+from types import SimpleNamespace
+
+import allure
+from assertpy import assert_that
+
+from utils.network_profile import ResourceSizes, RouteStats
+
+
+def make_response(resource_type: str, length: str = None):
+    """
+    构造只包含请求类型和响应头的响应对象
+    :param resource_type: 资源类型
+    :param length: content-length响应头，为None时不设置
+    :return: 响应对象
+    """
+    headers = {} if length is None else {"content-length": length}
+    return SimpleNamespace(headers=headers, request=SimpleNamespace(resource_type=resource_type))
+
+
+@allure.epic("测试工具")
+@allure.feature("网络路由")
+class TestNetworkProfile:
+    """网络路由配置测试类"""
+
+    @allure.title("测试按实测的资源大小统计节省流量")
+    def test_bytes_saved_from_measured_sizes(self, tmp_path):
+        """测试不拦截运行中记录的content-length在拦截运行中用于统计节省字节数"""
+        path = os.path.join(tmp_path, "network_sizes.json")
+        measured = ResourceSizes(path)
+        measured.observe(make_response("image", "1000"))
+        measured.observe(make_response("image", "3000"))
+        measured.observe(make_response("font", None))
+        measured.save()
+
+        stats = RouteStats(sizes=ResourceSizes(path))
+        stats.record("image", stubbed=True)
+        stats.record("font", stubbed=False)
+
+        assert_that(stats.bytes_saved).is_equal_to(2000)
+        assert_that(stats.unmeasured_requests).is_equal_to(1)
+        assert_that(stats.saved_requests).is_equal_to(2)
+
+    @allure.title("测试多次运行的实测数据累加")
+    def test_save_accumulates_runs(self, tmp_path):
+        """测试每次运行的实测数据累加到同一个文件"""
+        path = os.path.join(tmp_path, "network_sizes.json")
+        for length in ("100", "300"):
+            sizes = ResourceSizes(path)
+            sizes.observe(make_response("script", length))
+            sizes.save()
+
+        assert_that(ResourceSizes(path).averages()).is_equal_to({"script": 200.0})
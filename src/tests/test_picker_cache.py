@@ -0,0 +1,65 @@
+"""
+选择窗口回填值缓存测试用例
+"""
+
+import allure
+from assertpy import assert_that
+
+from utils.picker_cache import PickerCache
+
+SCOPE = "http://standin|#fzr i.f-triggericon-search"
+
+
+@allure.epic("测试工具")
+@allure.feature("选择窗口缓存")
+class TestPickerCache:
+    """选择窗口回填值缓存测试类"""
+
+    @allure.title("测试回填值持久化和过期")
+    def test_persist_and_expire(self, tmp_path):
+        """测试回填值写入文件后新实例可读取，超过复用时间后失效"""
+        path = str(tmp_path / "picker_cache.json")
+        PickerCache(path=path, ttl=60).put(SCOPE, "张鑫", {"fzr": "张鑫"})
+
+        assert_that(PickerCache(path=path, ttl=60).get(SCOPE, "张鑫")).is_equal_to({"fzr": "张鑫"})
+        assert_that(PickerCache(path=path, ttl=60).get("other", "张鑫")).is_none()
+        assert_that(PickerCache(path=path, ttl=-1).get(SCOPE, "张鑫")).is_none()
+        assert_that(PickerCache(path=path, ttl=60).get(SCOPE, "张鑫")).is_none()
+
+    @allure.title("测试淘汰最久未使用的条目")
+    def test_lru_eviction(self, tmp_path):
+        """测试超过条目数上限时淘汰最久未使用的条目，失效的条目可单独删除"""
+        cache = PickerCache(path=str(tmp_path / "picker_cache.json"), max_entries=2)
+        cache.put(SCOPE, "张鑫", {"fzr": "张鑫"})
+        cache.put(SCOPE, "李四", {"fzr": "李四"})
+        cache.get(SCOPE, "张鑫")
+        cache.put(SCOPE, "王五", {"fzr": "王五"})
+
+        assert_that(cache.get(SCOPE, "李四")).is_none()
+        assert_that(cache.get(SCOPE, "张鑫")).is_not_none()
+
+        cache.invalidate(SCOPE, "张鑫")
+        assert_that(PickerCache(path=cache.path).get(SCOPE, "张鑫")).is_none()
+        assert_that(PickerCache(path=cache.path).get(SCOPE, "王五")).is_equal_to({"fzr": "王五"})
+
+    @allure.title("测试多进程写入合并")
+    def test_merge_between_processes(self, tmp_path):
+        """测试命中时不写文件，保存时保留其他进程写入的条目，已删除的条目不被其他进程恢复"""
+        path = str(tmp_path / "picker_cache.json")
+        first, second = PickerCache(path=path), PickerCache(path=path)
+        first.put(SCOPE, "张鑫", {"fzr": "张鑫"})
+        second.put(SCOPE, "李四", {"fzr": "李四"})
+        first.put(SCOPE, "王五", {"fzr": "王五"})
+
+        with open(path, "rb") as f:
+            content = f.read()
+        first.get(SCOPE, "张鑫")
+        with open(path, "rb") as f:
+            assert_that(f.read()).is_equal_to(content)
+
+        second.invalidate(SCOPE, "张鑫")
+        first.flush()
+        reader = PickerCache(path=path)
+        assert_that(reader.get(SCOPE, "张鑫")).is_none()
+        assert_that(reader.get(SCOPE, "李四")).is_not_none()
+        assert_that(reader.get(SCOPE, "王五")).is_not_none()
@@ -0,0 +1,121 @@
+"""
+FineUI替身服务测试用例
+"""
+
+import allure
+import pytest
+from assertpy import assert_that
+
+from config.config import LOGIN_USERNAME, LOGIN_PASSWORD
+from locators.customer_locators import CustomerLocators
+from standin import server as standin_server
+from utils import data_seeder
+from utils.data_seeder import DataSeeder
+from utils.test_data import test_data_generator
+
+
+@pytest.fixture(scope="function")
+def seeder(standin, picker_values):
+    """已登录替身服务、选择窗口回填值已缓存的造数工具"""
+    standin.store.reset()
+    seeder = DataSeeder(base_url=standin.base_url, retries=0)
+    seeder.session.post(
+        f"{standin.base_url}/login.aspx",
+        data={"Panel$txtUserID": LOGIN_USERNAME, "Panel$txtPassword": LOGIN_PASSWORD},
+        timeout=5,
+    )
+    yield seeder
+    seeder.close()
+
+
+@allure.epic("测试工具")
+@allure.feature("替身服务")
+class TestStandin:
+    """替身服务测试类"""
+
+    @allure.title("测试未登录时跳转登录页面")
+    def test_requires_login(self, standin):
+        """测试未登录访问页面跳转登录页，脚本请求返回401"""
+        seeder = DataSeeder(base_url=standin.base_url, retries=0)
+        response = seeder.session.get(
+            f"{standin.base_url}/{CustomerLocators.CUSTOMER_LIST_URL}", allow_redirects=False, timeout=5
+        )
+        assert_that(response.status_code).is_equal_to(302)
+        assert_that(response.headers["Location"]).starts_with("/login.aspx?ReturnUrl=")
+
+        response = seeder.session.get(
+            f"{standin.base_url}/{CustomerLocators.CUSTOMER_LIST_URL}&action=data",
+            headers={"X-Requested-With": "XMLHttpRequest"},
+            timeout=5,
+        )
+        assert_that(response.status_code).is_equal_to(401)
+        seeder.close()
+
+    @allure.title("测试后台造数后可在列表中搜索和删除")
+    def test_seed_search_delete(self, standin, seeder):
+        """测试通过表单回发创建客户，列表接口按名称搜索并删除"""
+        customer = test_data_generator.generate_customer_data()
+        assert_that(seeder.seed_customer(customer)).is_true()
+
+        list_url = f"{standin.base_url}/{CustomerLocators.CUSTOMER_LIST_URL}"
+        rows = seeder.session.get(
+            f"{list_url}&action=data", params={"name": customer.name}, timeout=5
+        ).json()["rows"]
+        assert_that(rows).is_length(1)
+        assert_that(rows[0]).has_name(customer.name).has_level(customer.level)
+
+        detail = seeder.session.get(
+            f"{standin.base_url}/LoadForms.aspx?formid=646&Soflag=1&id={rows[0]['id']}", timeout=5
+        )
+        assert_that(detail.text).contains(customer.name, ",".join(customer.shared_persons))
+
+        result = seeder.session.post(
+            f"{list_url}&action=delete", data={"id": rows[0]["id"]}, timeout=5
+        ).json()
+        assert_that(result).has_success(True)
+        assert_that(standin.store.count("customer")).is_equal_to(0)
+
+    @allure.title("测试后台造数使用缓存的选择窗口回填值")
+    def test_seed_picker_values(self, standin, seeder):
+        """测试造数时提交界面选择时缓存的回填值(含记录键值)，没有缓存的记录不提交表单"""
+        loan = test_data_generator.generate_loan_data()
+        assert_that(seeder.seed_loan(loan)).is_true()
+        assert_that(seeder.loan_exists(loan)).is_true()
+
+        record = standin.store.search("loan", {"project_name": loan.project_name, "borrower": loan.borrower})[0]
+        persons = standin.store.picker_rows("person")
+        borrower_key = next(row["id"] for row in persons if row["name"] == loan.borrower)
+        assert_that(record).has_borrower_key(borrower_key)
+
+        loan.borrower = "不存在的人员"
+        assert_that(seeder.seed_loan(loan)).is_false()
+        assert_that(seeder.loan_exists(loan)).is_false()
+        assert_that(standin.store.count("loan")).is_equal_to(1)
+
+    @allure.title("测试保存响应没有成功提示时在列表中确认结果")
+    def test_seed_confirms_in_list(self, standin, seeder, monkeypatch):
+        """测试保存后的提示文字不同时仍按列表搜索结果判断，列表查询失败时返回None而不是False"""
+        monkeypatch.setattr(standin_server, "SUCCESS_MESSAGE", "操作完成")
+        customer = test_data_generator.generate_customer_data()
+        assert_that(seeder.seed_customer(customer)).is_true()
+
+        monkeypatch.setattr(seeder, "record_exists", lambda *args: None)
+        customer = test_data_generator.generate_customer_data()
+        assert_that(seeder.seed_customer(customer)).is_none()
+        assert_that(standin.store.count("customer")).is_equal_to(2)
+
+    @allure.title("测试列表搜索回发不回显搜索框的值")
+    def test_list_search_postback(self, standin, seeder):
+        """测试列表搜索回发返回更新表格的脚本而不是JSON，只有匹配的记录出现在响应中"""
+        customer = test_data_generator.generate_customer_data()
+        assert_that(seeder.customer_exists(customer)).is_false()
+        assert_that(seeder.seed_customer(customer)).is_true()
+
+        _, response = seeder.postback(
+            CustomerLocators.CUSTOMER_LIST_URL,
+            {"Panel1$panelTop$k1397": customer.name},
+            data_seeder.SEARCH_EVENT_TARGET,
+            data_seeder.FINEUI_AJAX_HEADERS,
+        )
+        assert_that(response.headers["Content-Type"]).starts_with("text/plain")
+        assert_that(response.text).starts_with("F('Panel1_Grid1').loadData(").contains(customer.name)
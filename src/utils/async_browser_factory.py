@@ -0,0 +1,75 @@
+"""
+异步浏览器工厂类，负责创建和管理基于asyncio的Playwright浏览器实例
+"""
+from playwright.async_api import async_playwright
+from config.config import BROWSER_TYPE, HEADLESS, SLOW_MO, BROWSER_SERVER_ENABLED, NETWORK_PROFILE, DEFAULT_TIMEOUT, NAVIGATION_TIMEOUT
+from utils.network_profile import apply_network_profile_async
+from utils.har_cache import har_cache
+from utils.browser_server import BrowserServer
+
+
+class AsyncBrowserFactory:
+    """异步浏览器工厂类，一个事件循环内可基于同一浏览器并发驱动多个上下文和页面"""
+
+    @staticmethod
+    async def get_browser(
+        browser_type=BROWSER_TYPE, headless=HEADLESS, slow_mo=SLOW_MO, use_server=BROWSER_SERVER_ENABLED
+    ):
+        """
+        获取浏览器实例
+        :param browser_type: 浏览器类型：chromium, firefox, webkit
+        :param headless: 是否无头模式
+        :param slow_mo: 操作延迟(毫秒)
+        :param use_server: 是否连接本机共享的浏览器服务，为False时在当前进程中启动浏览器
+        :return: 浏览器实例和playwright实例
+        """
+        playwright = await async_playwright().start()
+
+        if use_server:
+            server = BrowserServer(browser_type=browser_type, headless=headless)
+            browser = await server.connect_async(playwright, slow_mo=slow_mo)
+            return browser, playwright
+
+        if browser_type.lower() == "chromium":
+            browser = await playwright.chromium.launch(headless=headless, slow_mo=slow_mo)
+        elif browser_type.lower() == "firefox":
+            browser = await playwright.firefox.launch(headless=headless, slow_mo=slow_mo)
+        elif browser_type.lower() == "webkit":
+            browser = await playwright.webkit.launch(headless=headless, slow_mo=slow_mo)
+        else:
+            await playwright.stop()
+            raise ValueError(f"不支持的浏览器类型: {browser_type}")
+
+        return browser, playwright
+
+    @staticmethod
+    async def get_context(browser, network_profile=NETWORK_PROFILE, storage_state=None):
+        """
+        创建浏览器上下文
+        :param browser: 浏览器实例
+        :param network_profile: 网络路由配置：none, default, strict
+        :param storage_state: 登录状态，传入后创建的上下文已登录
+        :return: 浏览器上下文
+        """
+        context = await browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            accept_downloads=True,
+            storage_state=storage_state
+        )
+        # 设置超时
+        context.set_default_timeout(DEFAULT_TIMEOUT)
+        context.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
+        # 拦截与测试无关的图片、字体、媒体和第三方请求
+        await apply_network_profile_async(context, network_profile)
+        # 静态资源从HAR缓存回放，后注册的路由优先匹配，未命中时交给网络路由
+        await har_cache.apply_async(context)
+        return context
+
+    @staticmethod
+    async def get_page(context):
+        """
+        创建页面
+        :param context: 浏览器上下文
+        :return: 页面实例
+        """
+        return await context.new_page()
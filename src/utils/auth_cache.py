@@ -0,0 +1,138 @@
+"""
+登录状态缓存，保存登录后的storage_state，新建的浏览器上下文直接复用
+"""
+
+import json
+import os
+import re
+import time
+from typing import Optional
+
+from config.config import (
+    AUTH_CACHE_ENABLED,
+    AUTH_CACHE_SCOPE,
+    AUTH_STATE_PATH,
+    AUTH_STATE_TTL,
+)
+from utils.logger import logger
+
+
+class AuthCache:
+    """登录状态缓存类，按xdist进程或账号保存storage_state和登录后的落地页地址"""
+
+    def __init__(
+        self,
+        cache_dir: str = AUTH_STATE_PATH,
+        ttl: float = AUTH_STATE_TTL,
+        scope: str = AUTH_CACHE_SCOPE,
+        enabled: bool = AUTH_CACHE_ENABLED,
+    ):
+        """
+        初始化登录状态缓存
+        :param cache_dir: 缓存目录
+        :param ttl: 登录状态的最长复用时间(秒)
+        :param scope: 缓存范围：worker, account
+        :param enabled: 是否启用缓存
+        """
+        if scope not in ("worker", "account"):
+            raise ValueError(f"不支持的登录状态缓存范围: {scope}")
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.scope = scope
+        self.enabled = enabled
+
+    def state_path(self, username: str) -> str:
+        """
+        获取账号对应的缓存文件路径
+        :param username: 用户名
+        :return: 缓存文件路径
+        """
+        safe_name = re.sub(r"[^\w-]", "_", username)
+        if self.scope == "worker":
+            worker = os.getenv("PYTEST_XDIST_WORKER", "master")
+            return os.path.join(self.cache_dir, f"{worker}_{safe_name}.json")
+        return os.path.join(self.cache_dir, f"{safe_name}.json")
+
+    def load(self, username: str) -> Optional[dict]:
+        """
+        读取账号的登录状态
+        :param username: 用户名
+        :return: 包含storage_state、landing_url、saved_at的字典，未缓存或已过期时返回None
+        """
+        if not self.enabled:
+            return None
+        try:
+            with open(self.state_path(username), "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - cached.get("saved_at", 0) > self.ttl:
+            logger.info("登录状态已超过复用时间: %s", username)
+            return None
+        return cached
+
+    def storage_state(self, username: str) -> Optional[dict]:
+        """
+        获取用于创建浏览器上下文的storage_state
+        :param username: 用户名
+        :return: storage_state，未缓存或已过期时返回None
+        """
+        cached = self.load(username)
+        return cached["storage_state"] if cached else None
+
+    def _write(self, username: str, state: dict, landing_url: str):
+        """
+        写入缓存文件，先写临时文件再替换，避免其他进程读到不完整的内容
+        :param username: 用户名
+        :param state: storage_state
+        :param landing_url: 登录后的落地页地址
+        """
+        path = self.state_path(username)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "storage_state": state,
+                    "landing_url": landing_url,
+                    "saved_at": time.time(),
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(temp_path, path)
+        logger.info("保存登录状态: %s", path)
+
+    def save(self, context, username: str, landing_url: str):
+        """
+        保存浏览器上下文的登录状态
+        :param context: playwright浏览器上下文
+        :param username: 用户名
+        :param landing_url: 登录后的落地页地址
+        """
+        if self.enabled:
+            self._write(username, context.storage_state(), landing_url)
+
+    async def save_async(self, context, username: str, landing_url: str):
+        """
+        保存异步浏览器上下文的登录状态
+        :param context: playwright异步浏览器上下文
+        :param username: 用户名
+        :param landing_url: 登录后的落地页地址
+        """
+        if self.enabled:
+            self._write(username, await context.storage_state(), landing_url)
+
+    def invalidate(self, username: str):
+        """
+        删除账号的登录状态
+        :param username: 用户名
+        """
+        try:
+            os.remove(self.state_path(username))
+        except FileNotFoundError:
+            pass
+
+
+# 创建全局登录状态缓存实例
+auth_cache = AuthCache()
@@ -2,23 +2,35 @@
 浏览器工厂类，负责创建和管理Playwright浏览器实例
 """
 from playwright.sync_api import sync_playwright
-from config.config import BROWSER_TYPE, HEADLESS, SLOW_MO, DEFAULT_TIMEOUT, NAVIGATION_TIMEOUT
+from config.config import BROWSER_TYPE, HEADLESS, SLOW_MO, BROWSER_SERVER_ENABLED, NETWORK_PROFILE, DEFAULT_TIMEOUT, NAVIGATION_TIMEOUT
+from utils.network_profile import apply_network_profile
+from utils.har_cache import har_cache
+from utils.browser_server import BrowserServer
 
 
 class BrowserFactory:
     """浏览器工厂类，用于创建和管理Playwright浏览器实例"""
 
     @staticmethod
-    def get_browser(browser_type=BROWSER_TYPE, headless=HEADLESS, slow_mo=SLOW_MO):
+    def get_browser(
+        browser_type=BROWSER_TYPE, headless=HEADLESS, slow_mo=SLOW_MO, use_server=BROWSER_SERVER_ENABLED
+    ):
         """
         获取浏览器实例
         :param browser_type: 浏览器类型：chromium, firefox, webkit
         :param headless: 是否无头模式
         :param slow_mo: 操作延迟(毫秒)
+        :param use_server: 是否连接本机共享的浏览器服务，为False时在当前进程中启动浏览器
         :return: 浏览器实例
         """
         playwright = sync_playwright().start()
-        
+
+        if use_server:
+            # 连接的浏览器调用close()只断开连接，浏览器服务继续供其他进程使用
+            server = BrowserServer(browser_type=browser_type, headless=headless)
+            browser = server.connect(playwright, slow_mo=slow_mo)
+            return browser, playwright
+
         if browser_type.lower() == "chromium":
             browser = playwright.chromium.launch(headless=headless, slow_mo=slow_mo)
         elif browser_type.lower() == "firefox":
@@ -31,19 +43,26 @@ class BrowserFactory:
         return browser, playwright
 
     @staticmethod
-    def get_context(browser):
+    def get_context(browser, network_profile=NETWORK_PROFILE, storage_state=None):
         """
         创建浏览器上下文
         :param browser: 浏览器实例
+        :param network_profile: 网络路由配置：none, default, strict
+        :param storage_state: 登录状态，传入后创建的上下文已登录
         :return: 浏览器上下文
         """
         context = browser.new_context(
             viewport={"width": 1920, "height": 1080},
-            accept_downloads=True
+            accept_downloads=True,
+            storage_state=storage_state
         )
         # 设置超时
         context.set_default_timeout(DEFAULT_TIMEOUT)
         context.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
+        # 拦截与测试无关的图片、字体、媒体和第三方请求
+        apply_network_profile(context, network_profile)
+        # 静态资源从HAR缓存回放，后注册的路由优先匹配，未命中时交给网络路由
+        har_cache.apply(context)
         return context
 
     @staticmethod
@@ -0,0 +1,375 @@
+"""
+浏览器服务，在本机后台常驻一个Playwright浏览器服务，各进程通过websocket连接复用
+用法(在src目录下执行):
+    python -m utils.browser_server start|stop|restart|status [--browser-type chromium] [--headless]
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import importlib.metadata
+import importlib.util
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+
+from playwright.sync_api import Browser, Playwright, Error as PlaywrightError
+
+from config.config import (
+    BROWSER_TYPE,
+    HEADLESS,
+    SLOW_MO,
+    BROWSER_SERVER_DIR,
+    BROWSER_SERVER_START_TIMEOUT,
+)
+from utils.logger import logger
+
+# 服务只监听本机回环地址，websocket连接地址没有鉴权，不能暴露到CI主机所在的网络
+BROWSER_SERVER_HOST = "127.0.0.1"
+
+# websocket握手响应校验用的固定GUID(RFC 6455)
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC11B40"
+
+# 在Playwright自带的node中启动浏览器服务，启动后将连接地址写入状态文件
+# 浏览器进程退出时服务随之退出，客户端健康检查失败后会重新启动
+LAUNCH_SERVER_SCRIPT = """
+const fs = require('fs');
+const playwright = require(process.env.PW_PACKAGE_PATH);
+
+(async () => {
+    const server = await playwright[process.env.PW_BROWSER_TYPE].launchServer({
+        headless: process.env.PW_HEADLESS === '1',
+        host: process.env.PW_HOST,
+    });
+    const state = {
+        pid: process.pid,
+        wsEndpoint: server.wsEndpoint(),
+        browserType: process.env.PW_BROWSER_TYPE,
+        headless: process.env.PW_HEADLESS === '1',
+        version: process.env.PW_VERSION,
+        startedAt: Date.now() / 1000,
+    };
+    const stateFile = process.env.PW_STATE_FILE;
+    fs.writeFileSync(stateFile + '.tmp', JSON.stringify(state));
+    fs.renameSync(stateFile + '.tmp', stateFile);
+
+    const shutdown = async () => {
+        await server.close();
+        process.exit(0);
+    };
+    process.on('SIGTERM', shutdown);
+    process.on('SIGINT', shutdown);
+    server.process().on('exit', () => process.exit(1));
+})().catch((error) => {
+    console.error(error);
+    process.exit(1);
+});
+"""
+
+
+def driver_paths() -> Tuple[str, str]:
+    """
+    获取Playwright Python包自带的node和Node.js包路径
+    按requirements.txt中固定版本的安装包目录结构(playwright/driver/node、playwright/driver/package)查找，
+    不依赖playwright._impl下的私有接口，升级Playwright时需确认目录结构未变
+    :return: (node可执行文件路径, Node.js包目录)
+    """
+    spec = importlib.util.find_spec("playwright")
+    driver_dir = os.path.join(os.path.dirname(spec.origin), "driver")
+    node_path = os.path.join(driver_dir, "node.exe" if sys.platform == "win32" else "node")
+    package_path = os.path.join(driver_dir, "package")
+    if not os.path.isfile(node_path) or not os.path.isdir(package_path):
+        raise RuntimeError(f"未找到Playwright自带的node，请确认已安装requirements.txt中的版本: {driver_dir}")
+    return node_path, package_path
+
+
+def websocket_handshake(ws_endpoint: str, timeout: float = 2) -> bool:
+    """
+    与websocket地址完成一次握手，校验服务端返回101和正确的Sec-WebSocket-Accept
+    端口被其他进程占用或服务端无响应时握手失败
+    :param ws_endpoint: websocket连接地址
+    :param timeout: 超时时间(秒)
+    :return: 握手是否成功
+    """
+    endpoint = urlparse(ws_endpoint)
+    key = base64.b64encode(os.urandom(16)).decode()
+    request = (
+        f"GET {endpoint.path or '/'} HTTP/1.1\r\n"
+        f"Host: {endpoint.netloc}\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Key: {key}\r\n"
+        "Sec-WebSocket-Version: 13\r\n"
+        "\r\n"
+    )
+    expected = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+    try:
+        with socket.create_connection((endpoint.hostname, endpoint.port), timeout=timeout) as sock:
+            sock.sendall(request.encode())
+            response = b""
+            while b"\r\n\r\n" not in response:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    return False
+                response += chunk
+    except OSError:
+        return False
+    lines = response.split(b"\r\n\r\n", 1)[0].decode("latin-1").split("\r\n")
+    if len(lines[0].split()) < 2 or lines[0].split()[1] != "101":
+        return False
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return headers.get("sec-websocket-accept") == expected
+
+
+class BrowserServer:
+    """浏览器服务类，负责启动、健康检查、重启和连接本机的浏览器服务"""
+
+    def __init__(
+        self,
+        browser_type: str = BROWSER_TYPE,
+        headless: bool = HEADLESS,
+        server_dir: str = BROWSER_SERVER_DIR,
+        start_timeout: float = BROWSER_SERVER_START_TIMEOUT,
+    ):
+        """
+        初始化浏览器服务
+        :param browser_type: 浏览器类型：chromium, firefox, webkit
+        :param headless: 是否无头模式
+        :param server_dir: 服务状态和日志目录
+        :param start_timeout: 等待服务启动的最长时间(秒)
+        """
+        if browser_type.lower() not in ("chromium", "firefox", "webkit"):
+            raise ValueError(f"不支持的浏览器类型: {browser_type}")
+        self.browser_type = browser_type.lower()
+        self.headless = headless
+        self.start_timeout = start_timeout
+        # playwright的connect()默认不超时，浏览器无响应时按启动超时时间放弃并重启服务
+        self.connect_timeout = start_timeout * 1000
+        self.version = importlib.metadata.version("playwright")
+
+        # 不同浏览器类型和显示模式分别启动服务
+        name = f"{self.browser_type}_{'headless' if headless else 'headed'}"
+        os.makedirs(server_dir, exist_ok=True)
+        self.state_path = os.path.join(server_dir, f"{name}.json")
+        self.lock_path = os.path.join(server_dir, f"{name}.lock")
+        self.log_path = os.path.join(server_dir, f"{name}.log")
+
+    def read_state(self) -> Optional[dict]:
+        """
+        读取服务状态
+        :return: 服务状态，服务未启动时返回None
+        """
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_healthy(self, state: Optional[dict] = None) -> bool:
+        """
+        检查服务是否可用：版本与当前Playwright一致且websocket握手成功
+        浏览器进程退出时服务进程随之退出、握手失败；握手通过但浏览器无响应时，connect()超时后会重启服务
+        :param state: 服务状态，为None时读取状态文件
+        :return: 服务是否可用
+        """
+        state = state or self.read_state()
+        if not state or state.get("version") != self.version:
+            return False
+        return websocket_handshake(state["wsEndpoint"])
+
+    @contextmanager
+    def _lock(self):
+        """
+        跨进程文件锁，避免多个xdist进程同时启动服务
+        持有锁的进程异常退出时，锁文件超过启动超时时间后视为失效
+        """
+        deadline = time.time() + self.start_timeout * 2
+        while True:
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.lock_path) > self.start_timeout:
+                        os.remove(self.lock_path)
+                        continue
+                except OSError:
+                    continue
+                if time.time() > deadline:
+                    raise TimeoutError(f"等待浏览器服务锁超时: {self.lock_path}")
+                time.sleep(0.2)
+        try:
+            os.write(fd, str(os.getpid()).encode())
+            os.close(fd)
+            yield
+        finally:
+            try:
+                os.remove(self.lock_path)
+            except OSError:
+                pass
+
+    def _launch(self) -> dict:
+        """
+        启动服务进程并等待其写入状态文件
+        :return: 服务状态
+        """
+        node_path, package_path = driver_paths()
+        env = dict(
+            os.environ,
+            PW_PACKAGE_PATH=package_path,
+            PW_HOST=BROWSER_SERVER_HOST,
+            PW_BROWSER_TYPE=self.browser_type,
+            PW_HEADLESS="1" if self.headless else "0",
+            PW_VERSION=self.version,
+            PW_STATE_FILE=self.state_path,
+        )
+        # 服务进程与当前进程分离，测试进程退出后继续运行
+        if sys.platform == "win32":
+            detach = {
+                "creationflags": subprocess.DETACHED_PROCESS
+                | subprocess.CREATE_NEW_PROCESS_GROUP
+            }
+        else:
+            detach = {"start_new_session": True}
+
+        with open(self.log_path, "ab") as log_file:
+            process = subprocess.Popen(
+                [node_path, "-e", LAUNCH_SERVER_SCRIPT],
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                **detach,
+            )
+
+        deadline = time.time() + self.start_timeout
+        while time.time() < deadline:
+            state = self.read_state()
+            if state and state.get("pid") == process.pid:
+                logger.info("浏览器服务已启动: %s", state["wsEndpoint"])
+                return state
+            if process.poll() is not None:
+                raise RuntimeError(f"浏览器服务启动失败，详见日志: {self.log_path}")
+            time.sleep(0.1)
+        process.kill()
+        raise TimeoutError(f"浏览器服务启动超时，详见日志: {self.log_path}")
+
+    def _terminate(self, state: Optional[dict]):
+        """
+        结束服务进程并删除状态文件
+        :param state: 服务状态
+        """
+        if state:
+            try:
+                os.kill(state["pid"], signal.SIGTERM)
+                logger.info("停止浏览器服务: %s", state["pid"])
+            except (OSError, KeyError):
+                pass
+        try:
+            os.remove(self.state_path)
+        except OSError:
+            pass
+
+    def ensure_running(self) -> str:
+        """
+        确保服务可用，未启动或健康检查失败时(重新)启动
+        :return: websocket连接地址
+        """
+        state = self.read_state()
+        if self.is_healthy(state):
+            return state["wsEndpoint"]
+        with self._lock():
+            # 等待锁期间其他进程可能已经启动了服务
+            state = self.read_state()
+            if self.is_healthy(state):
+                return state["wsEndpoint"]
+            if state:
+                logger.warning("浏览器服务不可用，重新启动")
+            self._terminate(state)
+            return self._launch()["wsEndpoint"]
+
+    def stop(self):
+        """停止服务"""
+        with self._lock():
+            self._terminate(self.read_state())
+
+    def restart(self) -> str:
+        """
+        重启服务
+        :return: websocket连接地址
+        """
+        self.stop()
+        return self.ensure_running()
+
+    def connect(self, playwright: Playwright, slow_mo: int = SLOW_MO) -> Browser:
+        """
+        连接浏览器服务，连接失败时重启服务后重试一次
+        :param playwright: playwright实例
+        :param slow_mo: 操作延迟(毫秒)
+        :return: 浏览器实例，调用close()只断开连接，不会关闭服务
+        """
+        browser_type = getattr(playwright, self.browser_type)
+        try:
+            return browser_type.connect(self.ensure_running(), slow_mo=slow_mo, timeout=self.connect_timeout)
+        except PlaywrightError as e:
+            logger.warning("连接浏览器服务失败，重启后重试: %s", e)
+            return browser_type.connect(self.restart(), slow_mo=slow_mo, timeout=self.connect_timeout)
+
+    async def connect_async(self, playwright, slow_mo: int = SLOW_MO):
+        """
+        异步连接浏览器服务，连接失败时重启服务后重试一次
+        :param playwright: playwright异步实例
+        :param slow_mo: 操作延迟(毫秒)
+        :return: 异步浏览器实例
+        """
+        browser_type = getattr(playwright, self.browser_type)
+        ws_endpoint = await asyncio.to_thread(self.ensure_running)
+        try:
+            return await browser_type.connect(ws_endpoint, slow_mo=slow_mo, timeout=self.connect_timeout)
+        except PlaywrightError as e:
+            logger.warning("连接浏览器服务失败，重启后重试: %s", e)
+            ws_endpoint = await asyncio.to_thread(self.restart)
+            return await browser_type.connect(ws_endpoint, slow_mo=slow_mo, timeout=self.connect_timeout)
+
+
+def main(argv=None):
+    """
+    命令行入口
+    :param argv: 命令行参数
+    """
+    parser = argparse.ArgumentParser(description="管理本机的Playwright浏览器服务")
+    parser.add_argument("action", choices=["start", "stop", "restart", "status"])
+    parser.add_argument("--browser-type", default=BROWSER_TYPE, help="浏览器类型")
+    parser.add_argument("--headless", action="store_true", default=HEADLESS, help="无头模式")
+    args = parser.parse_args(argv)
+
+    server = BrowserServer(browser_type=args.browser_type, headless=args.headless)
+    if args.action == "start":
+        print(server.ensure_running())
+    elif args.action == "stop":
+        server.stop()
+    elif args.action == "restart":
+        print(server.restart())
+    else:
+        state = server.read_state()
+        if server.is_healthy(state):
+            print(json.dumps(state, ensure_ascii=False, indent=2))
+        else:
+            print("浏览器服务未运行")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+"""
+批量造数命令行工具，生成大量客户或借款申请数据并通过后台表单并发提交
+选择窗口字段使用界面选择时缓存的回填值，数据中的人员、项目需先在界面中选择过一次
+用法(在src目录下执行):
+    python -m utils.bulk_seed customer --count 100000 --workers 16 --rate 50
+中断后使用相同的 --journal 重新执行即可从断点继续
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Set
+
+from config.config import BASE_URL, LOGIN_USERNAME, SEED_JOURNAL_DIR, SEED_TIMEOUT
+from utils.auth_cache import auth_cache
+from utils.data_seeder import DataSeeder
+from utils.logger import logger
+from utils.test_data import test_data_generator
+
+# 各类数据的生成方法、提交方法、确认记录已创建的方法和日志中显示的名称字段
+ENTITIES = {
+    "customer": (
+        test_data_generator.generate_customer_data,
+        DataSeeder.seed_customer,
+        DataSeeder.customer_exists,
+        "name",
+    ),
+    "loan": (
+        test_data_generator.generate_loan_data,
+        DataSeeder.seed_loan,
+        DataSeeder.loan_exists,
+        "project_name",
+    ),
+}
+
+
+class RateLimiter:
+    """令牌桶限流器，多线程共享"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        初始化限流器
+        :param rate: 每秒允许的请求数，小于等于0表示不限流
+        :param burst: 令牌桶容量，默认与rate相同
+        """
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """获取一个令牌，令牌不足时等待"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class ProgressJournal:
+    """进度日志，每条记录一行JSON，用于中断后跳过已成功的序号"""
+
+    def __init__(self, path: str):
+        """
+        初始化进度日志
+        :param path: 日志文件路径
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def completed(self) -> Set[int]:
+        """
+        读取已成功的序号，忽略中断时写了一半的行
+        :return: 已成功的序号集合
+        """
+        done = set()
+        if not os.path.exists(self.path):
+            return done
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("status") == "ok":
+                    done.add(entry["index"])
+        return done
+
+    def record(self, index: int, status: str, **extra):
+        """
+        追加一条记录
+        :param index: 数据序号
+        :param status: ok 或 failed
+        :param extra: 附加信息
+        """
+        line = json.dumps(
+            {"index": index, "status": status, "time": time.time(), **extra},
+            ensure_ascii=False,
+        )
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+def submit_with_retry(
+    submit: Callable[[], Optional[bool]],
+    limiter: RateLimiter,
+    retries: int,
+    backoff: float = 0.5,
+    exists: Optional[Callable[[], Optional[bool]]] = None,
+) -> int:
+    """
+    限流后提交，失败时按指数退避重试
+    提交返回False表示确认没有创建，直接重新提交；返回None表示结果未知(如保存后查询列表失败)，
+    记录可能已在服务端保存，重试前先查询记录，确认不存在时才重新提交，查询仍失败时本次不提交，避免重复创建数据
+    :param submit: 提交函数，返回是否成功，无法确认结果时返回None
+    :param limiter: 限流器
+    :param retries: 失败后的重试次数
+    :param backoff: 首次重试的等待时间(秒)
+    :param exists: 查询记录是否已创建的函数，返回None表示查询失败
+    :return: 成功时返回尝试次数，全部失败时返回0
+    """
+    unknown = False
+    for attempt in range(1, retries + 2):
+        if attempt > 1:
+            time.sleep(backoff * 2 ** (attempt - 2))
+            if unknown and exists is not None:
+                found = exists()
+                if found:
+                    return attempt - 1
+                if found is None:
+                    continue
+        limiter.acquire()
+        result = submit()
+        if result:
+            return attempt
+        unknown = result is None
+    return 0
+
+
+def load_seeder(workers: int, storage_state: Optional[str], base_url: str = BASE_URL) -> DataSeeder:
+    """
+    创建造数工具并载入登录状态
+    :param workers: 并发数，同时作为连接池大小
+    :param storage_state: playwright storage_state文件路径，为None时使用登录状态缓存
+    :param base_url: 被测站点地址，同时决定使用哪个站点的选择窗口回填值缓存
+    :return: 造数工具
+    """
+    if storage_state:
+        with open(storage_state, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        landing_url = None
+    else:
+        cached = auth_cache.load(LOGIN_USERNAME)
+        if not cached:
+            raise SystemExit(
+                "未找到有效的登录状态，请先运行一次测试或通过 --storage-state 指定"
+            )
+        state, landing_url = cached["storage_state"], cached["landing_url"]
+
+    seeder = DataSeeder(base_url=base_url, pool_size=workers, timeout=SEED_TIMEOUT)
+    seeder.load_cookies(state.get("cookies", []), landing_url)
+    return seeder
+
+
+def run(
+    entity: str,
+    count: int,
+    workers: int,
+    rate: float,
+    retries: int,
+    journal_path: str,
+    storage_state: Optional[str] = None,
+    base_url: str = BASE_URL,
+) -> int:
+    """
+    批量造数
+    :param entity: 数据类型：customer, loan
+    :param count: 数据总数
+    :param workers: 并发数
+    :param rate: 每秒最多提交的请求数
+    :param retries: 单条数据失败后的重试次数
+    :param journal_path: 进度日志路径
+    :param storage_state: playwright storage_state文件路径
+    :param base_url: 被测站点地址
+    :return: 失败的数据条数
+    """
+    generate, seed, exists, label = ENTITIES[entity]
+    journal = ProgressJournal(journal_path)
+    done = journal.completed()
+    pending = [index for index in range(count) if index not in done]
+    logger.info(
+        "批量造数 %s: 共 %s 条，已完成 %s 条，待提交 %s 条",
+        entity,
+        count,
+        len(done),
+        len(pending),
+    )
+
+    seeder = load_seeder(workers, storage_state, base_url)
+    limiter = RateLimiter(rate)
+    # 限制已提交未完成的任务数，避免一次性生成全部数据占用内存
+    slots = threading.BoundedSemaphore(workers * 2)
+    counter_lock = threading.Lock()
+    stats = {"ok": 0, "failed": 0}
+    started = time.monotonic()
+
+    def seed_one(index: int, record):
+        try:
+            try:
+                attempts = submit_with_retry(
+                    lambda: seed(seeder, record),
+                    limiter,
+                    retries,
+                    exists=lambda: exists(seeder, record),
+                )
+                status = "ok" if attempts else "failed"
+                journal.record(
+                    index, status, name=getattr(record, label), attempts=attempts
+                )
+            except Exception as e:
+                status = "failed"
+                journal.record(index, status, name=getattr(record, label), error=str(e))
+            with counter_lock:
+                stats[status] += 1
+                finished = stats["ok"] + stats["failed"]
+            if finished % 100 == 0:
+                elapsed = time.monotonic() - started
+                logger.info(
+                    "进度 %s/%s，%.1f 条/秒", finished, len(pending), finished / elapsed
+                )
+        finally:
+            slots.release()
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for index in pending:
+                slots.acquire()
+                executor.submit(seed_one, index, generate())
+    finally:
+        seeder.close()
+
+    logger.info(
+        "批量造数完成: 成功 %s 条，失败 %s 条，进度日志: %s",
+        stats["ok"],
+        stats["failed"],
+        journal_path,
+    )
+    return stats["failed"]
+
+
+def main(argv=None):
+    """
+    命令行入口
+    :param argv: 命令行参数
+    """
+    parser = argparse.ArgumentParser(description="批量生成客户或借款申请数据")
+    parser.add_argument("entity", choices=sorted(ENTITIES), help="数据类型")
+    parser.add_argument("--count", type=int, required=True, help="数据总数")
+    parser.add_argument("--workers", type=int, default=8, help="并发数，同时作为HTTP连接池大小")
+    parser.add_argument("--rate", type=float, default=20, help="每秒最多提交的请求数，0表示不限流")
+    parser.add_argument("--retries", type=int, default=3, help="单条数据失败后的重试次数")
+    parser.add_argument("--journal", help="进度日志路径，默认 <项目根目录>/reports/seed/<数据类型>.jsonl")
+    parser.add_argument("--storage-state", help="playwright storage_state文件路径，默认使用登录状态缓存")
+    parser.add_argument("--base-url", default=BASE_URL, help="被测站点地址，默认使用配置中的BASE_URL")
+    args = parser.parse_args(argv)
+
+    journal_path = args.journal or os.path.join(SEED_JOURNAL_DIR, f"{args.entity}.jsonl")
+    failed = run(
+        args.entity,
+        args.count,
+        args.workers,
+        args.rate,
+        args.retries,
+        journal_path,
+        args.storage_state,
+        args.base_url,
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
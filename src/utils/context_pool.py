@@ -0,0 +1,160 @@
+"""
+浏览器上下文池，每个进程预热若干个已登录的上下文，用例之间复用
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque
+
+from playwright.sync_api import Browser, BrowserContext, Page, Error as PlaywrightError
+
+from config.config import (
+    LOGIN_USERNAME,
+    CONTEXT_POOL_SIZE,
+    CONTEXT_POOL_MAX_USES,
+    CONTEXT_POOL_RESET_URL,
+)
+from utils.auth_cache import auth_cache
+from utils.browser_factory import BrowserFactory
+from utils.logger import logger
+from utils.network_profile import get_route_stats
+
+# 清空当前页面所在源的localStorage和sessionStorage，about:blank等页面无权访问时忽略
+CLEAR_STORAGE_SCRIPT = """
+() => {
+    try {
+        window.localStorage.clear();
+        window.sessionStorage.clear();
+    } catch (e) {
+        // 当前页面无法访问存储
+    }
+}
+"""
+
+
+@dataclass
+class PooledContext:
+    """池中的浏览器上下文"""
+
+    context: BrowserContext
+    page: Page  # 上下文中保留的页面，归还时关闭其余页面
+    uses: int = 0  # 已使用次数
+    created_at: float = field(default_factory=time.time)
+
+
+class ContextPool:
+    """浏览器上下文池类，负责上下文的预热、借出、重置和回收"""
+
+    def __init__(
+        self,
+        browser: Browser,
+        size: int = CONTEXT_POOL_SIZE,
+        max_uses: int = CONTEXT_POOL_MAX_USES,
+        reset_url: str = CONTEXT_POOL_RESET_URL,
+        username: str = LOGIN_USERNAME,
+    ):
+        """
+        初始化上下文池
+        :param browser: 浏览器实例
+        :param size: 预热的上下文数量，0表示每次借出都新建上下文，归还时关闭
+        :param max_uses: 单个上下文最多复用的次数
+        :param reset_url: 上下文归还时返回的页面
+        :param username: 上下文使用的登录账号
+        """
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self.reset_url = reset_url
+        self.username = username
+        self._idle: Deque[PooledContext] = deque()
+
+    def _create(self) -> PooledContext:
+        """
+        创建新的上下文，使用已保存的登录状态
+        :return: 池中的浏览器上下文
+        """
+        context = BrowserFactory.get_context(
+            self.browser, storage_state=auth_cache.storage_state(self.username)
+        )
+        return PooledContext(context=context, page=context.new_page())
+
+    def warm_up(self):
+        """预热上下文，补足到配置的数量"""
+        while len(self._idle) < self.size:
+            self._idle.append(self._create())
+        logger.info("上下文池预热完成，可用上下文: %s", len(self._idle))
+
+    def acquire(self) -> PooledContext:
+        """
+        借出一个上下文，并同步最新的登录状态
+        :return: 池中的浏览器上下文
+        """
+        pooled = self._idle.popleft() if self._idle else self._create()
+        self._restore_auth(pooled)
+        stats = get_route_stats(pooled.context)
+        if stats:
+            stats.reset()
+        return pooled
+
+    def _restore_auth(self, pooled: PooledContext):
+        """
+        将缓存中的登录Cookie写入上下文，预热时尚未登录的上下文借出后也是已登录状态
+        :param pooled: 池中的浏览器上下文
+        """
+        state = auth_cache.storage_state(self.username)
+        if state:
+            pooled.context.clear_cookies()
+            pooled.context.add_cookies(state["cookies"])
+
+    def release(self, pooled: PooledContext, dirty: bool = False):
+        """
+        归还上下文，用例失败或达到复用次数的上下文直接关闭
+        :param pooled: 池中的浏览器上下文
+        :param dirty: 上下文状态是否不可信，例如用例失败
+        """
+        pooled.uses += 1
+        if self.size == 0 or dirty or pooled.uses >= self.max_uses:
+            logger.info("回收浏览器上下文，已使用 %s 次", pooled.uses)
+            self._close(pooled)
+            if self.size and len(self._idle) < self.size:
+                self._idle.append(self._create())
+            return
+        try:
+            self._reset(pooled)
+        except PlaywrightError as e:
+            logger.warning("重置浏览器上下文失败，重新创建: %s", e)
+            self._close(pooled)
+            self._idle.append(self._create())
+            return
+        self._idle.append(pooled)
+
+    def _reset(self, pooled: PooledContext):
+        """
+        重置上下文：关闭多余页面、清空存储和权限、返回初始页面
+        :param pooled: 池中的浏览器上下文
+        """
+        for page in pooled.context.pages:
+            if page is not pooled.page:
+                page.close()
+        if pooled.page.is_closed():
+            pooled.page = pooled.context.new_page()
+        pooled.page.evaluate(CLEAR_STORAGE_SCRIPT)
+        pooled.context.clear_permissions()
+        pooled.page.goto(self.reset_url)
+
+    @staticmethod
+    def _close(pooled: PooledContext):
+        """
+        关闭上下文，关闭失败时只记录日志
+        :param pooled: 池中的浏览器上下文
+        """
+        try:
+            pooled.context.close()
+        except PlaywrightError as e:
+            logger.warning("关闭浏览器上下文失败: %s", e)
+
+    def close(self):
+        """关闭池中所有空闲的上下文"""
+        while self._idle:
+            self._close(self._idle.popleft())
@@ -0,0 +1,417 @@
+"""
+后台造数工具，复用浏览器登录后的Cookie，直接通过HTTP提交LoadForms.aspx表单创建前置数据，
+选择窗口字段使用界面选择时缓存的回填值，保存后通过列表搜索按钮的ajax回发确认记录已创建
+"""
+
+import html
+import json
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.config import (
+    BASE_URL,
+    LOGIN_USERNAME,
+    SEED_POOL_SIZE,
+    SEED_TIMEOUT,
+    SEED_RETRIES,
+)
+from locators.customer_locators import CustomerLocators
+from locators.loan_locators import LoanLocators
+from models.customer import Customer
+from models.loan import Loan
+from utils.auth_cache import auth_cache
+from utils.logger import logger
+from utils.picker_cache import picker_cache
+
+# 表单保存成功时页面返回的提示文字
+SUCCESS_TEXT = "保存数据成功"
+
+# 表单保存按钮回发时使用的事件目标
+SAVE_EVENT_TARGET = "Panel2$Toptb$Button2"
+
+# 客户表单字段：模型属性 -> 表单提交时使用的字段名
+CUSTOMER_FORM_FIELDS = {
+    "name": "Panel2$ContentPanel1$mainTabs$Tab1$TabCpl1$mingcheng",
+    "type": "Panel2$ContentPanel1$mainTabs$Tab1$TabCpl1$leixing",
+    "code": "Panel2$ContentPanel1$mainTabs$Tab1$TabCpl1$bianhao",
+    "industry": "Panel2$ContentPanel1$mainTabs$Tab1$TabCpl1$hangye",
+    "phone": "Panel2$ContentPanel1$mainTabs$Tab1$TabCpl1$dianhua",
+    "region": "Panel2$ContentPanel1$mainTabs$Tab1$TabCpl1$quyu",
+    "mobile": "Panel2$ContentPanel1$mainTabs$Tab1$TabCpl1$shouji",
+    "scale": "Panel2$ContentPanel1$mainTabs$Tab1$TabCpl1$guimo",
+    "qq": "Panel2$ContentPanel1$mainTabs$Tab1$TabCpl1$qq",
+    "source": "Panel2$ContentPanel1$mainTabs$Tab1$TabCpl1$laiyuan",
+    "department": "Panel2$ContentPanel1$mainTabs$Tab1$TabCpl1$bumen",
+    "level": "Panel2$ContentPanel1$mainTabs$Tab1$TabCpl1$dengji",
+    "responsible_person": "Panel2$ContentPanel1$mainTabs$Tab1$TabCpl1$fzr",
+    "shared_persons": "Panel2$ContentPanel1$mainTabs$Tab1$TabCpl1$gxr",
+}
+
+# 客户表单的选择窗口字段：模型属性 -> 打开选择窗口的搜索图标选择器，与界面选择时的缓存范围一致
+CUSTOMER_PICKER_FIELDS = {
+    "responsible_person": CustomerLocators.RESPONSIBLE_PERSON_SEARCH,
+    "shared_persons": CustomerLocators.SHARED_PERSON_SEARCH,
+}
+
+# 借款表单字段：模型属性 -> 表单提交时使用的字段名
+LOAN_FORM_FIELDS = {
+    "project_name": "Panel2$ContentPanel1$xmmc",
+    "borrower": "Panel2$ContentPanel1$jkr",
+    "loan_amount": "Panel2$ContentPanel1$je",
+    "loan_purpose": "Panel2$ContentPanel1$jksy",
+    "payment_method": "Panel2$ContentPanel1$zffs",
+    "repayment_method": "Panel2$ContentPanel1$hkfs",
+    "loan_period": "Panel2$ContentPanel1$jkrq",
+    "borrower_bank": "Panel2$ContentPanel1$khyh",
+    "bank_account": "Panel2$ContentPanel1$yhzh",
+    "bank_branch": "Panel2$ContentPanel1$dz",
+    "handler": "Panel2$ContentPanel1$jbr",
+    "application_date": "Panel2$ContentPanel1$sqrq",
+    "account_name": "Panel2$ContentPanel1$khh",
+    "bank_account_number": "Panel2$ContentPanel1$zh",
+}
+
+# 借款表单的选择窗口字段：模型属性 -> 打开选择窗口的搜索图标选择器
+LOAN_PICKER_FIELDS = {
+    "project_name": LoanLocators.PROJECT_SEARCH,
+    "borrower": LoanLocators.BORROWER_SEARCH,
+    "handler": LoanLocators.HANDLER_SEARCH,
+}
+
+# 列表搜索按钮回发时使用的事件目标
+SEARCH_EVENT_TARGET = "Panel1$panelTop$BtnSearch"
+
+# 造数后在列表中确认记录已创建：(搜索框字段名 -> 模型属性, 比对的模型属性)
+CUSTOMER_LIST_LOOKUP = (
+    {"Panel1$panelTop$k1397": "name"},
+    ("name",),
+)
+LOAN_LIST_LOOKUP = (
+    {
+        "Panel1$panelTop$k12578": "project_name",
+        "Panel1$panelTop$k12579": "borrower",
+    },
+    ("borrower", "project_name", "loan_amount", "loan_period"),
+)
+
+# FineUI以ajax方式回发时携带的请求头，响应只包含更新控件的脚本，不回显搜索框的值
+FINEUI_AJAX_HEADERS = {"X-FineUI-Ajax": "true"}
+
+HIDDEN_INPUT_PATTERN = re.compile(r"<input[^>]*type=[\"']hidden[\"'][^>]*>", re.I)
+ATTRIBUTE_PATTERN = re.compile(r"""(name|value)\s*=\s*["']([^"']*)["']""", re.I)
+
+
+def field_value(value) -> str:
+    """
+    将模型属性值转换为表单提交的文本，列表类型的值用逗号拼接
+    :param value: 属性值
+    :return: 字段值
+    """
+    if isinstance(value, (list, tuple)):
+        return ",".join(value)
+    return str(value)
+
+
+def text_variants(value: str) -> Tuple[str, ...]:
+    """
+    获取文本在响应中可能出现的形式：原文、HTML转义、JSON转义(非ASCII字符转为\\u编码)
+    :param value: 文本
+    :return: 文本形式
+    """
+    return (value, html.escape(value), json.dumps(value)[1:-1])
+
+
+def parse_hidden_fields(page_html: str) -> Dict[str, str]:
+    """
+    解析页面中的隐藏字段(__VIEWSTATE、__EVENTVALIDATION、F_STATE等)
+    :param page_html: 页面HTML
+    :return: 隐藏字段名与值的字典
+    """
+    fields = {}
+    for tag in HIDDEN_INPUT_PATTERN.findall(page_html):
+        attributes = {k.lower(): v for k, v in ATTRIBUTE_PATTERN.findall(tag)}
+        if "name" in attributes:
+            fields[attributes["name"]] = html.unescape(attributes.get("value", ""))
+    return fields
+
+
+def model_fields(model, mapping: Dict[str, str]) -> Dict[str, str]:
+    """
+    将数据模型转换为表单字段，列表类型的值用逗号拼接
+    :param model: 数据模型对象
+    :param mapping: 模型属性与表单字段名的对应关系
+    :return: 表单字段名与值的字典
+    """
+    return {
+        name: field_value(getattr(model, attr))
+        for attr, name in mapping.items()
+        if getattr(model, attr, None) is not None
+    }
+
+
+class DataSeeder:
+    """后台造数类，使用带连接池的requests会话提交表单"""
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        pool_size: int = SEED_POOL_SIZE,
+        timeout: float = SEED_TIMEOUT,
+        retries: int = SEED_RETRIES,
+    ):
+        """
+        初始化造数工具
+        :param base_url: 被测站点地址
+        :param pool_size: HTTP连接池大小
+        :param timeout: 单次请求超时时间(秒)
+        :param retries: GET请求失败时的重试次数，表单提交不自动重试，避免重复创建数据
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.landing_url = f"{base_url}/"
+        self.session = requests.Session()
+        # 连接池满时阻塞等待，并发请求数不会超过pool_size
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=True,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def load_cookies(self, cookies: Iterable[dict], landing_url: Optional[str] = None):
+        """
+        载入浏览器的Cookie
+        :param cookies: playwright格式的Cookie列表(context.cookies()或storage_state中的cookies)
+        :param landing_url: 登录后的主页面地址，表单地址相对于该地址解析
+        """
+        self.session.cookies.clear()
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+        if landing_url:
+            self.landing_url = landing_url
+
+    def load_from_context(self, context, username: str = LOGIN_USERNAME):
+        """
+        载入浏览器上下文的登录状态
+        :param context: playwright浏览器上下文
+        :param username: 登录账号，用于从登录状态缓存中获取主页面地址
+        """
+        cached = auth_cache.load(username)
+        self.load_cookies(
+            context.cookies(), cached["landing_url"] if cached else None
+        )
+
+    def form_url(self, relative_url: str) -> str:
+        """
+        获取表单的完整地址
+        :param relative_url: 相对于主页面的地址
+        :return: 完整地址
+        """
+        return urljoin(self.landing_url, relative_url)
+
+    def picker_fields(self, model, pickers: Dict[str, str]) -> Optional[Dict[str, str]]:
+        """
+        使用界面选择时缓存的回填值生成选择窗口字段(输入框名称和值以被测系统页面为准)，
+        多条记录的回填值按输入框用逗号拼接，与选择窗口多选后的回填值一致
+        :param model: 数据模型对象
+        :param pickers: 模型属性与搜索图标选择器的对应关系
+        :return: 字段名与值的字典，有记录尚未在界面中选择过时返回None
+        """
+        fields = {}
+        for attr, trigger in pickers.items():
+            value = getattr(model, attr, None)
+            if value is None:
+                continue
+            texts: List[str] = list(value) if isinstance(value, (list, tuple)) else [str(value)]
+            scope = f"{self.base_url}|{trigger}"
+            entries = []
+            for text in texts:
+                values = picker_cache.get(scope, text)
+                if values is None:
+                    logger.info("选择窗口记录尚未在界面中选择过，无法后台造数: %s", text)
+                    return None
+                entries.append(values)
+            for name in entries[0]:
+                fields[name] = ",".join(entry.get(name, "") for entry in entries)
+        return fields
+
+    def postback(
+        self,
+        relative_url: str,
+        fields: Dict[str, str],
+        event_target: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[bool, Optional[requests.Response]]:
+        """
+        获取页面后携带隐藏字段回发，模拟点击按钮
+        :param relative_url: 页面相对地址
+        :param fields: 字段名与值的字典
+        :param event_target: 回发的事件目标(按钮的UniqueID)
+        :param headers: 额外的请求头
+        :return: (是否已发送回发请求, 回发的响应)，回发请求发送后失败时响应为None
+        """
+        url = self.form_url(relative_url)
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning("获取页面失败: %s, %s", url, e)
+            return False, None
+        if "login.aspx" in response.url.lower():
+            logger.warning("登录状态无效: %s", url)
+            return False, None
+
+        data = parse_hidden_fields(response.text)
+        data.update(fields)
+        data["__EVENTTARGET"] = event_target
+        data["__EVENTARGUMENT"] = ""
+        try:
+            response = self.session.post(
+                url, data=data, headers={"Referer": url, **(headers or {})}, timeout=self.timeout
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            # 请求可能已到达服务端，由调用方确认结果
+            logger.warning("回发请求失败: %s, %s", url, e)
+            return True, None
+        return True, response
+
+    def record_exists(
+        self, list_url: str, model, lookup: Tuple[Dict[str, str], Tuple[str, ...]]
+    ) -> Optional[bool]:
+        """
+        在列表页面填写搜索框后以ajax方式回发搜索按钮，响应中包含全部比对值时视为记录存在
+        :param list_url: 列表相对地址
+        :param model: 数据模型对象
+        :param lookup: (搜索框字段名 -> 模型属性, 比对的模型属性)
+        :return: 是否存在，查询失败时返回None
+        """
+        search, match = lookup
+        fields = {name: field_value(getattr(model, attr)) for name, attr in search.items()}
+        _, response = self.postback(list_url, fields, SEARCH_EVENT_TARGET, FINEUI_AJAX_HEADERS)
+        if response is None:
+            logger.warning("查询列表失败: %s", list_url)
+            return None
+        return all(
+            any(variant in response.text for variant in text_variants(field_value(getattr(model, attr))))
+            for attr in match
+        )
+
+    def customer_exists(self, customer: Customer) -> Optional[bool]:
+        """
+        确认客户已创建
+        :param customer: 客户数据对象
+        :return: 是否存在，查询失败时返回None
+        """
+        return self.record_exists(CustomerLocators.CUSTOMER_LIST_URL, customer, CUSTOMER_LIST_LOOKUP)
+
+    def loan_exists(self, loan: Loan) -> Optional[bool]:
+        """
+        确认借款申请已创建
+        :param loan: 借款数据对象
+        :return: 是否存在，查询失败时返回None
+        """
+        return self.record_exists(LoanLocators.LOAN_LIST_URL, loan, LOAN_LIST_LOOKUP)
+
+    def submit_form(self, relative_url: str, fields: Dict[str, str]) -> bool:
+        """
+        回发表单保存按钮，保存结果由调用方在列表中确认
+        :param relative_url: 表单相对地址
+        :param fields: 表单字段名与值的字典
+        :return: 是否已发送保存请求，未发送时记录一定没有创建
+        """
+        sent, response = self.postback(relative_url, fields, SAVE_EVENT_TARGET)
+        if response is not None and SUCCESS_TEXT not in response.text:
+            logger.warning("保存后未返回保存成功提示，在列表中确认结果: %s", relative_url)
+        return sent
+
+    def seed(
+        self,
+        relative_url: str,
+        model,
+        form_fields: Dict[str, str],
+        pickers: Dict[str, str],
+        exists: Callable[[], Optional[bool]],
+    ) -> Optional[bool]:
+        """
+        提交表单创建记录，选择窗口字段使用界面选择时缓存的回填值，
+        保存请求发出后不论响应如何都在列表中确认记录是否已创建
+        :param relative_url: 表单相对地址
+        :param model: 数据模型对象
+        :param form_fields: 模型属性与表单字段名的对应关系
+        :param pickers: 模型属性与搜索图标选择器的对应关系
+        :param exists: 确认记录已创建的方法
+        :return: 是否创建成功，保存请求已发出但无法确认结果时返回None，调用方只在返回False时改走界面流程
+        """
+        picker_values = self.picker_fields(model, pickers)
+        if picker_values is None:
+            return False
+        fields = model_fields(model, form_fields)
+        fields.update(picker_values)
+        if not self.submit_form(relative_url, fields):
+            return False
+        found = exists()
+        if found is None:
+            logger.warning("造数结果未知，保存后查询列表失败: %s", relative_url)
+        elif not found:
+            logger.warning("造数失败，保存后列表中未找到记录: %s", relative_url)
+        return found
+
+    def seed_customer(self, customer: Customer) -> Optional[bool]:
+        """
+        创建客户
+        :param customer: 客户数据对象
+        :return: 是否创建成功，无法确认结果时返回None
+        """
+        success = self.seed(
+            CustomerLocators.ADD_CUSTOMER_FORM_URL,
+            customer,
+            CUSTOMER_FORM_FIELDS,
+            CUSTOMER_PICKER_FIELDS,
+            lambda: self.customer_exists(customer),
+        )
+        if success:
+            logger.info("后台创建客户成功: %s", customer.name)
+        return success
+
+    def seed_loan(self, loan: Loan) -> Optional[bool]:
+        """
+        创建借款申请
+        :param loan: 借款数据对象
+        :return: 是否创建成功，无法确认结果时返回None
+        """
+        success = self.seed(
+            LoanLocators.ADD_LOAN_FORM_URL,
+            loan,
+            LOAN_FORM_FIELDS,
+            LOAN_PICKER_FIELDS,
+            lambda: self.loan_exists(loan),
+        )
+        if success:
+            logger.info("后台创建借款申请成功: %s", loan.project_name)
+        return success
+
+    def close(self):
+        """关闭会话和连接池"""
+        self.session.close()
+
+
+# 创建全局造数工具实例
+data_seeder = DataSeeder()
@@ -0,0 +1,193 @@
+"""
+HAR静态资源缓存，录制FineUI的JS/CSS等静态资源并在后续运行中从磁盘回放
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Optional
+
+import requests
+
+from config.config import BASE_URL, HAR_MODE, HAR_PATH, HAR_MAX_AGE_HOURS
+from utils.logger import logger
+
+# 参与录制和回放的静态资源URL，Loadlists.aspx、LoadForms.aspx等动态请求不匹配，始终请求服务器
+# 图片、字体和第三方资源由网络路由配置拦截，不在此录制
+STATIC_ASSET_PATTERN = r"[^?#]*(\.(js|css)([?#]|$)|/(res|WebResource|ScriptResource)\.axd)"
+
+# 登录页中引用的静态资源地址，FineUI升级后其版本参数会变化，用于生成应用指纹
+ASSET_REFERENCE_PATTERN = re.compile(r"""(?:src|href)\s*=\s*["']([^"']+)["']""", re.I)
+
+
+class HarCache:
+    """HAR静态资源缓存类，按模式为浏览器上下文注册录制或回放路由"""
+
+    def __init__(
+        self,
+        mode: str = HAR_MODE,
+        har_path: str = HAR_PATH,
+        max_age_hours: float = HAR_MAX_AGE_HOURS,
+        base_url: str = BASE_URL,
+    ):
+        """
+        初始化HAR缓存
+        :param mode: 缓存模式：off, record, replay
+        :param har_path: HAR文件路径，使用.zip时资源内容一并打包
+        :param max_age_hours: 缓存最长有效时间(小时)
+        :param base_url: 被测站点地址
+        """
+        if mode not in ("off", "record", "replay"):
+            raise ValueError(f"不支持的HAR缓存模式: {mode}")
+        self.requested_mode = mode
+        self.har_path = har_path
+        self.manifest_path = f"{os.path.splitext(har_path)[0]}.manifest.json"
+        self.max_age_hours = max_age_hours
+        self.base_url = base_url
+        self.url_pattern = re.compile(rf"^{re.escape(base_url)}{STATIC_ASSET_PATTERN}", re.I)
+        self._mode: Optional[str] = None
+        self._recording = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _is_primary_worker() -> bool:
+        """
+        判断当前进程是否负责录制，多个xdist进程同时写同一个HAR文件会互相覆盖
+        :return: 是否为主进程或第一个worker
+        """
+        return os.getenv("PYTEST_XDIST_WORKER", "master") in ("master", "gw0")
+
+    def fingerprint(self) -> Optional[str]:
+        """
+        生成应用指纹，取登录页引用的静态资源地址计算哈希
+        :return: 指纹字符串，获取失败时返回None
+        """
+        try:
+            response = requests.get(f"{self.base_url}/login.aspx", timeout=10)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning("获取应用指纹失败: %s", e)
+            return None
+        assets = sorted(set(ASSET_REFERENCE_PATTERN.findall(response.text)))
+        return hashlib.sha256("\n".join(assets).encode("utf-8")).hexdigest()
+
+    def _load_manifest(self) -> Optional[dict]:
+        """
+        读取缓存清单
+        :return: 清单内容，不存在或损坏时返回None
+        """
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_manifest(self, fingerprint: Optional[str]):
+        """
+        写入缓存清单
+        :param fingerprint: 应用指纹
+        """
+        manifest = {
+            "base_url": self.base_url,
+            "fingerprint": fingerprint,
+            "created_at": time.time(),
+        }
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    def invalid_reason(self) -> Optional[str]:
+        """
+        检查缓存是否可用于回放
+        失效规则：HAR文件或清单缺失、站点地址变化、超过最长有效时间、应用指纹变化(应用升级)
+        :return: 失效原因，缓存有效时返回None
+        """
+        manifest = self._load_manifest()
+        if not os.path.exists(self.har_path) or manifest is None:
+            return "缓存文件不存在"
+        if manifest.get("base_url") != self.base_url:
+            return "站点地址已变化"
+        age_hours = (time.time() - manifest.get("created_at", 0)) / 3600
+        if age_hours > self.max_age_hours:
+            return f"缓存已超过 {self.max_age_hours} 小时"
+        fingerprint = self.fingerprint()
+        if fingerprint and fingerprint != manifest.get("fingerprint"):
+            return "应用版本已变化"
+        return None
+
+    @property
+    def mode(self) -> str:
+        """
+        实际生效的缓存模式，首次访问时根据缓存状态确定
+        回放模式下缓存失效时，主进程改为重新录制，其余进程直接请求服务器
+        :return: off, record, replay
+        """
+        with self._lock:
+            if self._mode is None:
+                self._mode = self._resolve_mode()
+            return self._mode
+
+    def _resolve_mode(self) -> str:
+        """
+        根据配置和缓存状态确定实际生效的模式
+        :return: off, record, replay
+        """
+        if self.requested_mode == "off":
+            return "off"
+        if self.requested_mode == "replay":
+            reason = self.invalid_reason()
+            if reason is None:
+                logger.info("使用HAR缓存回放静态资源: %s", self.har_path)
+                return "replay"
+            logger.warning("HAR缓存失效(%s)", reason)
+        if not self._is_primary_worker():
+            return "off"
+        logger.info("录制静态资源到HAR缓存: %s", self.har_path)
+        return "record"
+
+    def _route_options(self) -> Optional[dict]:
+        """
+        生成当前上下文的route_from_har参数，录制模式下每个进程只录制第一个上下文
+        :return: route_from_har参数，无需注册路由时返回None
+        """
+        mode = self.mode
+        if mode == "replay":
+            return {"url": self.url_pattern, "not_found": "fallback"}
+        if mode == "record":
+            with self._lock:
+                if self._recording:
+                    return None
+                self._recording = True
+            os.makedirs(os.path.dirname(self.har_path), exist_ok=True)
+            # 删除旧文件，避免录制中断时清单与旧的HAR文件对应
+            if os.path.exists(self.har_path):
+                os.remove(self.har_path)
+            self._write_manifest(self.fingerprint())
+            return {"url": self.url_pattern, "update": True}
+        return None
+
+    def apply(self, context):
+        """
+        为浏览器上下文注册HAR路由，录制结果在上下文关闭时写入磁盘
+        :param context: playwright浏览器上下文
+        """
+        options = self._route_options()
+        if options:
+            context.route_from_har(self.har_path, **options)
+
+    async def apply_async(self, context):
+        """
+        为异步浏览器上下文注册HAR路由
+        首次确定模式时会同步请求登录页生成应用指纹，放到线程中执行，避免阻塞事件循环
+        :param context: playwright异步浏览器上下文
+        """
+        options = await asyncio.to_thread(self._route_options)
+        if options:
+            await context.route_from_har(self.har_path, **options)
+
+
+# 创建全局HAR缓存实例
+har_cache = HarCache()
@@ -1,11 +1,98 @@
 """
 日志工具，用于记录测试过程中的日志信息
+
+日志通过队列交给后台线程写入控制台和文件，调用线程只拼接消息参数后入队，时间、格式化和文件I/O均在后台线程执行。
+记录日志时请使用 logger.info("消息: %s", value) 形式的惰性参数，级别未开启时不会进行任何格式化。
 """
 
+import atexit
+import copy
+import gzip
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import shutil
 from datetime import datetime
 
+from config.config import (
+    LOG_LEVEL,
+    LOG_FORMAT,
+    LOG_MAX_BYTES,
+    LOG_BACKUP_COUNT,
+    LOG_COMPRESS,
+)
+
+
+class JsonLineFormatter(logging.Formatter):
+    """JSONL格式化器，每条日志输出为一行JSON，便于机器分析"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        将日志记录格式化为一行JSON
+        :param record: 日志记录
+        :return: JSON字符串
+        """
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "worker": _worker_id(),
+            "pid": record.process,
+            "thread": record.threadName,
+            "module": record.module,
+            "func": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """队列处理器，入队前在调用线程拼接消息参数，按格式输出推迟到后台线程执行"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        入队前拼接消息参数，避免参数为可变对象时后台线程输出的是其之后被修改的值
+        :param record: 日志记录
+        :return: 消息已拼接、不再引用参数的日志记录副本
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _worker_id() -> str:
+    """
+    获取当前pytest-xdist工作进程标识
+    :return: 工作进程标识，非xdist运行时为master
+    """
+    return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+
+def _gzip_namer(name: str) -> str:
+    """
+    轮转日志文件命名
+    :param name: 默认文件名
+    :return: 压缩后的文件名
+    """
+    return f"{name}.gz"
+
+
+def _gzip_rotator(source: str, dest: str):
+    """
+    轮转时压缩日志文件
+    :param source: 当前日志文件
+    :param dest: 轮转后的文件
+    """
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
 
 class Logger:
     """日志工具类"""
@@ -23,56 +110,80 @@ class Logger:
             "reports",
             "logs",
         )
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        os.makedirs(log_dir, exist_ok=True)
 
         # 创建日志器
         self.logger = logging.getLogger(logger_name)
-        self.logger.setLevel(logging.INFO)
+        self.logger.setLevel(LOG_LEVEL)
+        self.listener = None
 
         # 避免重复添加处理器
         if not self.logger.handlers:
+            text_formatter = logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            )
+
             # 控制台处理器
             console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.INFO)
+            console_handler.setLevel(LOG_LEVEL)
+            console_handler.setFormatter(text_formatter)
 
-            # 文件处理器
+            # 文件处理器，每个xdist工作进程写入独立的轮转文件
+            extension = "jsonl" if LOG_FORMAT == "jsonl" else "log"
             log_file = os.path.join(
-                log_dir, f"{datetime.now().strftime('%Y%m%d%H%M%S')}.log"
+                log_dir,
+                f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{_worker_id()}_{os.getpid()}.{extension}",
             )
-            file_handler = logging.FileHandler(log_file, encoding="utf-8")
-            file_handler.setLevel(logging.INFO)
-
-            # 设置日志格式
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file,
+                maxBytes=LOG_MAX_BYTES,
+                backupCount=LOG_BACKUP_COUNT,
+                encoding="utf-8",
+                delay=True,
+            )
+            file_handler.setLevel(LOG_LEVEL)
+            file_handler.setFormatter(
+                JsonLineFormatter() if LOG_FORMAT == "jsonl" else text_formatter
             )
-            console_handler.setFormatter(formatter)
-            file_handler.setFormatter(formatter)
+            if LOG_COMPRESS:
+                file_handler.namer = _gzip_namer
+                file_handler.rotator = _gzip_rotator
+
+            # 调用线程只负责入队，由后台线程写入控制台和文件
+            log_queue = queue.SimpleQueue()
+            self.listener = logging.handlers.QueueListener(
+                log_queue, console_handler, file_handler, respect_handler_level=True
+            )
+            self.listener.start()
+            atexit.register(self.stop)
+
+            self.logger.addHandler(DeferredQueueHandler(log_queue))
 
-            # 添加处理器
-            self.logger.addHandler(console_handler)
-            self.logger.addHandler(file_handler)
+    def stop(self):
+        """停止后台写入线程，写出队列中剩余的日志"""
+        if self.listener:
+            self.listener.stop()
+            self.listener = None
 
-    def info(self, message):
+    def info(self, message, *args, **kwargs):
         """记录信息日志"""
-        self.logger.info(message)
+        self.logger.info(message, *args, **kwargs)
 
-    def warning(self, message):
+    def warning(self, message, *args, **kwargs):
         """记录警告日志"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args, **kwargs)
 
-    def error(self, message):
+    def error(self, message, *args, **kwargs):
         """记录错误日志"""
-        self.logger.error(message)
+        self.logger.error(message, *args, **kwargs)
 
-    def debug(self, message):
+    def debug(self, message, *args, **kwargs):
         """记录调试日志"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args, **kwargs)
 
-    def critical(self, message):
+    def critical(self, message, *args, **kwargs):
         """记录严重错误日志"""
-        self.logger.critical(message)
+        self.logger.critical(message, *args, **kwargs)
 
 
 # 创建全局日志器实例
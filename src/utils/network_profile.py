@@ -0,0 +1,334 @@
+"""
+网络路由配置，在浏览器上下文创建时拦截或替换与测试无关的资源请求
+"""
+
+import atexit
+import base64
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
+
+from config.config import BASE_URL, NETWORK_PROFILE, NETWORK_ALLOWED_HOSTS, NETWORK_SIZES_PATH
+from utils.logger import logger
+
+# 1x1透明GIF，用于替换被拦截的图片，保证图片的load事件正常触发
+TRANSPARENT_GIF = base64.b64decode("R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7")
+
+# 可能被拦截的静态资源扩展名，只有匹配的请求才会进入Python路由处理
+BLOCKABLE_EXTENSIONS = (
+    r"png|jpe?g|gif|bmp|ico|svg|webp|woff2?|ttf|otf|eot|mp4|webm|mp3|wav|ogg"
+)
+
+
+@dataclass(frozen=True)
+class NetworkProfile:
+    """网络路由配置"""
+
+    name: str
+    blocked_resource_types: Tuple[str, ...] = ()  # 直接中止的资源类型
+    stubbed_resource_types: Tuple[str, ...] = ()  # 返回占位内容的资源类型
+    blocked_url_patterns: Tuple[str, ...] = ()  # 直接中止的URL正则
+    block_third_party: bool = False  # 是否中止非被测站点的请求
+
+
+NETWORK_PROFILES: Dict[str, NetworkProfile] = {
+    "none": NetworkProfile(name="none"),
+    "default": NetworkProfile(
+        name="default",
+        blocked_resource_types=("media", "font"),
+        stubbed_resource_types=("image",),
+        blocked_url_patterns=(
+            r"google-analytics\.com",
+            r"googletagmanager\.com",
+            r"hm\.baidu\.com",
+            r"cnzz\.com",
+        ),
+        block_third_party=True,
+    ),
+    "strict": NetworkProfile(
+        name="strict",
+        blocked_resource_types=("media", "font", "image", "manifest", "texttrack"),
+        block_third_party=True,
+    ),
+}
+
+
+class ResourceSizes:
+    """
+    各类资源的实测大小，在不拦截请求(none配置)的运行中按响应的content-length累计，
+    拦截运行中节省的流量按实测的平均大小计算
+    """
+
+    def __init__(self, path: str = NETWORK_SIZES_PATH):
+        """
+        初始化资源大小统计
+        :param path: 实测结果文件路径
+        """
+        self.path = path
+        # 本进程新增的实测数据：资源类型 -> [总字节数, 响应数]
+        self._observed: Dict[str, List[int]] = {}
+        self._averages: Optional[Dict[str, float]] = None
+        self._lock = threading.Lock()
+
+    def _read_file(self) -> Dict[str, List[int]]:
+        """
+        读取实测结果文件
+        :return: 资源类型 -> [总字节数, 响应数]，文件不存在或损坏时返回空字典
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                totals = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return totals if isinstance(totals, dict) else {}
+
+    def averages(self) -> Dict[str, float]:
+        """
+        获取各类资源的实测平均大小，首次调用时读取实测结果文件
+        :return: 资源类型 -> 平均字节数
+        """
+        with self._lock:
+            if self._averages is None:
+                self._averages = {
+                    resource_type: total / count
+                    for resource_type, (total, count) in self._read_file().items()
+                    if count
+                }
+            return self._averages
+
+    def observe(self, response):
+        """
+        记录一次响应的大小，没有content-length的响应(如分块传输)不计入
+        :param response: playwright响应对象
+        """
+        length = response.headers.get("content-length", "")
+        if not length.isdigit():
+            return
+        resource_type = response.request.resource_type
+        with self._lock:
+            totals = self._observed.setdefault(resource_type, [0, 0])
+            totals[0] += int(length)
+            totals[1] += 1
+
+    def save(self):
+        """将本进程的实测数据累加到实测结果文件，进程退出时调用"""
+        with self._lock:
+            if not self._observed:
+                return
+            totals = self._read_file()
+            for resource_type, (total, count) in self._observed.items():
+                saved = totals.get(resource_type, [0, 0])
+                totals[resource_type] = [saved[0] + total, saved[1] + count]
+            self._observed.clear()
+            self._averages = None
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(totals, f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning("写入资源大小实测结果失败: %s", e)
+
+
+@dataclass
+class RouteStats:
+    """网络路由统计"""
+
+    blocked_requests: int = 0  # 中止的请求数
+    stubbed_requests: int = 0  # 返回占位内容的请求数
+    bytes_saved: int = 0  # 按实测平均大小计算的节省字节数
+    unmeasured_requests: int = 0  # 资源类型没有实测数据、未计入节省字节数的请求数
+    by_type: Dict[str, int] = field(default_factory=dict)  # 按资源类型统计的请求数
+    sizes: Optional[ResourceSizes] = None  # 资源大小实测数据
+
+    def record(self, resource_type: str, stubbed: bool):
+        """
+        记录一次被拦截的请求
+        :param resource_type: 资源类型
+        :param stubbed: 是否返回了占位内容
+        """
+        if stubbed:
+            self.stubbed_requests += 1
+        else:
+            self.blocked_requests += 1
+        average = (self.sizes or resource_sizes).averages().get(resource_type)
+        if average is None:
+            self.unmeasured_requests += 1
+        else:
+            self.bytes_saved += int(average)
+        self.by_type[resource_type] = self.by_type.get(resource_type, 0) + 1
+
+    def reset(self):
+        """清空统计"""
+        self.blocked_requests = 0
+        self.stubbed_requests = 0
+        self.bytes_saved = 0
+        self.unmeasured_requests = 0
+        self.by_type.clear()
+
+    @property
+    def saved_requests(self) -> int:
+        """节省的请求总数"""
+        return self.blocked_requests + self.stubbed_requests
+
+    def summary(self) -> str:
+        """
+        生成统计摘要
+        :return: 统计摘要文本
+        """
+        return (
+            f"拦截 {self.blocked_requests} 个请求，替换 {self.stubbed_requests} 个请求，"
+            f"按不拦截运行的实测平均大小计算节省 {self.bytes_saved / 1024:.1f} KB"
+            f"(其中 {self.unmeasured_requests} 个请求的资源类型尚无实测数据，未计入)，按类型: {self.by_type}"
+        )
+
+
+class NetworkRouter:
+    """网络路由处理类，按配置中止或替换请求，其余请求交给后续路由或网络"""
+
+    def __init__(self, profile: NetworkProfile, base_url: str = BASE_URL):
+        """
+        初始化网络路由
+        :param profile: 网络路由配置
+        :param base_url: 被测站点地址，用于判断第三方请求
+        """
+        self.profile = profile
+        self.stats = RouteStats()
+        self._site_hosts = {urlparse(base_url).hostname, *NETWORK_ALLOWED_HOSTS}
+
+        # 只有可能被拦截的请求才会路由到Python，避免所有请求都经过一次进程间往返
+        patterns = [rf"\.({BLOCKABLE_EXTENSIONS})(\?|#|$)", r"res\.axd"]
+        patterns.extend(profile.blocked_url_patterns)
+        if profile.block_third_party:
+            site_hosts = "|".join(re.escape(host) for host in self._site_hosts if host)
+            patterns.append(rf"^https?://(?!({site_hosts})(:\d+)?/)")
+        self.url_filter = re.compile("|".join(f"(?:{p})" for p in patterns), re.I)
+        self._blocked_urls = [re.compile(p, re.I) for p in profile.blocked_url_patterns]
+
+    def _decide(self, request) -> Optional[str]:
+        """
+        判断请求的处理方式
+        :param request: playwright请求对象
+        :return: stub 表示返回占位内容，abort 表示中止，None 表示放行
+        """
+        resource_type = request.resource_type
+        if resource_type in self.profile.stubbed_resource_types:
+            return "stub"
+        if resource_type in self.profile.blocked_resource_types:
+            return "abort"
+        if any(pattern.search(request.url) for pattern in self._blocked_urls):
+            return "abort"
+        if self.profile.block_third_party:
+            host = urlparse(request.url).hostname
+            if host and host not in self._site_hosts:
+                return "abort"
+        return None
+
+    def handle(self, route, request):
+        """
+        同步API的路由处理函数
+        :param route: playwright路由对象
+        :param request: playwright请求对象
+        """
+        action = self._decide(request)
+        if action == "stub":
+            self.stats.record(request.resource_type, stubbed=True)
+            route.fulfill(status=200, content_type="image/gif", body=TRANSPARENT_GIF)
+        elif action == "abort":
+            self.stats.record(request.resource_type, stubbed=False)
+            route.abort("blockedbyclient")
+        else:
+            route.fallback()
+
+    async def handle_async(self, route, request):
+        """
+        异步API的路由处理函数
+        :param route: playwright异步路由对象
+        :param request: playwright请求对象
+        """
+        action = self._decide(request)
+        if action == "stub":
+            self.stats.record(request.resource_type, stubbed=True)
+            await route.fulfill(
+                status=200, content_type="image/gif", body=TRANSPARENT_GIF
+            )
+        elif action == "abort":
+            self.stats.record(request.resource_type, stubbed=False)
+            await route.abort("blockedbyclient")
+        else:
+            await route.fallback()
+
+
+_routers: "WeakKeyDictionary[object, NetworkRouter]" = WeakKeyDictionary()
+
+# 创建全局资源大小实测实例，进程退出时写入实测结果
+resource_sizes = ResourceSizes()
+atexit.register(resource_sizes.save)
+
+
+def _create_router(profile_name: str) -> Optional[NetworkRouter]:
+    """
+    按名称创建网络路由
+    :param profile_name: 网络路由配置名称
+    :return: 网络路由，配置为none时返回None
+    """
+    profile = NETWORK_PROFILES.get(profile_name)
+    if profile is None:
+        raise ValueError(f"不支持的网络路由配置: {profile_name}")
+    if profile.name == "none":
+        return None
+    return NetworkRouter(profile)
+
+
+def apply_network_profile(context, profile_name: str = NETWORK_PROFILE) -> Optional[RouteStats]:
+    """
+    为浏览器上下文应用网络路由配置
+    :param context: playwright浏览器上下文
+    :param profile_name: 网络路由配置名称
+    :return: 路由统计，未启用时返回None
+    """
+    router = _create_router(profile_name)
+    if router is None:
+        # 不拦截时实测各类资源的大小，供拦截运行计算节省的流量
+        context.on("response", resource_sizes.observe)
+        return None
+    context.route(router.url_filter, router.handle)
+    _routers[context] = router
+    logger.info("应用网络路由配置: %s", profile_name)
+    return router.stats
+
+
+async def apply_network_profile_async(
+    context, profile_name: str = NETWORK_PROFILE
+) -> Optional[RouteStats]:
+    """
+    为异步浏览器上下文应用网络路由配置
+    :param context: playwright异步浏览器上下文
+    :param profile_name: 网络路由配置名称
+    :return: 路由统计，未启用时返回None
+    """
+    router = _create_router(profile_name)
+    if router is None:
+        # 不拦截时实测各类资源的大小，供拦截运行计算节省的流量
+        context.on("response", resource_sizes.observe)
+        return None
+    await context.route(router.url_filter, router.handle_async)
+    _routers[context] = router
+    logger.info("应用网络路由配置: %s", profile_name)
+    return router.stats
+
+
+def get_route_stats(context) -> Optional[RouteStats]:
+    """
+    获取浏览器上下文的路由统计
+    :param context: playwright浏览器上下文
+    :return: 路由统计，未启用时返回None
+    """
+    router = _routers.get(context)
+    return router.stats if router else None
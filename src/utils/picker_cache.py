@@ -0,0 +1,242 @@
+"""
+选择窗口回填值缓存，保存选择窗口确定后写入表单字段的值，后续选择同一记录时直接回填
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from config.config import (
+    PICKER_CACHE_ENABLED,
+    PICKER_CACHE_PATH,
+    PICKER_CACHE_TTL,
+    PICKER_CACHE_MAX_ENTRIES,
+)
+from utils.logger import logger
+
+
+@contextmanager
+def file_lock(path: str):
+    """
+    跨进程文件锁，多个xdist进程读写同一个缓存文件时串行执行
+    :param path: 锁文件路径
+    """
+    with open(path, "a+") as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class PickerCache:
+    """
+    选择窗口回填值缓存类，按(字段, 显示文本)保存回填值，超过复用时间或条目数上限时淘汰
+    命中时只在内存中更新使用时间，保存、删除时和进程退出时加锁与文件中其他进程写入的条目合并后写回
+    """
+
+    def __init__(
+        self,
+        path: str = PICKER_CACHE_PATH,
+        ttl: float = PICKER_CACHE_TTL,
+        max_entries: int = PICKER_CACHE_MAX_ENTRIES,
+        enabled: bool = PICKER_CACHE_ENABLED,
+    ):
+        """
+        初始化选择窗口回填值缓存
+        :param path: 缓存文件路径
+        :param ttl: 回填值的最长复用时间(秒)
+        :param max_entries: 最多缓存的条目数
+        :param enabled: 是否启用缓存
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: Optional["OrderedDict[str, dict]"] = None
+        # 本进程删除的条目：缓存键 -> 删除时间，合并时丢弃文件中在此之前保存的同名条目
+        self._removed: Dict[str, float] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(scope: str, text: str) -> str:
+        """
+        生成缓存键
+        :param scope: 缓存范围，通常为站点地址和选择窗口的搜索图标选择器
+        :param text: 选择的记录文本
+        :return: 缓存键
+        """
+        return f"{scope}\n{text}"
+
+    def _read_file(self) -> Dict[str, dict]:
+        """
+        读取缓存文件
+        :return: 缓存条目，文件不存在或损坏时返回空字典
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    @staticmethod
+    def _ordered(entries: Dict[str, dict]) -> "OrderedDict[str, dict]":
+        """
+        按最近使用时间排序
+        :param entries: 缓存条目
+        :return: 排序后的缓存条目
+        """
+        return OrderedDict(sorted(entries.items(), key=lambda item: item[1].get("used_at", 0)))
+
+    def _load(self) -> "OrderedDict[str, dict]":
+        """
+        首次使用时读取缓存文件，条目按最近使用时间排序
+        :return: 缓存条目
+        """
+        if self._entries is None:
+            self._entries = self._ordered(self._read_file())
+        return self._entries
+
+    def _save(self, added: Optional[Dict[str, dict]] = None):
+        """
+        加锁后重新读取缓存文件，合并本进程的修改后写回，先写临时文件再替换，避免其他进程读到不完整的内容
+        以文件中的条目为准(其他进程删除或淘汰的条目不再恢复)，丢弃本进程已删除的条目，使用时间取两者中较新的
+        :param added: 本进程新保存的条目
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with file_lock(f"{self.path}.lock"):
+            local = self._load()
+            merged = {}
+            for key, entry in self._read_file().items():
+                if entry.get("saved_at", 0) <= self._removed.get(key, float("-inf")):
+                    continue
+                if key in local:
+                    entry["used_at"] = max(entry.get("used_at", 0), local[key].get("used_at", 0))
+                merged[key] = entry
+            merged.update(added or {})
+            entries = self._ordered(merged)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        self._entries = entries
+        self._removed.clear()
+        self._dirty = False
+
+    def _remove(self, key: str):
+        """
+        删除条目并记录删除时间
+        :param key: 缓存键
+        """
+        self._removed[key] = time.time()
+        self._load().pop(key, None)
+
+    def get(self, scope: str, text: str) -> Optional[Dict[str, str]]:
+        """
+        获取记录的回填值，命中时只在内存中更新使用时间
+        :param scope: 缓存范围
+        :param text: 选择的记录文本
+        :return: 字段内输入框name -> 值，未缓存或已过期时返回None
+        """
+        if not self.enabled:
+            return None
+        key = self.key(scope, text)
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry.get("saved_at", 0) > self.ttl:
+                logger.info("选择窗口缓存已超过复用时间: %s", text)
+                self._remove(key)
+                self._save()
+                return None
+            entry["used_at"] = time.time()
+            entries.move_to_end(key)
+            self._dirty = True
+            return dict(entry["values"])
+
+    def put(self, scope: str, text: str, values: Dict[str, str]):
+        """
+        保存记录的回填值，超过条目数上限时淘汰最久未使用的条目
+        :param scope: 缓存范围
+        :param text: 选择的记录文本
+        :param values: 字段内输入框name -> 值
+        """
+        self.put_many(scope, {text: values})
+
+    def put_many(self, scope: str, entries: Dict[str, Dict[str, str]]):
+        """
+        一次保存多条记录的回填值，只写一次缓存文件
+        :param scope: 缓存范围
+        :param entries: 记录文本 -> 字段内输入框name -> 值
+        """
+        if not self.enabled or not entries:
+            return
+        now = time.time()
+        added = {}
+        with self._lock:
+            for text, values in entries.items():
+                key = self.key(scope, text)
+                self._removed.pop(key, None)
+                added[key] = {"values": values, "saved_at": now, "used_at": now}
+            self._save(added)
+
+    def invalidate(self, scope: str, text: str):
+        """
+        删除记录的回填值
+        :param scope: 缓存范围
+        :param text: 选择的记录文本
+        """
+        with self._lock:
+            self._remove(self.key(scope, text))
+            self._save()
+
+    def flush(self):
+        """写回命中后更新的使用时间，进程退出时调用"""
+        with self._lock:
+            if self._dirty:
+                try:
+                    self._save()
+                except OSError as e:
+                    logger.warning("写入选择窗口缓存失败: %s", e)
+
+    def clear(self):
+        """清空缓存并删除缓存文件"""
+        with self._lock:
+            self._entries = OrderedDict()
+            self._removed.clear()
+            self._dirty = False
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+# 创建全局选择窗口回填值缓存实例
+picker_cache = PickerCache()
+atexit.register(picker_cache.flush)
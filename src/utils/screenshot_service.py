@@ -0,0 +1,227 @@
+"""
+截图服务，截图数据在内存中获取，编码和写盘交给后台线程池完成
+"""
+
+import atexit
+import io
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Optional, Set
+
+from PIL import Image
+from config.config import (
+    SCREENSHOT_PATH,
+    SCREENSHOT_FORMAT,
+    SCREENSHOT_QUALITY,
+    SCREENSHOT_SCALE,
+    SCREENSHOT_FULL_PAGE,
+    SCREENSHOT_TIMEOUT,
+    SCREENSHOT_WORKERS,
+)
+from utils.logger import logger
+
+# 截图格式对应的文件扩展名和Pillow编码器名称
+FORMAT_EXTENSIONS = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+PILLOW_FORMATS = {"png": "PNG", "jpeg": "JPEG", "webp": "WEBP"}
+
+
+@dataclass
+class Screenshot:
+    """截图结果"""
+
+    path: str  # 截图文件保存路径（后台写入）
+    data: bytes  # 浏览器返回的原始截图数据
+    image_type: str  # 原始截图数据的格式: png 或 jpeg
+    future: Optional[Future] = None  # 后台写盘任务
+
+    def wait(self, timeout: Optional[float] = None) -> str:
+        """
+        等待截图写入磁盘
+        :param timeout: 超时时间(秒)
+        :return: 截图文件路径
+        """
+        if self.future:
+            self.future.result(timeout=timeout)
+        return self.path
+
+
+class ScreenshotService:
+    """截图服务类，调用方只等待浏览器返回截图数据，不等待编码和写盘"""
+
+    def __init__(
+        self,
+        output_dir: str = SCREENSHOT_PATH,
+        image_format: str = SCREENSHOT_FORMAT,
+        quality: int = SCREENSHOT_QUALITY,
+        scale: float = SCREENSHOT_SCALE,
+        max_workers: int = SCREENSHOT_WORKERS,
+    ):
+        """
+        初始化截图服务
+        :param output_dir: 截图保存目录
+        :param image_format: 保存格式: png, jpeg, webp
+        :param quality: jpeg/webp格式的图片质量(1-100)
+        :param scale: 缩放比例
+        :param max_workers: 后台线程数
+        """
+        image_format = image_format.lower()
+        if image_format not in FORMAT_EXTENSIONS:
+            raise ValueError(f"不支持的截图格式: {image_format}")
+
+        self.output_dir = output_dir
+        self.image_format = image_format
+        self.quality = quality
+        self.scale = scale
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="screenshot"
+        )
+        self._pending: Set[Future] = set()
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+
+    def _capture_options(self, full_page: bool, timeout: int) -> dict:
+        """
+        构建浏览器截图参数，jpeg且无需缩放时直接由浏览器编码
+        :param full_page: 是否截取整个页面
+        :param timeout: 超时时间(毫秒)
+        :return: 截图参数
+        """
+        options = {"full_page": full_page, "timeout": timeout, "animations": "disabled"}
+        if self.image_format == "jpeg" and self.scale == 1:
+            options.update(type="jpeg", quality=self.quality)
+        else:
+            options["type"] = "png"
+        return options
+
+    def capture(
+        self,
+        page,
+        name: str = "screenshot",
+        full_page: bool = SCREENSHOT_FULL_PAGE,
+        timeout: int = SCREENSHOT_TIMEOUT,
+    ) -> Screenshot:
+        """
+        截取页面截图
+        :param page: playwright页面对象
+        :param name: 截图名称
+        :param full_page: 是否截取整个页面
+        :param timeout: 超时时间(毫秒)
+        :return: 截图结果，文件在后台写入
+        """
+        options = self._capture_options(full_page, timeout)
+        data = page.screenshot(**options)
+        return self.submit(data, name, options["type"])
+
+    async def capture_async(
+        self,
+        page,
+        name: str = "screenshot",
+        full_page: bool = SCREENSHOT_FULL_PAGE,
+        timeout: int = SCREENSHOT_TIMEOUT,
+    ) -> Screenshot:
+        """
+        截取异步页面截图
+        :param page: playwright异步页面对象
+        :param name: 截图名称
+        :param full_page: 是否截取整个页面
+        :param timeout: 超时时间(毫秒)
+        :return: 截图结果，文件在后台写入
+        """
+        options = self._capture_options(full_page, timeout)
+        data = await page.screenshot(**options)
+        return self.submit(data, name, options["type"])
+
+    def submit(self, data: bytes, name: str, image_type: str = "png") -> Screenshot:
+        """
+        提交截图数据，由后台线程编码并写盘
+        :param data: 截图数据
+        :param name: 截图名称
+        :param image_type: 截图数据的格式
+        :return: 截图结果
+        """
+        timestamp = time.strftime("%Y%m%d%H%M%S")
+        file_name = (
+            f"{name}_{timestamp}_{os.getpid()}_{next(self._counter)}"
+            f".{FORMAT_EXTENSIONS[self.image_format]}"
+        )
+        path = os.path.join(self.output_dir, file_name)
+
+        future = self._executor.submit(self._write, data, image_type, path)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._on_done)
+        return Screenshot(path=path, data=data, image_type=image_type, future=future)
+
+    def _on_done(self, future: Future):
+        """
+        后台任务结束回调
+        :param future: 后台写盘任务
+        """
+        with self._lock:
+            self._pending.discard(future)
+        error = future.exception()
+        if error:
+            logger.error("截图写入失败: %s", error)
+
+    def _write(self, data: bytes, image_type: str, path: str):
+        """
+        编码并写入截图文件，在后台线程执行
+        :param data: 截图数据
+        :param image_type: 截图数据的格式
+        :param path: 文件路径
+        """
+        if image_type != self.image_format or self.scale != 1:
+            data = self._encode(data)
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def _encode(self, data: bytes) -> bytes:
+        """
+        使用Pillow转换截图格式并按比例缩放
+        :param data: 原始截图数据
+        :return: 编码后的截图数据
+        """
+        with Image.open(io.BytesIO(data)) as image:
+            if self.scale != 1:
+                size = (
+                    max(1, int(image.width * self.scale)),
+                    max(1, int(image.height * self.scale)),
+                )
+                image = image.resize(size, Image.LANCZOS)
+            if self.image_format == "jpeg" and image.mode != "RGB":
+                image = image.convert("RGB")
+
+            options = {}
+            if self.image_format in ("jpeg", "webp"):
+                options["quality"] = self.quality
+            elif self.image_format == "png":
+                options["optimize"] = False
+
+            output = io.BytesIO()
+            image.save(output, format=PILLOW_FORMATS[self.image_format], **options)
+            return output.getvalue()
+
+    def flush(self, timeout: Optional[float] = None):
+        """
+        等待所有后台截图写入完成
+        :param timeout: 超时时间(秒)
+        """
+        with self._lock:
+            pending = list(self._pending)
+        if pending:
+            wait(pending, timeout=timeout)
+
+    def shutdown(self):
+        """写完剩余截图后关闭后台线程池"""
+        self._executor.shutdown(wait=True)
+
+
+# 创建全局截图服务实例
+screenshot_service = ScreenshotService()
+atexit.register(screenshot_service.shutdown)
@@ -122,6 +122,72 @@ class TestData:
         "张永银",
     ]
 
+    # 客户类型选项
+    customer_types = ["民营企业", "外资企业", "事业单位", "政府单位"]
+    # 行业选项
+    industries = [
+        "农林牧渔",
+        "医药卫生",
+        "建筑建材",
+        "冶金矿产",
+        "石油化工",
+        "水利水电",
+        "交通运输",
+        "信息产业",
+        "机械机电",
+        "轻工食品",
+        "服装纺织",
+        "安全防护",
+        "环保绿化",
+        "旅游休闲",
+        "办公文教",
+    ]
+    # 区域选项
+    regions = ["华南", "华东", "亚洲", "美洲"]
+    # 规模选项
+    scales = ["大", "中", "小", "其他"]
+    # 客户来源
+    sources = ["电话营销", "客户介绍", "朋友介绍", "百度广告", "公开招标"]
+    # 部门选项
+    departments = [
+        "总经办",
+        "经营部",
+        "财务部",
+        "工程部",
+        "材料采购",
+        "机械队",
+        "成本核算部",
+        "项目中心",
+        "成都项目部",
+        "项目一部",
+        "项目二部",
+        "项目三部",
+        "贵阳项目部",
+        "西安项目部",
+        "遵义项目部",
+        "行政部",
+        "营销部",
+        "重庆分公司",
+        "人事部",
+        "市场营销部",
+        "工程管理部",
+        "成控采购部",
+        "重庆项目部",
+        "人事部",
+        "采购部",
+        "设计部",
+        "材料部",
+        "市场部",
+        "开发",
+    ]
+    # 客户等级
+    levels = ["1星", "2星", "3星", "4星", "5星"]
+
+    # 借款支付方式选项
+    payment_methods = ["现金支付", "银行转账", "支票支付"]
+    # 借款还款方式选项
+    repayment_methods = ["等额本息", "等额本金", "先息后本", "一次性还本付息"]
+
     def __init__(self, locale="zh_CN"):
         """
         初始化测试数据生成器
@@ -134,80 +200,19 @@ class TestData:
         生成客户数据
         :return: 客户数据字典
         """
-        # 客户类型选项
-        customer_types = ["民营企业", "外资企业", "事业单位", "政府单位"]
-        # 行业选项
-        industries = [
-            "农林牧渔",
-            "医药卫生",
-            "建筑建材",
-            "冶金矿产",
-            "石油化工",
-            "水利水电",
-            "交通运输",
-            "信息产业",
-            "机械机电",
-            "轻工食品",
-            "服装纺织",
-            "安全防护",
-            "环保绿化",
-            "旅游休闲",
-            "办公文教",
-        ]
-        # 区域选项
-        regions = ["华南", "华东", "亚洲", "美洲"]
-        # 规模选项
-        scales = ["大", "中", "小", "其他"]
-        # 客户来源
-        sources = ["电话营销", "客户介绍", "朋友介绍", "百度广告", "公开招标"]
-        # 部门选项
-        departments = [
-            "总经办",
-            "经营部",
-            "财务部",
-            "工程部",
-            "材料采购",
-            "机械队",
-            "成本核算部",
-            "项目中心",
-            "成都项目部",
-            "项目一部",
-            "项目二部",
-            "项目三部",
-            "贵阳项目部",
-            "西安项目部",
-            "遵义项目部",
-            "行政部",
-            "营销部",
-            "重庆分公司",
-            "人事部",
-            "市场营销部",
-            "工程管理部",
-            "成控采购部",
-            "重庆项目部",
-            "人事部",
-            "采购部",
-            "设计部",
-            "材料部",
-            "市场部",
-            "开发",
-        ]
-        # 客户等级
-        levels = ["1星", "2星", "3星", "4星", "5星"]
-
         return Customer(
             name=self.faker.company(),  # 使用公司名称
-            type=random.choice(customer_types),  # 客户类型
+            type=random.choice(self.customer_types),  # 客户类型
             code=f"CUS{self.faker.random_number(digits=6)}",  # 生成6位客户编号
-            industry=random.choice(industries),  # 所属行业
+            industry=random.choice(self.industries),  # 所属行业
             phone=self.faker.phone_number(),  # 电话
-            region=random.choice(regions),  # 所属区域
+            region=random.choice(self.regions),  # 所属区域
             mobile=self.faker.phone_number(),  # 手机
-            scale=random.choice(scales),  # 规模
+            scale=random.choice(self.scales),  # 规模
             qq=str(self.faker.random_number(digits=9)),  # 生成QQ号
-            source=random.choice(sources),  # 客户来源
-            department=random.choice(departments),  # 所属部门
-            level=random.choice(levels),  # 客户等级
+            source=random.choice(self.sources),  # 客户来源
+            department=random.choice(self.departments),  # 所属部门
+            level=random.choice(self.levels),  # 客户等级
             responsible_person="张鑫",  # 负责人姓名
             shared_persons=random.sample(
                 self.person_name, k=random.randint(1, 6)
@@ -219,16 +224,13 @@ class TestData:
         生成借款申请数据
         :return: 借款申请数据字典
         """
-        payment_methods = ["现金支付", "银行转账", "支票支付"]
-        repayment_methods = ["等额本息", "等额本金", "先息后本", "一次性还本付息"]
-
         return Loan(
             project_name=random.choice(self.project_names),  # 项目名称
             borrower=random.choice(self.person_name),  # 借款人
             loan_amount=str(round(random.uniform(10000, 1000000))),  # 借款金额
             loan_purpose=self.faker.sentence(),  # 借款事由
-            payment_method=random.choice(payment_methods),  # 支付方式
-            repayment_method=random.choice(repayment_methods),  # 还款方式
+            payment_method=random.choice(self.payment_methods),  # 支付方式
+            repayment_method=random.choice(self.repayment_methods),  # 还款方式
             loan_period=self.faker.date_this_year().strftime("%Y-%m-%d"),  # 借款日期
             borrower_bank=self.faker.bank(),  # 借款人开户银行
             bank_account="".join(
@@ -0,0 +1,45 @@
+"""
+耗时统计工具，计算分位数等统计指标，供负载测试和基准测试共用
+"""
+
+import math
+import statistics
+from typing import Dict, Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    计算分位数，使用线性插值
+    :param values: 数据
+    :param pct: 百分位(0-100)
+    :return: 分位数，数据为空时返回0
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return float(ordered[lower])
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(values: Sequence[float]) -> Dict[str, float]:
+    """
+    汇总耗时数据
+    :param values: 耗时数据
+    :return: 包含count、min、max、mean、median、p90、p95、p99的字典
+    """
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "min": min(values),
+        "max": max(values),
+        "mean": statistics.fmean(values),
+        "median": percentile(values, 50),
+        "p90": percentile(values, 90),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+    }